@@ -12,6 +12,8 @@ from google.cloud import secretmanager
 from google.api_core.client_options import ClientOptions
 
 from dags.dags_facebook_ads import dags_campaign_insights
+from dags._dags_campaign_insights import DAGS_FACEBOOK_THREADS
+from plugins.facebook_ads import internalFacebookAdsClient
 
 COMPANY = os.getenv("COMPANY")
 PROJECT = os.getenv("PROJECT")
@@ -164,13 +166,23 @@ def backfill():
         )        
    
 # Execute DAGS
-    dags_campaign_insights(
+    # one shared connection pool and work registry for the whole backfill then closed once it finishes
+    client = internalFacebookAdsClient(
         access_token=access_token,
-        account_id=account_id,
-        start_date=start_date,
-        end_date=end_date
+        pool_maxsize=DAGS_FACEBOOK_THREADS,
     )
 
+    try:
+        dags_campaign_insights(
+            access_token=access_token,
+            account_id=account_id,
+            start_date=start_date,
+            end_date=end_date,
+            client=client,
+        )
+    finally:
+        client.close()
+
 # Entrypoint
 if __name__ == "__main__":
     try:
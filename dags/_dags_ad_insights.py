@@ -5,25 +5,37 @@ ROOT_FOLDER_LOCATION = Path(__file__).resolve().parents[2]
 sys.path.append(str(ROOT_FOLDER_LOCATION))
 sys.stdout.reconfigure(encoding="utf-8")
 
+from collections.abc import Callable
 from datetime import datetime, timedelta
+from functools import partial
 import logging
 import pandas as pd
-import time
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from etl.extract_ad_insights import extract_ad_insights
+from etl.extract_account_metadata import extract_account_metadata
 from etl.extract_ad_metadata import extract_ad_metadata
+from etl.extract_insights_metadata import extract_insights_metadata
 from etl.extract_ad_creative import extract_ad_creative
 from etl.extract_adset_metadata import extract_adset_metadata
 from etl.extract_campaign_metadata import extract_campaign_metadata
+from etl.aggregate_campaign_insights import aggregate_campaign_insights
 from etl.transform_ad_insights import transform_ad_insights
 from etl.transform_adset_metadata import transform_adset_metadata
+from etl.transform_campaign_insights import transform_campaign_insights
 from etl.transform_campaign_metadata import transform_campaign_metadata
 from etl.load_ad_insights import load_ad_insights
+from etl.load_campaign_insights import load_campaign_insights
 from etl.load_ad_metadata import load_ad_metadata
 from etl.load_ad_creative import load_ad_creative
 from etl.load_adset_metadata import load_adset_metadata
 from etl.load_campaign_metadata import load_campaign_metadata
 
+from plugins.facebook_ads import internalFacebookAdsClient
+from plugins.pipeline import internalPipelineExecutor
+from plugins.task_graph import internalTaskGraph
+
 from dbt.run import dbt_facebook_ads
 
 COMPANY = os.getenv("COMPANY")
@@ -31,6 +43,22 @@ PROJECT = os.getenv("PROJECT")
 DEPARTMENT = os.getenv("DEPARTMENT")
 ACCOUNT = os.getenv("ACCOUNT")
 MODE = os.getenv("MODE")
+METADATA = os.getenv("METADATA", "batch")
+INSIGHTS = os.getenv("INSIGHTS", "daily")
+ENGINE = os.getenv("ENGINE", "pandas")
+LOADER = os.getenv("LOADER", "load_job")
+CAMPAIGN_INSIGHTS = os.getenv("CAMPAIGN_INSIGHTS", "extract")
+NAMES = os.getenv("NAMES", "metadata")
+
+# Facebook Ads task(s) of the graph plus the prefetch stage calling the API beside the extract stage of the insights task
+DAGS_FACEBOOK_TASKS = 3
+DAGS_FACEBOOK_THREADS = DAGS_FACEBOOK_TASKS + 1
+
+# dbt selection(s) of this DAG, including campaign models when campaign insights are derived from ad insights
+DAGS_DBT_SELECTS = [
+    "tag:mart,tag:ad",
+    *(["tag:mart,tag:campaign"] if CAMPAIGN_INSIGHTS == "derive" else []),
+]
 
 def dags_ad_insights(
     *,
@@ -38,7 +66,16 @@ def dags_ad_insights(
     account_id: str,
     start_date: str,
     end_date: str,
+    client: internalFacebookAdsClient | None = None,
+    dbt: bool = True,
 ):
+    # A DAG called without client owns its connection pool and registry then closes them once its graph finishes
+    client_owned = client is None
+    client = client or internalFacebookAdsClient(
+        access_token=access_token,
+        pool_maxsize=DAGS_FACEBOOK_THREADS,
+    )
+
     msg = (
         "🔄 [DAGS] Trigger to update Facebook Ads ad insights with account_id "
         f"{account_id} from "
@@ -48,63 +85,288 @@ def dags_ad_insights(
     print(msg)
     logging.info(msg)
 
+# Task graph for Facebook Ads ad insights
+    DAGS_GRAPH_WORKERS = 4
+    DAGS_GRAPH_ATTEMPTS = 2
+    DAGS_GRAPH_RESOURCES = {
+        "facebook": DAGS_FACEBOOK_TASKS,
+        "bigquery": 1,
+    }
+
+    dags_context = {
+        "access_token": access_token,
+        "account_id": account_id,
+        "start_date": start_date,
+        "end_date": end_date,
+        "client": client,
+    }
+
+    # Adset / campaign metadata only wait for ad metadata when account-level listing already carries them
+    dags_metadata_inputs = (
+        ["ad_insights", "ad_metadata"]
+        if METADATA == "account"
+        else ["ad_insights"]
+    )
+
+    dags_graph = (
+        internalTaskGraph(
+            max_workers=DAGS_GRAPH_WORKERS,
+            resources=DAGS_GRAPH_RESOURCES,
+            backoff=client.governor.backoff,
+        )
+        .task("ad_insights", partial(_etl_ad_insights, **dags_context), resource="facebook")
+        .task("ad_metadata", partial(_etl_ad_metadata, **dags_context), inputs=["ad_insights"], attempts=DAGS_GRAPH_ATTEMPTS, resource="facebook")
+        .task("ad_creative", partial(_etl_ad_creative, **dags_context), inputs=["ad_insights"], attempts=DAGS_GRAPH_ATTEMPTS, resource="facebook")
+        .task("adset_metadata", partial(_etl_adset_metadata, **dags_context), inputs=dags_metadata_inputs, attempts=DAGS_GRAPH_ATTEMPTS, resource="facebook")
+        .task("campaign_metadata", partial(_etl_campaign_metadata, **dags_context), inputs=dags_metadata_inputs, attempts=DAGS_GRAPH_ATTEMPTS, resource="facebook")
+    )
+
+    # Caller running several DAG(s) builds their dbt selection(s) once after all of them finish
+    if dbt:
+        dags_graph.task("dbt", _dbt_ad_insights, inputs=["ad_metadata", "ad_creative", "adset_metadata", "campaign_metadata"], resource="bigquery")
+
+    try:
+        dags_graph.run()
+    finally:
+        if client_owned:
+            client.close()
+
 # ETL for Facebook Ads ad insights
+def _etl_ad_insights(
+    *,
+    access_token: str,
+    account_id: str,
+    start_date: str,
+    end_date: str,
+    client: internalFacebookAdsClient,
+) -> dict | None:
     DAGS_INSIGHTS_ATTEMPTS = 3
-    DAGS_INSIGHTS_COOLDOWN = 60
+    DAGS_INSIGHTS_ASYNC_DAYS = 7
+    DAGS_INSIGHTS_CHUNK_SIZE = 5000
+    DAGS_INSIGHTS_QUEUE_SIZE = 2
+    DAGS_INSIGHTS_PREFETCH_BATCH_SIZE = 50
+    DAGS_INSIGHTS_PREFETCH_CONCURRENCY = 200
 
     dags_start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
     dags_end_date   = datetime.strptime(end_date, "%Y-%m-%d").date()
 
-    total_ad_ids: set[str] = set()
+    # Range mode pulls every month of the range in one query with daily time_increment so transformed chunk(s) are flushed per month
+    dags_window_days = (
+        (dags_end_date - dags_start_date).days + 1
+        if INSIGHTS == "range"
+        else 1
+    )
+
+    dags_windows = []
 
     while dags_start_date <= dags_end_date:
-        dags_split_date = dags_start_date.strftime("%Y-%m-%d")
+        dags_month_end = (dags_start_date.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+        dags_window_end = min(dags_start_date + timedelta(days=dags_window_days - 1), dags_month_end, dags_end_date)
+        dags_windows.append((dags_start_date, dags_window_end))
+        dags_start_date = dags_window_end + timedelta(days=1)
+
+    total_ad_ids: set[str] = set()
+    prefetched_ad_ids: set[str] = set()
+
+    # Adset / campaign metadata read their id(s) from insights row(s) instead of waiting for ad metadata
+    total_adset_ids: set[str] = set()
+    total_campaign_ids: set[str] = set()
+    dfs_prefetched_ad_metadata: list[pd.DataFrame] = []
+
+    # Metadata frame(s) built from insights name column(s) with NAMES=insights
+    dfs_insights_metadata: dict[str, list[pd.DataFrame]] = {}
 
-        for attempt in range(1, DAGS_INSIGHTS_ATTEMPTS + 1):
-            try:
-                
     # Extract
-                msg = (
-                    "🔄 [DAGS] Trigger to extract Facebook Ads ad insights from account_id "
-                    f"{account_id} at "
-                    f"{dags_split_date} for "
-                    f"{attempt} attempt(s)..."
-                )
-                print(msg)
-                logging.info(msg)                
-                
-                insights = extract_ad_insights(
-                    access_token=access_token,
-                    account_id=account_id,
-                    start_date=dags_split_date,
-                    end_date=dags_split_date,
-                )
+    def _extract_insights_stage(windows):
+        for dags_window_start, dags_window_end in windows:
+            dags_split_date = dags_window_start.strftime("%Y-%m-%d")
+            dags_split_end = dags_window_end.strftime("%Y-%m-%d")
 
-                if insights.empty:
+            for attempt in range(1, DAGS_INSIGHTS_ATTEMPTS + 1):
+                try:
                     msg = (
-                        "⚠️ [DAGS] No Facebook Ads ad insights returned from account_id "
-                        f"{account_id} then DAG execution "
-                        f"{dags_split_date} will be skipped."
+                        "🔄 [DAGS] Trigger to extract Facebook Ads ad insights from account_id "
+                        f"{account_id} at "
+                        f"{dags_split_date} for "
+                        f"{attempt} attempt(s)..."
                     )
                     print(msg)
-                    logging.warning(msg)
+                    logging.info(msg)
+
+                    insights_chunks = extract_ad_insights(
+                        access_token=access_token,
+                        account_id=account_id,
+                        start_date=dags_split_date,
+                        end_date=dags_split_end,
+                        async_chunk_days=(
+                            DAGS_INSIGHTS_ASYNC_DAYS
+                            if (dags_window_end - dags_window_start).days + 1 > DAGS_INSIGHTS_ASYNC_DAYS
+                            else None
+                        ),
+                        time_increment=1,
+                        client=client,
+                        engine=ENGINE,
+                        chunk_size=DAGS_INSIGHTS_CHUNK_SIZE,
+                        names=NAMES == "insights",
+                    )
+
+                    for insights in insights_chunks:
+                        yield "chunk", dags_split_date, insights
+
+                    yield "done", dags_split_date, dags_window_end
                     break
 
+                except Exception as e:
+                    retryable = getattr(e, "retryable", False)
+                    msg = (
+                        f"⚠️ [DAGS] Failed to extract Facebook Ads ad insights for {dags_split_date} in "
+                        f"{attempt}/{DAGS_INSIGHTS_ATTEMPTS} attempt(s) due to "
+                        f"{e}."
+                    )
+                    print(msg)
+                    logging.warning(msg)
+
+                    if not retryable:
+                        raise RuntimeError(
+                            f"❌ [DAGS] Failed to extract Facebook Ads ad insights for "
+                            f"{dags_split_date} due to unexpected error then DAG execution will be aborting."
+                        ) from e
+
+                    if attempt == DAGS_INSIGHTS_ATTEMPTS:
+                        raise RuntimeError(
+                            "❌ [DAGS] Failed to extract Facebook Ads ad insights for "
+                            f"{dags_split_date} in "
+                            f"{attempt}/{DAGS_INSIGHTS_ATTEMPTS} attempt(s) due to exceeded attempt limit then DAG execution will be aborting."
+                        ) from e
+
+                    # Transform stage discards chunk(s) of the failed attempt so retried window never loads duplicates
+                    yield "reset", dags_split_date, None
+
+                    client.governor.backoff(
+                        attempt,
+                        f"retrying Facebook Ads API {attempt}/{DAGS_INSIGHTS_ATTEMPTS} attempt(s)",
+                    )
+
+            if dags_window_end < dags_end_date:
+                client.governor.throttle("processing next date of Facebook Ads ad insights")
+
+    # Monthly table direction(s) map to their insights level and load function
+    dags_load_targets: dict[str, tuple[str, Callable[..., None]]] = {}
+
+    def _split_insights_dates(insights):
+        # Arrow engine keeps pa.Table and splits load date(s) with pyarrow.compute
+        if isinstance(insights, pa.Table):
+            dags_load_keys = pc.strftime(insights["date"], format="%Y-%m-%d")
+            return [
+                (dags_load_date, insights.filter(pc.equal(dags_load_keys, dags_load_date)))
+                for dags_load_date in sorted(pc.unique(dags_load_keys).drop_null().to_pylist())
+            ]
+
+        return [
+            (dags_load_date, daily_insights.reset_index(drop=True))
+            for dags_load_date, daily_insights in insights.groupby(
+                insights["date"].dt.strftime("%Y-%m-%d")
+            )
+        ]
+
     # Transform
-                msg = (
-                    "🔄 [DAGS] Trigger to transform Facebook Ads ad insights from "
-                    f"{account_id} with "
-                    f"{dags_split_date} for "
-                    f"{len(insights)} row(s)..."
-                )
-                print(msg)
-                logging.info(msg)                
+    def _transform_insights_stage(events):
+        dags_window_buffers: dict[str, list[pd.DataFrame | pa.Table]] = {}
+        dags_window_buffer_dates: dict[str, set[str]] = {}
+        dags_window_ad_ids: set[str] = set()
+        dags_window_campaign_partials: list[pd.DataFrame | pa.Table] = []
+        dags_insights_rows = 0
+
+        for dags_event, dags_split_date, insights in events:
+            if dags_event in {"reset", "done"}:
+                if dags_event == "done":
+                    if not dags_insights_rows:
+                        msg = (
+                            "⚠️ [DAGS] No Facebook Ads ad insights returned from account_id "
+                            f"{account_id} then DAG execution "
+                            f"{dags_split_date} will be skipped."
+                        )
+                        print(msg)
+                        logging.warning(msg)
+
+                    # Partial campaign row(s) of every chunk are aggregated again once the whole window landed
+                    if dags_window_campaign_partials:
+                        campaign_insights = aggregate_campaign_insights(
+                            pa.concat_tables(dags_window_campaign_partials, promote_options="default")
+                            if isinstance(dags_window_campaign_partials[0], pa.Table)
+                            else pd.concat(dags_window_campaign_partials, ignore_index=True)
+                        )
+
+                        msg = (
+                            "🔄 [DAGS] Trigger to transform Facebook Ads campaign insights derived from ad insights of "
+                            f"{account_id} with "
+                            f"{dags_split_date} for "
+                            f"{len(campaign_insights)} row(s)..."
+                        )
+                        print(msg)
+                        logging.info(msg)
+
+                        campaign_insights = transform_campaign_insights(campaign_insights, engine=ENGINE)
+
+                        for dags_load_date, daily_insights in _split_insights_dates(campaign_insights):
+                            year  = pd.to_datetime(dags_load_date).year
+                            month = pd.to_datetime(dags_load_date).month
+
+                            _campaign_insights_direction = (
+                                f"{PROJECT}."
+                                f"{COMPANY}_dataset_facebook_api_raw."
+                                f"{COMPANY}_table_facebook_{DEPARTMENT}_{ACCOUNT}_campaign_m{month:02d}{year}"
+                            )
+
+                            dags_load_targets[_campaign_insights_direction] = ("campaign", load_campaign_insights)
+                            dags_window_buffers.setdefault(_campaign_insights_direction, []).append(daily_insights)
+                            dags_window_buffer_dates.setdefault(_campaign_insights_direction, set()).add(dags_load_date)
+
+                    yield insights, dags_window_buffers, dags_window_buffer_dates, dags_window_ad_ids
+
+                dags_window_buffers = {}
+                dags_window_buffer_dates = {}
+                dags_window_ad_ids = set()
+                dags_window_campaign_partials = []
+                dags_insights_rows = 0
+                continue
+
+            msg = (
+                "🔄 [DAGS] Trigger to transform Facebook Ads ad insights from "
+                f"{account_id} with "
+                f"{dags_split_date} for "
+                f"{len(insights)} row(s)..."
+            )
+            print(msg)
+            logging.info(msg)
 
-                insights = transform_ad_insights(insights)
+            # Name column(s) are split into metadata frame(s) before insights are aggregated or transformed
+            if NAMES == "insights":
+                insights, chunk_metadata = extract_insights_metadata(insights)
+                for entity, df_entity_metadata in chunk_metadata.items():
+                    dfs_insights_metadata.setdefault(entity, []).append(df_entity_metadata)
 
-    # Load
-                year  = pd.to_datetime(insights["date"].iloc[0]).year
-                month = pd.to_datetime(insights["date"].iloc[0]).month
+            # Campaign insights are aggregated from raw ad row(s) before transform_ad_insights parses actions in place
+            if CAMPAIGN_INSIGHTS == "derive":
+                dags_window_campaign_partials.append(aggregate_campaign_insights(insights, by_goal=True))
+
+            insights = transform_ad_insights(insights, engine=ENGINE)
+            dags_insights_rows += len(insights)
+
+            if isinstance(insights, pa.Table):
+                daily_ad_ids = set(pc.unique(insights["ad_id"]).drop_null().to_pylist())
+                total_adset_ids.update(pc.unique(insights["adset_id"]).drop_null().to_pylist())
+                total_campaign_ids.update(pc.unique(insights["campaign_id"]).drop_null().to_pylist())
+            else:
+                daily_ad_ids = set(insights["ad_id"].dropna().unique())
+                total_adset_ids.update(insights["adset_id"].dropna().unique())
+                total_campaign_ids.update(insights["campaign_id"].dropna().unique())
+
+            dags_window_ad_ids.update(daily_ad_ids)
+
+            for dags_load_date, daily_insights in _split_insights_dates(insights):
+                year  = pd.to_datetime(dags_load_date).year
+                month = pd.to_datetime(dags_load_date).month
 
                 _ad_insights_direction = (
                     f"{PROJECT}."
@@ -112,75 +374,149 @@ def dags_ad_insights(
                     f"{COMPANY}_table_facebook_{DEPARTMENT}_{ACCOUNT}_ad_m{month:02d}{year}"
                 )
 
-                msg = (
-                    "🔄 [DAGS] Trigger to load Facebook Ads ad insights from account_id "
-                    f"{account_id} for "
-                    f"{dags_split_date} to direction "
-                    f"{_ad_insights_direction}..."
-                )
-                print(msg)
-                logging.info(msg)
+                dags_load_targets[_ad_insights_direction] = ("ad", load_ad_insights)
+                dags_window_buffers.setdefault(_ad_insights_direction, []).append(daily_insights)
+                dags_window_buffer_dates.setdefault(_ad_insights_direction, set()).add(dags_load_date)
 
-                daily_ad_ids = set(insights["ad_id"].dropna().unique())
-                total_ad_ids.update(daily_ad_ids)
+    # Load
+    # Staging table(s) and pending stream(s) belong to this run so a failed run never leaves them to another run's MERGE
+    dags_load_staging: dict[str, dict] = {}
 
-                load_ad_insights(
-                    df=insights,
-                    direction=_ad_insights_direction,
-                )
+    def _load_insights_stage(windows):
+        # Latest window of every monthly table is held so the closing load always has row(s) to merge staged chunk(s) with
+        dags_load_held: dict[str, tuple[list[pd.DataFrame | pa.Table], set[str]]] = {}
+        dags_load_staged_dates: dict[str, set[str]] = {}
 
-                break
+        for dags_window_end, dags_window_buffers, dags_window_buffer_dates, dags_window_ad_ids in windows:
 
-            except Exception as e:
-                retryable = getattr(e, "retryable", False)
-                msg = (
-                    f"⚠️ [DAGS] Failed to extract Facebook Ads ad insights for {dags_split_date} in "
-                    f"{attempt}/{DAGS_INSIGHTS_ATTEMPTS} attempt(s) due to "
-                    f"{e}."
+            # Newly seen ad_id(s) are handed to metadata stage before monthly load blocks on job result
+            new_ad_ids = dags_window_ad_ids - total_ad_ids
+            total_ad_ids.update(dags_window_ad_ids)
+
+            if new_ad_ids:
+                yield new_ad_ids
+
+            # Previously held window is appended to the pending stream of its month without a load job so memory stays bounded by one window (one day, or one month with INSIGHTS=range)
+            for _insights_direction, dags_window_frames in dags_window_buffers.items():
+                if _insights_direction in dags_load_held:
+                    dags_held_frames, dags_held_dates = dags_load_held.pop(_insights_direction)
+                    _load_insights_frames(_insights_direction, dags_held_frames, dags_held_dates, "stage")
+                    dags_load_staged_dates.setdefault(_insights_direction, set()).update(dags_held_dates)
+
+                dags_load_held[_insights_direction] = (
+                    dags_window_frames,
+                    set(dags_window_buffer_dates[_insights_direction]),
                 )
-                print(msg)
-                logging.warning(msg)
 
-                if not retryable:
-                    raise RuntimeError(
-                        f"❌ [DAGS] Failed to extract Facebook Ads ad insights for "
-                        f"{dags_split_date} due to unexpected error then DAG execution will be aborting."
-                    ) from e
-
-                if attempt == DAGS_INSIGHTS_ATTEMPTS:
-                    raise RuntimeError(
-                        "❌ [DAGS] Failed to extract Facebook Ads ad insights for "
-                        f"{dags_split_date} in "
-                        f"{attempt}/{DAGS_INSIGHTS_ATTEMPTS} attempt(s) due to exceeded attempt limit then DAG execution will be aborting."
-                    ) from e
-
-                wait_to_retry = 60 + (attempt - 1) * 30
-                
-                msg = (
-                    "🔄 [DAGS] Waiting "
-                    f"{wait_to_retry} second(s) before retrying Facebook Ads API "
-                    f"{attempt}/{DAGS_INSIGHTS_ATTEMPTS} attempt(s)..."
+            # Monthly table(s) no following window can append to are closed with one MERGE of every staged chunk
+            dags_next_date = dags_window_end + timedelta(days=1)
+            dags_next_directions = (
+                {
+                    f"{PROJECT}."
+                    f"{COMPANY}_dataset_facebook_api_raw."
+                    f"{COMPANY}_table_facebook_{DEPARTMENT}_{ACCOUNT}_{level}_m{dags_next_date.month:02d}{dags_next_date.year}"
+                    for level in ["ad", "campaign"]
+                }
+                if dags_next_date <= dags_end_date
+                else set()
+            )
+
+            for _insights_direction in [
+                direction for direction in dags_load_held
+                if direction not in dags_next_directions
+            ]:
+                dags_held_frames, dags_held_dates = dags_load_held.pop(_insights_direction)
+                dags_load_dates = dags_load_staged_dates.pop(_insights_direction, set()) | dags_held_dates
+
+                # Single day overwrites its partition while multiple day(s) share one MERGE of the staging table
+                _load_insights_frames(
+                    _insights_direction,
+                    dags_held_frames,
+                    dags_load_dates,
+                    "replace_partition" if len(dags_load_dates) == 1 else "upsert_merge",
                 )
-                print(msg)
-                logging.warning(msg)
 
-                time.sleep(wait_to_retry)
+    def _load_insights_frames(direction, frames, dates, mode):
+        dags_load_level, dags_load_function = dags_load_targets[direction]
+        dags_load_dates = sorted(dates)
+
+        insights = (
+            pa.concat_tables(frames, promote_options="default")
+            if isinstance(frames[0], pa.Table)
+            else pd.concat(frames, ignore_index=True)
+        )
+
+        msg = (
+            f"🔄 [DAGS] Trigger to {'stage' if mode == 'stage' else 'load'} Facebook Ads {dags_load_level} insights from account_id "
+            f"{account_id} for "
+            f"{len(dags_load_dates)} date(s) from "
+            f"{dags_load_dates[0]} to "
+            f"{dags_load_dates[-1]} to direction "
+            f"{direction}..."
+        )
+        print(msg)
+        logging.info(msg)
+
+        dags_load_function(
+            df=insights,
+            direction=direction,
+            mode=mode,
+            backend=LOADER,
+            staging=dags_load_staging,
+        )
+
+    # Prefetch metadata
+    def _prefetch_metadata_stage(batches):
+        for new_ad_ids in batches:
+
+            # Account-level listing covers every ad_id at once after insights
+            if METADATA == "account":
+                continue
 
-        dags_start_date += timedelta(days=1)
-        
-        if dags_start_date <= dags_end_date:
             msg = (
-                "🔄 [DAGS] Waiting "
-                f"{DAGS_INSIGHTS_COOLDOWN} second(s) cooldown before processing next date of Facebook Ads ad insights..."
+                "🔄 [DAGS] Trigger to prefetch Facebook Ads ad metadata for "
+                f"{len(new_ad_ids)} newly seen ad_id(s)..."
             )
             print(msg)
             logging.info(msg)
 
-            time.sleep(DAGS_INSIGHTS_COOLDOWN)
+            # Prefetch is best-effort then failed ad_id(s) are retried by ad metadata stage
+            try:
+                df_ad_metadata = extract_ad_metadata(
+                    access_token=access_token,
+                    account_id=account_id,
+                    ad_ids=list(new_ad_ids),
+                    batch_size=DAGS_INSIGHTS_PREFETCH_BATCH_SIZE,
+                    client=client,
+                    concurrency=DAGS_INSIGHTS_PREFETCH_CONCURRENCY if METADATA == "async" else None,
+                )
+            except Exception as e:
+                msg = (
+                    "⚠️ [DAGS] Failed to prefetch Facebook Ads ad metadata for "
+                    f"{len(new_ad_ids)} ad_id(s) due to "
+                    f"{e} then ad metadata stage will retry them."
+                )
+                print(msg)
+                logging.warning(msg)
+                continue
+
+            if not df_ad_metadata.empty:
+                dfs_prefetched_ad_metadata.append(df_ad_metadata)
+                prefetched_ad_ids.update(
+                    set(df_ad_metadata["ad_id"].dropna())
+                    - set(getattr(df_ad_metadata, "failed_ad_ids", []))
+                )
+
+    internalPipelineExecutor(
+        stages=[
+            ("extract", _extract_insights_stage),
+            ("transform", _transform_insights_stage),
+            ("load", _load_insights_stage),
+            ("metadata", _prefetch_metadata_stage),
+        ],
+        queue_size=DAGS_INSIGHTS_QUEUE_SIZE,
+    ).run(dags_windows)
 
-# ETL for Facebook Ads ad metadata
-    DAGS_AD_ATTEMPTS = 3
-   
     if not total_ad_ids:
         msg = (
             "⚠️ [DAGS] No Facebook Ads ad_id appended for account_id "
@@ -190,11 +526,65 @@ def dags_ad_insights(
         )
         print(msg)
         logging.warning(msg)
-        return
+        return None
+
+    return {
+        "ad_ids": total_ad_ids,
+        "adset_ids": total_adset_ids,
+        "campaign_ids": total_campaign_ids,
+        "prefetched_ad_ids": prefetched_ad_ids,
+        "dfs_prefetched_ad_metadata": dfs_prefetched_ad_metadata,
+        "insights_metadata": {
+            entity: (
+                pd.concat(dfs_entity_metadata, ignore_index=True)
+                .drop_duplicates(subset=[f"{entity}_id"], keep="last")
+                .reset_index(drop=True)
+            )
+            for entity, dfs_entity_metadata in dfs_insights_metadata.items()
+        },
+    }
+
+# ETL for Facebook Ads ad metadata
+def _etl_ad_metadata(
+    *,
+    access_token: str,
+    account_id: str,
+    start_date: str,
+    end_date: str,
+    client: internalFacebookAdsClient,
+    ad_insights: dict,
+) -> dict[str, pd.DataFrame]:
+    DAGS_AD_ATTEMPTS = 3
+    DAGS_AD_BATCH_SIZE = 50
+    DAGS_AD_CONCURRENCY = 200
+   
+    total_ad_ids = ad_insights["ad_ids"]
 
     # Extract
-    remaining_ad_ids = list(total_ad_ids)
-    dfs_ad_metadata = []
+    # Ad_id(s) prefetched while insights were still loading only need retry for their failure(s)
+    remaining_ad_ids = list(total_ad_ids - ad_insights["prefetched_ad_ids"])
+    dfs_ad_metadata = list(ad_insights["dfs_prefetched_ad_metadata"])
+    account_metadata: dict[str, pd.DataFrame] = {}
+
+    if METADATA == "account":
+        msg = (
+            "🔄 [DAGS] Trigger to list Facebook Ads ad, adset and campaign metadata for "
+            f"{len(remaining_ad_ids)} ad_id(s) with account-level listing..."
+        )
+        print(msg)
+        logging.info(msg)
+
+        account_metadata = extract_account_metadata(
+            access_token=access_token,
+            account_id=account_id,
+            ad_ids=remaining_ad_ids,
+            client=client,
+        )
+
+        if not account_metadata["ad"].empty:
+            dfs_ad_metadata.append(account_metadata["ad"])
+
+        remaining_ad_ids = getattr(account_metadata["ad"], "failed_ad_ids", remaining_ad_ids)
 
     for attempt in range(1, DAGS_AD_ATTEMPTS + 1):
         msg = (
@@ -209,6 +599,9 @@ def dags_ad_insights(
             access_token=access_token,
             account_id=account_id,
             ad_ids=remaining_ad_ids,
+            batch_size=DAGS_AD_BATCH_SIZE,
+            client=client,
+            concurrency=DAGS_AD_CONCURRENCY if METADATA == "async" else None,
         )
 
         if not df_ad_metadata.empty:
@@ -246,20 +639,20 @@ def dags_ad_insights(
 
         remaining_ad_ids = failed_ad_ids
 
-        wait_to_retry = 60 + (attempt - 1) * 30
-        
-        msg = (
-            "🔄 [DAGS] Waiting "
-            f"{wait_to_retry} second(s) before retrying Facebook Ads API "
-                f"{attempt}/{DAGS_AD_ATTEMPTS} attempt(s)..."
-            )
-        print(msg)
-        logging.info(msg)
-        
-        time.sleep(wait_to_retry)
+        client.governor.backoff(
+            attempt,
+            f"retrying Facebook Ads API {attempt}/{DAGS_AD_ATTEMPTS} attempt(s)",
+        )
 
     df_ad_metadatas = pd.concat(dfs_ad_metadata, ignore_index=True)
 
+    # Name(s) from insights row(s) cover ad_id(s) whose per-object call failed
+    df_insights_ads = ad_insights["insights_metadata"].get("ad")
+    if df_insights_ads is not None:
+        df_ad_metadatas["ad_name"] = df_ad_metadatas["ad_name"].fillna(
+            df_ad_metadatas["ad_id"].map(df_insights_ads.set_index("ad_id")["ad_name"])
+        )
+
     # Transform
 
         # Nothing to transform with ad metadata
@@ -282,22 +675,27 @@ def dags_ad_insights(
     load_ad_metadata(
         df=df_ad_metadatas,
         direction=_ad_metadata_direction,
+        backend=LOADER,
     )
 
+    # Account-level listing also carries adset / campaign metadata for the following task(s)
+    return account_metadata
+
 # ETL for Facebook Ads ad creative
+def _etl_ad_creative(
+    *,
+    access_token: str,
+    account_id: str,
+    start_date: str,
+    end_date: str,
+    client: internalFacebookAdsClient,
+    ad_insights: dict,
+) -> int:
     DAGS_CREATIVE_ATTEMPTS = 3
+    DAGS_CREATIVE_BATCH_SIZE = 50
+    DAGS_CREATIVE_CONCURRENCY = 200
     
-    if not total_ad_ids:
-        msg = (
-            "⚠️ [DAGS] No Facebook Ads ad_id appended for account_id "
-            f"{account_id} from "
-            f"{start_date} to "
-            f"{end_date} then DAG execution will be suspended."
-        )
-        print(msg)
-        logging.warning(msg)
-        return
-        
+    total_ad_ids = ad_insights["ad_ids"]
     # Extract
     remaining_ad_ids = list(total_ad_ids)
     dfs_ad_creative = []
@@ -315,6 +713,9 @@ def dags_ad_insights(
             access_token=access_token,
             account_id=account_id,
             ad_ids=remaining_ad_ids,
+            batch_size=DAGS_CREATIVE_BATCH_SIZE,
+            client=client,
+            concurrency=DAGS_CREATIVE_CONCURRENCY if METADATA == "async" else None,
         )
 
         if not df_ad_creative.empty:
@@ -352,17 +753,10 @@ def dags_ad_insights(
 
         remaining_ad_ids = failed_ad_ids
 
-        wait_to_retry = 60 + (attempt - 1) * 30
-        
-        msg = (
-            "🔄 [DAGS] Waiting "
-            f"{wait_to_retry} second(s) before retrying Facebook Ads API "
-                f"{attempt}/{DAGS_CREATIVE_ATTEMPTS} attempt(s)..."
-            )
-        print(msg)
-        logging.info(msg)
-        
-        time.sleep(wait_to_retry)
+        client.governor.backoff(
+            attempt,
+            f"retrying Facebook Ads API {attempt}/{DAGS_CREATIVE_ATTEMPTS} attempt(s)",
+        )
 
     df_ad_creatives = pd.concat(dfs_ad_creative, ignore_index=True)
 
@@ -388,12 +782,28 @@ def dags_ad_insights(
     load_ad_creative(
         df=df_ad_creatives,
         direction=_ad_creative_direction,
+        backend=LOADER,
     )
 
+    return len(df_ad_creatives)
+
 # ETL for Facebook Ads adset metadata
+def _etl_adset_metadata(
+    *,
+    access_token: str,
+    account_id: str,
+    start_date: str,
+    end_date: str,
+    client: internalFacebookAdsClient,
+    ad_insights: dict,
+    ad_metadata: dict[str, pd.DataFrame] | None = None,
+) -> int | None:
     DAGS_ADSET_ATTEMPTS = 3
+    DAGS_ADSET_BATCH_SIZE = 50
+    DAGS_ADSET_CONCURRENCY = 200
 
-    total_adset_ids = set(df_ad_metadatas["adset_id"].dropna().unique())
+    total_adset_ids = ad_insights["adset_ids"]
+    account_metadata = ad_metadata or {}
 
     if not total_adset_ids:
         msg = (
@@ -404,11 +814,26 @@ def dags_ad_insights(
         )
         print(msg)
         logging.warning(msg)
-        return
+        return None
     
     # Extract
     remaining_adset_ids = list(total_adset_ids)
     dfs_adset_metadata = []
+
+    df_listed_adsets = account_metadata.get("adset")
+    if df_listed_adsets is not None and not df_listed_adsets.empty:
+        dfs_adset_metadata.append(df_listed_adsets)
+        listed_adset_ids = set(df_listed_adsets["adset_id"].dropna())
+        remaining_adset_ids = [i for i in remaining_adset_ids if i not in listed_adset_ids]
+
+    # Adset metadata is fully carried by insights row(s) so only uncovered adset_id(s) need per-object call(s)
+    df_insights_adsets = ad_insights["insights_metadata"].get("adset")
+    if df_insights_adsets is not None:
+        df_insights_adsets = df_insights_adsets[df_insights_adsets["adset_id"].isin(remaining_adset_ids)]
+        if not df_insights_adsets.empty:
+            dfs_adset_metadata.append(df_insights_adsets)
+            insights_adset_ids = set(df_insights_adsets["adset_id"])
+            remaining_adset_ids = [i for i in remaining_adset_ids if i not in insights_adset_ids]
     
     for attempt in range(1, DAGS_ADSET_ATTEMPTS + 1):
         msg = (
@@ -423,6 +848,9 @@ def dags_ad_insights(
             access_token=access_token,
             account_id=account_id,
             adset_ids=remaining_adset_ids,
+            batch_size=DAGS_ADSET_BATCH_SIZE,
+            client=client,
+            concurrency=DAGS_ADSET_CONCURRENCY if METADATA == "async" else None,
         )
 
         if not df_adset_metadata.empty:
@@ -460,17 +888,10 @@ def dags_ad_insights(
 
         remaining_adset_ids = failed_adset_ids
 
-        wait_to_retry = 60 + (attempt - 1) * 30
-        
-        msg = (
-            "🔄 [DAGS] Waiting "
-            f"{wait_to_retry} second(s) before retrying Facebook Ads API "
-                f"{attempt}/{DAGS_AD_ATTEMPTS} attempt(s)..."
-            )
-        print(msg)
-        logging.info(msg)
-        
-        time.sleep(wait_to_retry)
+        client.governor.backoff(
+            attempt,
+            f"retrying Facebook Ads API {attempt}/{DAGS_ADSET_ATTEMPTS} attempt(s)",
+        )
 
     df_adset_metadatas = pd.concat(dfs_adset_metadata, ignore_index=True)
 
@@ -482,7 +903,7 @@ def dags_ad_insights(
     print(msg)
     logging.info(msg)
 
-    df_adset_metadatas = transform_adset_metadata(df_adset_metadatas)
+    df_adset_metadatas = transform_adset_metadata(df_adset_metadatas, engine=ENGINE)
 
     # Load
     _adset_metadata_direction = (
@@ -501,12 +922,28 @@ def dags_ad_insights(
     load_adset_metadata(
         df=df_adset_metadatas,
         direction=_adset_metadata_direction,
+        backend=LOADER,
     )
 
+    return len(df_adset_metadatas)
+
 # ETL for Facebook Ads campaign metadata
+def _etl_campaign_metadata(
+    *,
+    access_token: str,
+    account_id: str,
+    start_date: str,
+    end_date: str,
+    client: internalFacebookAdsClient,
+    ad_insights: dict,
+    ad_metadata: dict[str, pd.DataFrame] | None = None,
+) -> int | None:
     DAGS_CAMPAIGN_ATTEMPTS = 3
+    DAGS_CAMPAIGN_BATCH_SIZE = 50
+    DAGS_CAMPAIGN_CONCURRENCY = 200
 
-    total_campaign_ids = set(df_ad_metadatas["campaign_id"].dropna().unique())
+    total_campaign_ids = ad_insights["campaign_ids"]
+    account_metadata = ad_metadata or {}
 
     if not total_campaign_ids:
         msg = (
@@ -517,111 +954,140 @@ def dags_ad_insights(
         )
         print(msg)
         logging.warning(msg)
-        return
-
-    # Extract
-    remaining_campaign_ids = list(total_campaign_ids)
-    dfs_campaign_metadata = []
-    
-    for attempt in range(1, DAGS_CAMPAIGN_ATTEMPTS + 1):
-        msg = (
-            "🔄 [DAGS] Trigger to extract Facebook Ads campaign metadata for "
-            f"{len(remaining_campaign_ids)} campaign_id(s) in "
-            f"{attempt}/{DAGS_CAMPAIGN_ATTEMPTS} attempt(s)..."
-        )
-        print(msg)
-        logging.info(msg)
-    
-        df_campaign_metadata = extract_campaign_metadata(
-            access_token=access_token,
-            account_id=account_id,
-            campaign_ids=remaining_campaign_ids,
-        )
+        return None
 
-        if not df_campaign_metadata.empty:
-            dfs_campaign_metadata.append(df_campaign_metadata)
-
-        failed_campaign_ids = getattr(df_campaign_metadata, "failed_campaign_ids", [])
-        retryable = getattr(df_campaign_metadata, "retryable", False)
+    _campaign_metadata_direction = (
+        f"{PROJECT}."
+        f"{COMPANY}_dataset_facebook_api_raw."
+        f"{COMPANY}_table_facebook_{DEPARTMENT}_{ACCOUNT}_campaign_metadata"
+    )
 
-        if not failed_campaign_ids:
+    # Campaign DAG and ad DAG claim campaign_id(s) of the same table, so every campaign_id is upserted once per run
+    def _campaign_metadata_unit(new_campaign_ids: list[str]) -> int:
+        # Extract
+        # Campaign_id(s) prefetched by campaign DAG are handed back by client.registry
+        remaining_campaign_ids = list(new_campaign_ids)
+        dfs_campaign_metadata = []
+
+        df_listed_campaigns = account_metadata.get("campaign")
+        if df_listed_campaigns is not None and not df_listed_campaigns.empty:
+            df_listed_campaigns = df_listed_campaigns[df_listed_campaigns["campaign_id"].isin(remaining_campaign_ids)]
+            dfs_campaign_metadata.append(df_listed_campaigns)
+            listed_campaign_ids = set(df_listed_campaigns["campaign_id"].dropna())
+            remaining_campaign_ids = [i for i in remaining_campaign_ids if i not in listed_campaign_ids]
+
+        for attempt in range(1, DAGS_CAMPAIGN_ATTEMPTS + 1):
             msg = (
-                "✅ [DAGS] Successfully triggered to extract Facebook campaign metadata with "
-                f"{len(set(pd.concat(dfs_campaign_metadata)["campaign_id"].dropna()))}/{len(remaining_campaign_ids)} row(s)."
+                "🔄 [DAGS] Trigger to extract Facebook Ads campaign metadata for "
+                f"{len(remaining_campaign_ids)} campaign_id(s) in "
+                f"{attempt}/{DAGS_CAMPAIGN_ATTEMPTS} attempt(s)..."
             )
             print(msg)
             logging.info(msg)
-            break
 
-        if not retryable:
-            msg = (
-                "❌ [DAGS] Failed to extract Facebook Ads campaign metadata for "
-                f"{len(remaining_campaign_ids)} campaign_id(s) due to unexpected non-retryable error then DAG execution will be suspended."
+            df_campaign_metadata = extract_campaign_metadata(
+                access_token=access_token,
+                account_id=account_id,
+                campaign_ids=remaining_campaign_ids,
+                batch_size=DAGS_CAMPAIGN_BATCH_SIZE,
+                client=client,
+                concurrency=DAGS_CAMPAIGN_CONCURRENCY if METADATA == "async" else None,
             )
-            print(msg)
-            logging.warning(msg)
-            break
 
-        if attempt == DAGS_CAMPAIGN_ATTEMPTS:
-            msg = (
-                "❌ [DAGS] Failed to extract Facebook Ads campaign metadata for "
-                f"{len(remaining_campaign_ids)} campaign_id(s) due to exceeded attempt limit then DAG execution will be suspended."
+            if not df_campaign_metadata.empty:
+                dfs_campaign_metadata.append(df_campaign_metadata)
+
+            failed_campaign_ids = getattr(df_campaign_metadata, "failed_campaign_ids", [])
+            retryable = getattr(df_campaign_metadata, "retryable", False)
+
+            if not failed_campaign_ids:
+                msg = (
+                    "✅ [DAGS] Successfully triggered to extract Facebook campaign metadata with "
+                    f"{len(set(pd.concat(dfs_campaign_metadata)["campaign_id"].dropna()))}/{len(remaining_campaign_ids)} row(s)."
+                )
+                print(msg)
+                logging.info(msg)
+                break
+
+            if not retryable:
+                msg = (
+                    "❌ [DAGS] Failed to extract Facebook Ads campaign metadata for "
+                    f"{len(remaining_campaign_ids)} campaign_id(s) due to unexpected non-retryable error then DAG execution will be suspended."
+                )
+                print(msg)
+                logging.warning(msg)
+                break
+
+            if attempt == DAGS_CAMPAIGN_ATTEMPTS:
+                msg = (
+                    "❌ [DAGS] Failed to extract Facebook Ads campaign metadata for "
+                    f"{len(remaining_campaign_ids)} campaign_id(s) due to exceeded attempt limit then DAG execution will be suspended."
+                )
+                print(msg)
+                logging.warning(msg)
+                break
+
+            remaining_campaign_ids = failed_campaign_ids
+
+            client.governor.backoff(
+                attempt,
+                f"retrying Facebook Ads API {attempt}/{DAGS_CAMPAIGN_ATTEMPTS} attempt(s)",
             )
-            print(msg)
-            logging.warning(msg)
-            break
 
-        remaining_campaign_ids = failed_campaign_ids
+        df_campaign_metadatas = pd.concat(dfs_campaign_metadata, ignore_index=True)
 
-        wait_to_retry = 60 + (attempt - 1) * 30
-        
-        msg = (
-            "🔄 [DAGS] Waiting "
-            f"{wait_to_retry} second(s) before retrying Facebook Ads API "
-                f"{attempt}/{DAGS_CAMPAIGN_ATTEMPTS} attempt(s)..."
+        # Name(s) from insights row(s) cover campaign_id(s) whose per-object call failed
+        df_insights_campaigns = ad_insights["insights_metadata"].get("campaign")
+        if df_insights_campaigns is not None:
+            df_campaign_metadatas["campaign_name"] = df_campaign_metadatas["campaign_name"].fillna(
+                df_campaign_metadatas["campaign_id"].map(df_insights_campaigns.set_index("campaign_id")["campaign_name"])
             )
+
+        # Transform
+        msg = (
+            "🔄 [DAGS] Trigger to transform Facebook Ads campaign metadata for "
+            f"{len(df_campaign_metadatas)} row(s)..."
+        )
         print(msg)
         logging.info(msg)
-        
-        time.sleep(wait_to_retry)
 
-    df_campaign_metadatas = pd.concat(dfs_campaign_metadata, ignore_index=True)
+        df_campaign_metadatas = transform_campaign_metadata(df_campaign_metadatas, engine=ENGINE)
 
-    # Transform
-    msg = (
-        "🔄 [DAGS] Trigger to transform Facebook Ads campaign metadata for "
-        f"{len(df_campaign_metadatas)} row(s)..."
-    )
-    print(msg)
-    logging.info(msg)
+        # Load
+        msg = (
+            "🔄 [DAGS] Trigger to load Facebook Ads campaign metadata for "
+            f"{len(df_campaign_metadatas)} row(s) to"
+            f"{_campaign_metadata_direction}..."
 
-    df_campaign_metadatas = transform_campaign_metadata(df_campaign_metadatas)
+        )
 
-    # Load
-    _campaign_metadata_direction = (
-        f"{PROJECT}."
-        f"{COMPANY}_dataset_facebook_api_raw."
-        f"{COMPANY}_table_facebook_{DEPARTMENT}_{ACCOUNT}_campaign_metadata"
-    )  
+        # MERGE(s) of ad DAG and campaign DAG into the same table run one at a time
+        with client.registry.lock(_campaign_metadata_direction):
+            load_campaign_metadata(
+                df=df_campaign_metadatas,
+                direction=_campaign_metadata_direction,
+                backend=LOADER,
+            )
 
-    msg = (
-        "🔄 [DAGS] Trigger to load Facebook Ads campaign metadata for "
-        f"{len(df_campaign_metadatas)} row(s) to"
-        f"{_campaign_metadata_direction}..."
-        
-    )
+        return len(df_campaign_metadatas)
 
-    load_campaign_metadata(
-        df=df_campaign_metadatas,
-        direction=_campaign_metadata_direction,
+    return sum(
+        client.registry.run_many(
+            ("load_campaign_metadata", _campaign_metadata_direction),
+            total_campaign_ids,
+            _campaign_metadata_unit,
+        )
     )
 
 # Materialization with dbt
+def _dbt_ad_insights(
+    **task_outputs: object,
+) -> None:
     msg = "🔄 [DAGS] Trigger to materialize Facebook Ads ad insights with dbt..."
     print(msg)
     logging.info(msg)
 
     dbt_facebook_ads(
         google_cloud_project=PROJECT,
-        select="tag:mart,tag:ad"
-    )
\ No newline at end of file
+        select=" ".join(DAGS_DBT_SELECTS),
+    )
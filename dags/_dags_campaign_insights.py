@@ -6,17 +6,25 @@ sys.path.append(str(ROOT_FOLDER_LOCATION))
 sys.stdout.reconfigure(encoding="utf-8")
 
 from datetime import datetime, timedelta
+from functools import partial
 import logging
 import pandas as pd
-import time
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from etl.extract_campaign_insights import extract_campaign_insights
+from etl.extract_account_metadata import extract_account_metadata
 from etl.extract_campaign_metadata import extract_campaign_metadata
+from etl.extract_insights_metadata import extract_insights_metadata
 from etl.transform_campaign_insights import transform_campaign_insights
 from etl.transform_campaign_metadata import transform_campaign_metadata
 from etl.load_campaign_insights import load_campaign_insights
 from etl.load_campaign_metadata import load_campaign_metadata
 
+from plugins.facebook_ads import internalFacebookAdsClient
+from plugins.pipeline import internalPipelineExecutor
+from plugins.task_graph import internalTaskGraph
+
 from dbt.run import dbt_facebook_ads
 
 COMPANY = os.getenv("COMPANY")
@@ -24,6 +32,20 @@ PROJECT = os.getenv("PROJECT")
 DEPARTMENT = os.getenv("DEPARTMENT")
 ACCOUNT = os.getenv("ACCOUNT")
 MODE = os.getenv("MODE")
+METADATA = os.getenv("METADATA", "batch")
+INSIGHTS = os.getenv("INSIGHTS", "daily")
+ENGINE = os.getenv("ENGINE", "pandas")
+LOADER = os.getenv("LOADER", "load_job")
+NAMES = os.getenv("NAMES", "metadata")
+
+# Facebook Ads task(s) of the graph plus the prefetch stage calling the API beside the extract stage of the insights task
+DAGS_FACEBOOK_TASKS = 1
+DAGS_FACEBOOK_THREADS = DAGS_FACEBOOK_TASKS + 1
+
+# dbt selection(s) of this DAG
+DAGS_DBT_SELECTS = [
+    "tag:mart,tag:campaign",
+]
 
 def dags_campaign_insights(
     *,
@@ -31,7 +53,16 @@ def dags_campaign_insights(
     account_id: str,
     start_date: str,
     end_date: str,
+    client: internalFacebookAdsClient | None = None,
+    dbt: bool = True,
 ):
+    # A DAG called without client owns its connection pool and registry then closes them once its graph finishes
+    client_owned = client is None
+    client = client or internalFacebookAdsClient(
+        access_token=access_token,
+        pool_maxsize=DAGS_FACEBOOK_THREADS,
+    )
+
     msg = (
         "🔄 [DAGS] Trigger to update Facebook Ads campaign insights with account_id "
         f"{account_id} from "
@@ -41,63 +72,222 @@ def dags_campaign_insights(
     print(msg)
     logging.info(msg)
 
+# Task graph for Facebook Ads campaign insights
+    DAGS_GRAPH_WORKERS = 2
+    DAGS_GRAPH_ATTEMPTS = 2
+    DAGS_GRAPH_RESOURCES = {
+        "facebook": DAGS_FACEBOOK_TASKS,
+        "bigquery": 1,
+    }
+
+    dags_context = {
+        "access_token": access_token,
+        "account_id": account_id,
+        "start_date": start_date,
+        "end_date": end_date,
+        "client": client,
+    }
+
+    dags_graph = (
+        internalTaskGraph(
+            max_workers=DAGS_GRAPH_WORKERS,
+            resources=DAGS_GRAPH_RESOURCES,
+            backoff=client.governor.backoff,
+        )
+        .task("campaign_insights", partial(_etl_campaign_insights, **dags_context), resource="facebook")
+        .task("campaign_metadata", partial(_etl_campaign_metadata, **dags_context), inputs=["campaign_insights"], attempts=DAGS_GRAPH_ATTEMPTS, resource="facebook")
+    )
+
+    # Caller running several DAG(s) builds their dbt selection(s) once after all of them finish
+    if dbt:
+        dags_graph.task("dbt", _dbt_campaign_insights, inputs=["campaign_metadata"], resource="bigquery")
+
+    try:
+        dags_graph.run()
+    finally:
+        if client_owned:
+            client.close()
+
 # ETL for Facebook Ads campaign insights
+def _etl_campaign_insights(
+    *,
+    access_token: str,
+    account_id: str,
+    start_date: str,
+    end_date: str,
+    client: internalFacebookAdsClient,
+) -> dict | None:
     DAGS_MAX_ATTEMPTS = 3
-    DAGS_MIN_COOLDOWN = 60
+    DAGS_ASYNC_DAYS = 7
+    DAGS_CHUNK_SIZE = 5000
+    DAGS_QUEUE_SIZE = 2
+    DAGS_PREFETCH_BATCH_SIZE = 50
+    DAGS_PREFETCH_CONCURRENCY = 200
 
     dags_start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
     dags_end_date = datetime.strptime(end_date, "%Y-%m-%d").date()
 
-    total_campaign_ids: set[str] = set()
+    # Range mode pulls every month of the range in one query with daily time_increment so transformed chunk(s) are flushed per month
+    dags_window_days = (
+        (dags_end_date - dags_start_date).days + 1
+        if INSIGHTS == "range"
+        else 1
+    )
+
+    dags_windows = []
 
     while dags_start_date <= dags_end_date:
-        dags_split_date = dags_start_date.strftime("%Y-%m-%d")
+        dags_month_end = (dags_start_date.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+        dags_window_end = min(dags_start_date + timedelta(days=dags_window_days - 1), dags_month_end, dags_end_date)
+        dags_windows.append((dags_start_date, dags_window_end))
+        dags_start_date = dags_window_end + timedelta(days=1)
+
+    total_campaign_ids: set[str] = set()
+
+    # Metadata frame(s) built from insights name column(s) with NAMES=insights
+    dfs_insights_metadata: dict[str, list[pd.DataFrame]] = {}
 
-        for attempt in range(1, DAGS_MAX_ATTEMPTS + 1):
-            try:
-    
     # Extract
-                msg = (
-                    "🔄 [DAGS] Trigger to extract Facebook Ads campaign insights from account_id "
-                    f"{account_id} at "
-                    f"{dags_split_date} for "
-                    f"{attempt} attempt(s)..."
-                )
-                print(msg)
-                logging.info(msg)
+    def _extract_insights_stage(windows):
+        for dags_window_start, dags_window_end in windows:
+            dags_split_date = dags_window_start.strftime("%Y-%m-%d")
+            dags_split_end = dags_window_end.strftime("%Y-%m-%d")
 
-                insights = extract_campaign_insights(
-                    access_token=access_token,
-                    account_id=account_id,
-                    start_date=dags_split_date,
-                    end_date=dags_split_date,
-                )
+            for attempt in range(1, DAGS_MAX_ATTEMPTS + 1):
+                try:
+                    msg = (
+                        "🔄 [DAGS] Trigger to extract Facebook Ads campaign insights from account_id "
+                        f"{account_id} at "
+                        f"{dags_split_date} for "
+                        f"{attempt} attempt(s)..."
+                    )
+                    print(msg)
+                    logging.info(msg)
+
+                    insights_chunks = extract_campaign_insights(
+                        access_token=access_token,
+                        account_id=account_id,
+                        start_date=dags_split_date,
+                        end_date=dags_split_end,
+                        async_chunk_days=(
+                            DAGS_ASYNC_DAYS
+                            if (dags_window_end - dags_window_start).days + 1 > DAGS_ASYNC_DAYS
+                            else None
+                        ),
+                        time_increment=1,
+                        client=client,
+                        engine=ENGINE,
+                        chunk_size=DAGS_CHUNK_SIZE,
+                        names=NAMES == "insights",
+                    )
+
+                    for insights in insights_chunks:
+                        yield "chunk", dags_split_date, insights
+
+                    yield "done", dags_split_date, dags_window_end
+                    break
 
-                if insights.empty:
+                except Exception as e:
+                    retryable = getattr(e, "retryable", False)
                     msg = (
-                        "⚠️ [DAGS] No Facebook Ads campaign insights returned from account_id "
-                        f"{account_id} then DAG execution "
-                        f"{dags_split_date} will be skipped."
+                        f"⚠️ [DAGS] Failed to extract Facebook Ads campaign insights for {dags_split_date} in "
+                        f"{attempt}/{DAGS_MAX_ATTEMPTS} attempt(s) due to "
+                        f"{e}."
                     )
                     print(msg)
                     logging.warning(msg)
-                    break
+
+                    if not retryable:
+                        raise RuntimeError(
+                            f"❌ [DAGS] Failed to extract Facebook Ads campaign insights for "
+                            f"{dags_split_date} due to unexpected error then DAG execution will be aborting."
+                        ) from e
+
+                    if attempt == DAGS_MAX_ATTEMPTS:
+                        raise RuntimeError(
+                            "❌ [DAGS] Failed to extract Facebook Ads campaign insights for "
+                            f"{dags_split_date} in "
+                            f"{attempt}/{DAGS_MAX_ATTEMPTS} attempt(s) due to exceeded attempt limit then DAG execution will be aborting."
+                        ) from e
+
+                    # Transform stage discards chunk(s) of the failed attempt so retried window never loads duplicates
+                    yield "reset", dags_split_date, None
+
+                    client.governor.backoff(
+                        attempt,
+                        f"retrying Facebook Ads API {attempt}/{DAGS_MAX_ATTEMPTS} attempt(s)",
+                    )
+
+            if dags_window_end < dags_end_date:
+                client.governor.throttle("processing next date of Facebook Ads campaign insights")
 
     # Transform
-                msg = (
-                    "🔄 [DAGS] Trigger to transform Facebook Ads campaign insights from "
-                    f"{account_id} with "
-                    f"{dags_split_date} for "
-                    f"{len(insights)} row(s)..."
-                )
-                print(msg)
-                logging.info(msg)                
-                
-                insights = transform_campaign_insights(insights)
+    def _transform_insights_stage(events):
+        dags_window_buffers: dict[str, list[pd.DataFrame | pa.Table]] = {}
+        dags_window_buffer_dates: dict[str, set[str]] = {}
+        dags_window_campaign_ids: set[str] = set()
+        dags_insights_rows = 0
+
+        for dags_event, dags_split_date, insights in events:
+            if dags_event in {"reset", "done"}:
+                if dags_event == "done":
+                    if not dags_insights_rows:
+                        msg = (
+                            "⚠️ [DAGS] No Facebook Ads campaign insights returned from account_id "
+                            f"{account_id} then DAG execution "
+                            f"{dags_split_date} will be skipped."
+                        )
+                        print(msg)
+                        logging.warning(msg)
+
+                    yield insights, dags_window_buffers, dags_window_buffer_dates, dags_window_campaign_ids
+
+                dags_window_buffers = {}
+                dags_window_buffer_dates = {}
+                dags_window_campaign_ids = set()
+                dags_insights_rows = 0
+                continue
 
-    # Load
-                dags_split_year = pd.to_datetime(insights["date"].dropna().iloc[0]).year
-                dags_split_month = pd.to_datetime(insights["date"].dropna().iloc[0]).month
+            msg = (
+                "🔄 [DAGS] Trigger to transform Facebook Ads campaign insights from "
+                f"{account_id} with "
+                f"{dags_split_date} for "
+                f"{len(insights)} row(s)..."
+            )
+            print(msg)
+            logging.info(msg)
+
+            # Name column(s) are split into metadata frame(s) before insights are transformed
+            if NAMES == "insights":
+                insights, chunk_metadata = extract_insights_metadata(insights)
+                for entity, df_entity_metadata in chunk_metadata.items():
+                    dfs_insights_metadata.setdefault(entity, []).append(df_entity_metadata)
+
+            insights = transform_campaign_insights(insights, engine=ENGINE)
+            dags_insights_rows += len(insights)
+
+            # Arrow engine keeps pa.Table and splits load date(s) with pyarrow.compute
+            if isinstance(insights, pa.Table):
+                daily_campaign_ids = set(pc.unique(insights["campaign_id"]).drop_null().to_pylist())
+                dags_load_keys = pc.strftime(insights["date"], format="%Y-%m-%d")
+                dags_load_groups = [
+                    (dags_load_date, insights.filter(pc.equal(dags_load_keys, dags_load_date)))
+                    for dags_load_date in sorted(pc.unique(dags_load_keys).drop_null().to_pylist())
+                ]
+            else:
+                daily_campaign_ids = set(insights["campaign_id"].unique())
+                dags_load_groups = [
+                    (dags_load_date, daily_insights.reset_index(drop=True))
+                    for dags_load_date, daily_insights in insights.groupby(
+                        insights["date"].dt.strftime("%Y-%m-%d")
+                    )
+                ]
+
+            dags_window_campaign_ids.update(daily_campaign_ids)
+
+            for dags_load_date, daily_insights in dags_load_groups:
+                dags_split_year = pd.to_datetime(dags_load_date).year
+                dags_split_month = pd.to_datetime(dags_load_date).month
 
                 _campaign_insights_direction = (
                     f"{PROJECT}."
@@ -105,75 +295,137 @@ def dags_campaign_insights(
                     f"{COMPANY}_table_facebook_{DEPARTMENT}_{ACCOUNT}_campaign_m{dags_split_month:02d}{dags_split_year}"
                 )
 
-                msg = (
-                    "🔄 [DAGS] Trigger to load Facebook Ads campaign insights from account_id "
-                    f"{account_id} for "
-                    f"{dags_split_date} to direction "
-                    f"{_campaign_insights_direction}..."
-                )
-                print(msg)
-                logging.info(msg)
+                dags_window_buffers.setdefault(_campaign_insights_direction, []).append(daily_insights)
+                dags_window_buffer_dates.setdefault(_campaign_insights_direction, set()).add(dags_load_date)
 
-                daily_campaign_ids = set(insights["campaign_id"].unique())
-                total_campaign_ids.update(daily_campaign_ids)
+    # Load
+    # Staging table(s) and pending stream(s) belong to this run so a failed run never leaves them to another run's MERGE
+    dags_load_staging: dict[str, dict] = {}
 
-                load_campaign_insights(
-                    df=insights,
-                    direction=_campaign_insights_direction,
-                )
+    def _load_insights_stage(windows):
+        # Latest window of every monthly table is held so the closing load always has row(s) to merge staged chunk(s) with
+        dags_load_held: dict[str, tuple[list[pd.DataFrame | pa.Table], set[str]]] = {}
+        dags_load_staged_dates: dict[str, set[str]] = {}
 
-                break
+        for dags_window_end, dags_window_buffers, dags_window_buffer_dates, dags_window_campaign_ids in windows:
 
-            except Exception as e:
-                retryable = getattr(e, "retryable", False)
-                msg = (
-                    f"⚠️ [DAGS] Failed to extract Facebook Ads campaign insights for {dags_split_date} in "
-                    f"{attempt}/{DAGS_MAX_ATTEMPTS} attempt(s) due to "
-                    f"{e}."
+            # Newly seen campaign_id(s) are handed to metadata stage before monthly load blocks on job result
+            new_campaign_ids = dags_window_campaign_ids - total_campaign_ids
+            total_campaign_ids.update(dags_window_campaign_ids)
+
+            if new_campaign_ids:
+                yield new_campaign_ids
+
+            # Previously held window is appended to the pending stream of its month without a load job so memory stays bounded by one window (one day, or one month with INSIGHTS=range)
+            for _campaign_insights_direction, dags_window_frames in dags_window_buffers.items():
+                if _campaign_insights_direction in dags_load_held:
+                    dags_held_frames, dags_held_dates = dags_load_held.pop(_campaign_insights_direction)
+                    _load_insights_frames(_campaign_insights_direction, dags_held_frames, dags_held_dates, "stage")
+                    dags_load_staged_dates.setdefault(_campaign_insights_direction, set()).update(dags_held_dates)
+
+                dags_load_held[_campaign_insights_direction] = (
+                    dags_window_frames,
+                    set(dags_window_buffer_dates[_campaign_insights_direction]),
                 )
-                print(msg)
-                logging.warning(msg)
 
-                if not retryable:
-                    raise RuntimeError(
-                        f"❌ [DAGS] Failed to extract Facebook Ads campaign insights for "
-                        f"{dags_split_date} due to unexpected error then DAG execution will be aborting."
-                    ) from e
-
-                if attempt == DAGS_MAX_ATTEMPTS:
-                    raise RuntimeError(
-                        "❌ [DAGS] Failed to extract Facebook Ads campaign insights for "
-                        f"{dags_split_date} in "
-                        f"{attempt}/{DAGS_MAX_ATTEMPTS} attempt(s) due to exceeded attempt limit then DAG execution will be aborting."
-                    ) from e
-
-                wait_to_retry = 60 + (attempt - 1) * 30
-                
-                msg = (
-                    "🔄 [DAGS] Waiting "
-                    f"{wait_to_retry} second(s) before retrying Facebook Ads API "
-                    f"{attempt}/{DAGS_MAX_ATTEMPTS} attempt(s)..."
+            # Monthly table(s) no following window can append to are closed with one MERGE of every staged chunk
+            dags_next_date = dags_window_end + timedelta(days=1)
+            dags_next_direction = (
+                f"{PROJECT}."
+                f"{COMPANY}_dataset_facebook_api_raw."
+                f"{COMPANY}_table_facebook_{DEPARTMENT}_{ACCOUNT}_campaign_m{dags_next_date.month:02d}{dags_next_date.year}"
+                if dags_next_date <= dags_end_date
+                else None
+            )
+
+            for _campaign_insights_direction in [
+                direction for direction in dags_load_held
+                if direction != dags_next_direction
+            ]:
+                dags_held_frames, dags_held_dates = dags_load_held.pop(_campaign_insights_direction)
+                dags_load_dates = dags_load_staged_dates.pop(_campaign_insights_direction, set()) | dags_held_dates
+
+                # Single day overwrites its partition while multiple day(s) share one MERGE of the staging table
+                _load_insights_frames(
+                    _campaign_insights_direction,
+                    dags_held_frames,
+                    dags_load_dates,
+                    "replace_partition" if len(dags_load_dates) == 1 else "upsert_merge",
                 )
-                print(msg)
-                logging.warning(msg)
 
-                time.sleep(wait_to_retry)
+    def _load_insights_frames(direction, frames, dates, mode):
+        dags_load_dates = sorted(dates)
+
+        insights = (
+            pa.concat_tables(frames, promote_options="default")
+            if isinstance(frames[0], pa.Table)
+            else pd.concat(frames, ignore_index=True)
+        )
+
+        msg = (
+            f"🔄 [DAGS] Trigger to {'stage' if mode == 'stage' else 'load'} Facebook Ads campaign insights from account_id "
+            f"{account_id} for "
+            f"{len(dags_load_dates)} date(s) from "
+            f"{dags_load_dates[0]} to "
+            f"{dags_load_dates[-1]} to direction "
+            f"{direction}..."
+        )
+        print(msg)
+        logging.info(msg)
+
+        load_campaign_insights(
+            df=insights,
+            direction=direction,
+            mode=mode,
+            backend=LOADER,
+            staging=dags_load_staging,
+        )
+
+    # Prefetch metadata
+    def _prefetch_metadata_stage(batches):
+        for new_campaign_ids in batches:
+
+            # Account-level listing covers every campaign_id at once after insights
+            if METADATA == "account":
+                continue
 
-        dags_start_date += timedelta(days=1)
-        
-        if dags_start_date <= dags_end_date:
             msg = (
-                "🔄 [DAGS] Waiting "
-                f"{DAGS_MIN_COOLDOWN} second(s) cooldown before processing next date of Facebook Ads campaign insights..."
+                "🔄 [DAGS] Trigger to prefetch Facebook Ads campaign metadata for "
+                f"{len(new_campaign_ids)} newly seen campaign_id(s)..."
             )
             print(msg)
             logging.info(msg)
 
-            time.sleep(DAGS_MIN_COOLDOWN)
+            # Prefetch is best-effort and lands in client.registry, so campaign metadata stage of every DAG reuses it and only retries failed campaign_id(s)
+            try:
+                extract_campaign_metadata(
+                    access_token=access_token,
+                    account_id=account_id,
+                    campaign_ids=list(new_campaign_ids),
+                    batch_size=DAGS_PREFETCH_BATCH_SIZE,
+                    client=client,
+                    concurrency=DAGS_PREFETCH_CONCURRENCY if METADATA == "async" else None,
+                )
+            except Exception as e:
+                msg = (
+                    "⚠️ [DAGS] Failed to prefetch Facebook Ads campaign metadata for "
+                    f"{len(new_campaign_ids)} campaign_id(s) due to "
+                    f"{e} then campaign metadata stage will retry them."
+                )
+                print(msg)
+                logging.warning(msg)
+                continue
+
+    internalPipelineExecutor(
+        stages=[
+            ("extract", _extract_insights_stage),
+            ("transform", _transform_insights_stage),
+            ("load", _load_insights_stage),
+            ("metadata", _prefetch_metadata_stage),
+        ],
+        queue_size=DAGS_QUEUE_SIZE,
+    ).run(dags_windows)
 
-# ETL for Facebook Ads campaign metadata
-    DAGS_CAMPAIGN_ATTEMPTS = 3
-    
     if not total_campaign_ids:
         msg = (
             "⚠️ [DAGS] No Facebook Ads campaign_id appended for account_id "
@@ -183,112 +435,182 @@ def dags_campaign_insights(
         )
         print(msg)
         logging.warning(msg)
-        return
+        return None
+
+    return {
+        "campaign_ids": total_campaign_ids,
+        "insights_metadata": {
+            entity: (
+                pd.concat(dfs_entity_metadata, ignore_index=True)
+                .drop_duplicates(subset=[f"{entity}_id"], keep="last")
+                .reset_index(drop=True)
+            )
+            for entity, dfs_entity_metadata in dfs_insights_metadata.items()
+        },
+    }
 
-    # Extract
-    remaining_campaign_ids = list(total_campaign_ids)
-    dfs_campaign_metadata = []
-    
-    for attempt in range(1, DAGS_CAMPAIGN_ATTEMPTS + 1):
-        msg = (
-            "🔄 [DAGS] Trigger to extract Facebook Ads campaign metadata for "
-            f"{len(remaining_campaign_ids)} campaign_id(s) in "
-            f"{attempt}/{DAGS_CAMPAIGN_ATTEMPTS} attempt(s)..."
-        )
-        print(msg)
-        logging.info(msg)
+# ETL for Facebook Ads campaign metadata
+def _etl_campaign_metadata(
+    *,
+    access_token: str,
+    account_id: str,
+    start_date: str,
+    end_date: str,
+    client: internalFacebookAdsClient,
+    campaign_insights: dict,
+) -> int:
+    DAGS_CAMPAIGN_ATTEMPTS = 3
+    DAGS_CAMPAIGN_BATCH_SIZE = 50
+    DAGS_CAMPAIGN_CONCURRENCY = 200
     
-        df_campaign_metadata = extract_campaign_metadata(
-            access_token=access_token,
-            account_id=account_id,
-            campaign_ids=remaining_campaign_ids,
-        )
+    total_campaign_ids = campaign_insights["campaign_ids"]
 
-        if not df_campaign_metadata.empty:
-            dfs_campaign_metadata.append(df_campaign_metadata)
+    _campaign_metadata_direction = (
+        f"{PROJECT}."
+        f"{COMPANY}_dataset_facebook_api_raw."
+        f"{COMPANY}_table_facebook_{DEPARTMENT}_{ACCOUNT}_campaign_metadata"
+    )
 
-        failed_campaign_ids = getattr(df_campaign_metadata, "failed_campaign_ids", [])
-        retryable = getattr(df_campaign_metadata, "retryable", False)
+    # Campaign DAG and ad DAG claim campaign_id(s) of the same table, so every campaign_id is upserted once per run
+    def _campaign_metadata_unit(new_campaign_ids: list[str]) -> int:
+        # Extract
+        # Campaign_id(s) prefetched while insights were still loading are handed back by client.registry
+        remaining_campaign_ids = list(new_campaign_ids)
+        dfs_campaign_metadata = []
 
-        if not failed_campaign_ids:
+        if METADATA == "account":
             msg = (
-                "✅ [DAGS] Successfully triggered to extract Facebook campaign metadata with "
-                f"{len(set(pd.concat(dfs_campaign_metadata)["campaign_id"].dropna()))}/{len(remaining_campaign_ids)} row(s)."
+                "🔄 [DAGS] Trigger to list Facebook Ads campaign metadata for "
+                f"{len(remaining_campaign_ids)} campaign_id(s) with account-level listing..."
             )
             print(msg)
             logging.info(msg)
-            break
 
-        if not retryable:
+            df_listed_campaigns = extract_account_metadata(
+                access_token=access_token,
+                account_id=account_id,
+                campaign_ids=remaining_campaign_ids,
+                client=client,
+            )["campaign"]
+
+            if not df_listed_campaigns.empty:
+                dfs_campaign_metadata.append(df_listed_campaigns)
+
+            remaining_campaign_ids = getattr(df_listed_campaigns, "failed_campaign_ids", remaining_campaign_ids)
+
+        for attempt in range(1, DAGS_CAMPAIGN_ATTEMPTS + 1):
             msg = (
-                "❌ [DAGS] Failed to extract Facebook Ads campaign metadata for "
-                f"{len(remaining_campaign_ids)} campaign_id(s) due to unexpected non-retryable error then DAG execution will be suspended."
+                "🔄 [DAGS] Trigger to extract Facebook Ads campaign metadata for "
+                f"{len(remaining_campaign_ids)} campaign_id(s) in "
+                f"{attempt}/{DAGS_CAMPAIGN_ATTEMPTS} attempt(s)..."
             )
             print(msg)
-            logging.warning(msg)
-            break
+            logging.info(msg)
 
-        if attempt == DAGS_CAMPAIGN_ATTEMPTS:
-            msg = (
-                "❌ [DAGS] Failed to extract Facebook Ads campaign metadata for "
-                f"{len(remaining_campaign_ids)} campaign_id(s) due to exceeded attempt limit then DAG execution will be suspended."
+            df_campaign_metadata = extract_campaign_metadata(
+                access_token=access_token,
+                account_id=account_id,
+                campaign_ids=remaining_campaign_ids,
+                batch_size=DAGS_CAMPAIGN_BATCH_SIZE,
+                client=client,
+                concurrency=DAGS_CAMPAIGN_CONCURRENCY if METADATA == "async" else None,
             )
-            print(msg)
-            logging.warning(msg)
-            break
 
-        remaining_campaign_ids = failed_campaign_ids
+            if not df_campaign_metadata.empty:
+                dfs_campaign_metadata.append(df_campaign_metadata)
 
-        wait_to_retry = 60 + (attempt - 1) * 30
-        
-        msg = (
-            "🔄 [DAGS] Waiting "
-            f"{wait_to_retry} second(s) before retrying Facebook Ads API "
-                f"{attempt}/{DAGS_CAMPAIGN_ATTEMPTS} attempt(s)..."
+            failed_campaign_ids = getattr(df_campaign_metadata, "failed_campaign_ids", [])
+            retryable = getattr(df_campaign_metadata, "retryable", False)
+
+            if not failed_campaign_ids:
+                msg = (
+                    "✅ [DAGS] Successfully triggered to extract Facebook campaign metadata with "
+                    f"{len(set(pd.concat(dfs_campaign_metadata)["campaign_id"].dropna()))}/{len(remaining_campaign_ids)} row(s)."
+                )
+                print(msg)
+                logging.info(msg)
+                break
+
+            if not retryable:
+                msg = (
+                    "❌ [DAGS] Failed to extract Facebook Ads campaign metadata for "
+                    f"{len(remaining_campaign_ids)} campaign_id(s) due to unexpected non-retryable error then DAG execution will be suspended."
+                )
+                print(msg)
+                logging.warning(msg)
+                break
+
+            if attempt == DAGS_CAMPAIGN_ATTEMPTS:
+                msg = (
+                    "❌ [DAGS] Failed to extract Facebook Ads campaign metadata for "
+                    f"{len(remaining_campaign_ids)} campaign_id(s) due to exceeded attempt limit then DAG execution will be suspended."
+                )
+                print(msg)
+                logging.warning(msg)
+                break
+
+            remaining_campaign_ids = failed_campaign_ids
+
+            client.governor.backoff(
+                attempt,
+                f"retrying Facebook Ads API {attempt}/{DAGS_CAMPAIGN_ATTEMPTS} attempt(s)",
+            )
+
+        df_campaign_metadatas = pd.concat(dfs_campaign_metadata, ignore_index=True)
+
+        # Name(s) from insights row(s) cover campaign_id(s) whose per-object call failed
+        df_insights_campaigns = campaign_insights["insights_metadata"].get("campaign")
+        if df_insights_campaigns is not None:
+            df_campaign_metadatas["campaign_name"] = df_campaign_metadatas["campaign_name"].fillna(
+                df_campaign_metadatas["campaign_id"].map(df_insights_campaigns.set_index("campaign_id")["campaign_name"])
             )
+
+        # Transform
+        msg = (
+            "🔄 [DAGS] Trigger to transform Facebook Ads campaign metadata for "
+            f"{len(df_campaign_metadatas)} row(s)..."
+        )
         print(msg)
         logging.info(msg)
-        
-        time.sleep(wait_to_retry)
 
-    df_campaign_metadatas = pd.concat(dfs_campaign_metadata, ignore_index=True)
+        df_campaign_metadatas = transform_campaign_metadata(df_campaign_metadatas, engine=ENGINE)
 
-    # Transform
-    msg = (
-        "🔄 [DAGS] Trigger to transform Facebook Ads campaign metadata for "
-        f"{len(df_campaign_metadatas)} row(s)..."
-    )
-    print(msg)
-    logging.info(msg)
-
-    df_campaign_metadatas = transform_campaign_metadata(df_campaign_metadatas)
+        # Load
+        msg = (
+            "🔄 [DAGS] Trigger to load Facebook Ads campaign metadata for "
+            f"{len(df_campaign_metadatas)} row(s) to "
+            f"{_campaign_metadata_direction}..."
+        )
+        print(msg)
+        logging.info(msg)
 
-    # Load
-    _campaign_metadata_direction = (
-        f"{PROJECT}."
-        f"{COMPANY}_dataset_facebook_api_raw."
-        f"{COMPANY}_table_facebook_{DEPARTMENT}_{ACCOUNT}_campaign_metadata"
-    )
+        # MERGE(s) of ad DAG and campaign DAG into the same table run one at a time
+        with client.registry.lock(_campaign_metadata_direction):
+            load_campaign_metadata(
+                df=df_campaign_metadatas,
+                direction=_campaign_metadata_direction,
+                backend=LOADER,
+            )
 
-    msg = (
-        "🔄 [DAGS] Trigger to load Facebook Ads campaign metadata for "
-        f"{len(df_campaign_metadatas)} row(s) to "
-        f"{_campaign_metadata_direction}..."
-    )
-    print(msg)
-    logging.info(msg)
+        return len(df_campaign_metadatas)
 
-    load_campaign_metadata(
-        df=df_campaign_metadatas,
-        direction=_campaign_metadata_direction,
+    return sum(
+        client.registry.run_many(
+            ("load_campaign_metadata", _campaign_metadata_direction),
+            total_campaign_ids,
+            _campaign_metadata_unit,
+        )
     )
 
 # Materialization with dbt
+def _dbt_campaign_insights(
+    **task_outputs: object,
+) -> None:
     msg = ("🔄 [DAGS] Trigger to materialize Facebook Ads campaign insights with dbt...")
     print(msg)
     logging.info(msg)
 
     dbt_facebook_ads(
         google_cloud_project=PROJECT,
-        select="tag:mart,tag:campaign"
-    )
\ No newline at end of file
+        select=" ".join(DAGS_DBT_SELECTS),
+    )
@@ -1,3 +1,4 @@
+import os
 import sys
 import time
 from pathlib import Path
@@ -7,7 +8,17 @@ ROOT_FOLDER_LOCATION = Path(__file__).resolve().parents[2]
 sys.path.append(str(ROOT_FOLDER_LOCATION))
 
 from dags._dags_campaign_insights import dags_campaign_insights
+from dags._dags_campaign_insights import DAGS_FACEBOOK_THREADS as DAGS_CAMPAIGN_FACEBOOK_THREADS
+from dags._dags_campaign_insights import DAGS_DBT_SELECTS as DAGS_CAMPAIGN_DBT_SELECTS
 from dags._dags_ad_insights import dags_ad_insights
+from dags._dags_ad_insights import DAGS_FACEBOOK_THREADS as DAGS_AD_FACEBOOK_THREADS
+from dags._dags_ad_insights import DAGS_DBT_SELECTS as DAGS_AD_DBT_SELECTS
+from plugins.facebook_ads import internalFacebookAdsClient
+
+from dbt.run import dbt_facebook_ads
+
+PROJECT = os.getenv("PROJECT")
+CAMPAIGN_INSIGHTS = os.getenv("CAMPAIGN_INSIGHTS", "extract")
 
 
 def dags_facebook_ads(
@@ -27,10 +38,34 @@ def dags_facebook_ads(
         "campaign_insights": dags_campaign_insights,
         "ad_insights": dags_ad_insights,
     }
+    facebook_threads = {
+        "campaign_insights": DAGS_CAMPAIGN_FACEBOOK_THREADS,
+        "ad_insights": DAGS_AD_FACEBOOK_THREADS,
+    }
+    dbt_selects = {
+        "campaign_insights": DAGS_CAMPAIGN_DBT_SELECTS,
+        "ad_insights": DAGS_AD_DBT_SELECTS,
+    }
+
+    # Ad DAG derives campaign insights from ad rows so the campaign-level insights pull is skipped
+    if CAMPAIGN_INSIGHTS == "derive":
+        tasks.pop("campaign_insights")
 
     start_time = time.time()
     futures = {}
 
+    # one keep-alive connection pool shared by every extractor of this run
+    # sized to every Facebook Ads thread the concurrent DAGs can hold so none of them queue for a connection
+    client = internalFacebookAdsClient(
+        access_token=access_token,
+        pool_maxsize=sum(
+            sorted(
+                (facebook_threads[name] for name in tasks),
+                reverse=True,
+            )[:max_workers]
+        ),
+    )
+
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         # submit ALL tasks
         for name, fn in tasks.items():
@@ -41,10 +76,13 @@ def dags_facebook_ads(
                 account_id=account_id,
                 start_date=start_date,
                 end_date=end_date,
+                client=client,
+                dbt=False,
             )
             futures[future] = name
 
         completed = set()
+        succeeded = []
 
         for future in as_completed(futures):
             name = futures[future]
@@ -56,6 +94,7 @@ def dags_facebook_ads(
 
             try:
                 future.result()
+                succeeded.append(name)
                 print(f"✅ [DAGS:{name}] COMPLETED")
             except Exception as e:
                 print(f"❌ [DAGS:{name}] FAILED")
@@ -70,5 +109,22 @@ def dags_facebook_ads(
                     print(f"   ▶️  [DAGS:{r}] RUNNING")
                 print()
 
+    client.close()
+
+    # dbt selection(s) of every completed DAG are built together once instead of one dbt build per DAG
+    if succeeded:
+        select = " ".join(dict.fromkeys(selection for name in tasks if name in succeeded for selection in dbt_selects[name]))
+        print(f"▶️  [DAGS:dbt] RUNNING {select}")
+
+        try:
+            dbt_facebook_ads(
+                google_cloud_project=PROJECT,
+                select=select,
+            )
+            print("✅ [DAGS:dbt] COMPLETED")
+        except Exception as e:
+            print("❌ [DAGS:dbt] FAILED")
+            print(str(e))
+
     total_elapsed = round(time.time() - start_time, 2)
     print(f"🏁 [DAGS] Facebook Ads update finished in {total_elapsed}s")
\ No newline at end of file
@@ -0,0 +1,193 @@
+import sys
+from pathlib import Path
+ROOT_FOLDER_LOCATION = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT_FOLDER_LOCATION))
+
+from itertools import chain
+import logging
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from plugins.facebook_ads_actions import internalFacebookAdsActionsParser
+
+_ACTIONS_PARSER = internalFacebookAdsActionsParser()
+_ACTIONS_TYPE = pa.list_(pa.struct([("action_type", pa.string()), ("value", pa.string())]))
+
+def aggregate_campaign_insights(
+    df: pd.DataFrame | pa.Table,
+    by_goal: bool = False,
+) -> pd.DataFrame | pa.Table:
+    """
+    Aggregate Facebook Ads campaign insights from ad insights
+    ---------
+    Workflow:
+        1. Validate input
+        2. Group raw ad insights row(s) by account_id, campaign_id, date_start and date_stop, plus optimization_goal if by_goal
+        3. Sum spend, impressions and clicks and resolve optimization_goal as the non-null goal with the largest summed spend, ties broken by goal name
+        4. Explode actions once then sum action value(s) per group and action_type
+        5. Rebuild merged actions list per campaign row
+        6. Keep raw campaign insights shape so output can be aggregated again or passed to transform_campaign_insights
+    ---------
+    Returns:
+        1. DataFrame:
+            Raw campaign insights records
+        2. pa.Table:
+            Raw campaign insights records if input is pa.Table
+    """
+
+    is_arrow = isinstance(df, pa.Table)
+
+    if is_arrow:
+        actions = df["actions"].to_pylist() if "actions" in df.column_names else [None] * df.num_rows
+        df = df.drop_columns([col for col in ["actions"] if col in df.column_names]).to_pandas()
+    else:
+        actions = df["actions"].tolist() if "actions" in df.columns else [None] * len(df)
+
+    if df.empty:
+        msg = "⚠️ [TRANSFORM] Empty Facebook Ads ad insights then campaign insights aggregation will be suspended."
+        print(msg)
+        logging.warning(msg)
+        return pa.Table.from_pandas(df, preserve_index=False) if is_arrow else df
+
+    required_cols = {
+        "account_id",
+        "campaign_id",
+        "date_start",
+        "date_stop",
+    }
+
+    missing = required_cols - set(df.columns)
+    if missing:
+        raise ValueError(
+            "❌ [TRANSFORM] Failed to aggregate Facebook Ads campaign insights due to missing columns "
+            f"{missing} then aggregation will be suspended."
+        )
+
+    msg = (
+        "🔄 [TRANSFORM] Aggregating "
+        f"{len(df)} row(s) of Facebook Ads ad insights to campaign insights..."
+    )
+    print(msg)
+    logging.info(msg)
+
+    keys = [
+        "account_id",
+        "campaign_id",
+        "date_start",
+        "date_stop",
+    ]
+
+    metrics = df[keys].copy()
+    for col in [
+        "spend",
+        "impressions",
+        "clicks",
+    ]:
+        metrics[col] = (
+            pd.to_numeric(df[col], errors="coerce").fillna(0)
+            if col in df.columns
+            else 0
+        )
+    metrics["optimization_goal"] = df["optimization_goal"] if "optimization_goal" in df.columns else None
+
+    # Partial row(s) keep one row per optimization_goal so spend per goal survives the next aggregation
+    if by_goal:
+        keys = keys + ["optimization_goal"]
+
+    # Group number follows first appearance so it indexes aggregated row(s) directly
+    grouped = metrics.groupby(keys, sort=False, dropna=False, observed=True)
+    group_index = grouped.ngroup().to_numpy()
+
+    campaign_insights = grouped.agg(
+        spend=("spend", "sum"),
+        impressions=("impressions", "sum"),
+        clicks=("clicks", "sum"),
+    ).reset_index()
+
+    # Goal with the largest summed spend wins regardless of row order, so raw row(s) and partial row(s) resolve the same goal
+    if not by_goal:
+        goal_spend = (
+            metrics[["optimization_goal", "spend"]]
+            .assign(group=group_index)
+            .groupby(["group", "optimization_goal"], sort=False, dropna=False, observed=True)["spend"]
+            .sum()
+            .reset_index()
+        )
+        goal_spend["missing"] = goal_spend["optimization_goal"].isna()
+        goal_spend = goal_spend.sort_values(
+            ["group", "missing", "spend", "optimization_goal"],
+            ascending=[True, True, False, True],
+            kind="mergesort",
+        ).drop_duplicates(subset=["group"], keep="first")
+
+        campaign_insights.insert(
+            len(keys),
+            "optimization_goal",
+            goal_spend.set_index("group")["optimization_goal"].reindex(range(len(campaign_insights))).to_numpy(),
+        )
+
+    # Explode actions once into long frame of (group, action_type, value)
+    parsed_actions, failed_actions = _ACTIONS_PARSER.parse(actions)
+
+    if failed_actions:
+        msg = (
+            "⚠️ [TRANSFORM] Failed to parse "
+            f"{failed_actions}/{len(df)} string-encoded actions payload(s) of Facebook Ads ad insights then empty actions will be used."
+        )
+        print(msg)
+        logging.warning(msg)
+
+    flat_actions = list(chain.from_iterable(parsed_actions))
+    tbl_actions = pd.DataFrame(
+        {
+            "group": np.repeat(group_index, [len(row_actions) for row_actions in parsed_actions]),
+            "action_type": [act.get("action_type") for act in flat_actions],
+            "value": pd.to_numeric(
+                pd.Series([act.get("value", 0) for act in flat_actions], dtype="object"),
+                errors="coerce",
+            ).fillna(0).to_numpy(dtype="float64"),
+        }
+    )
+
+    merged_actions = (
+        tbl_actions.dropna(subset=["action_type"])
+        .groupby(["group", "action_type"], sort=False)["value"]
+        .sum()
+        .reset_index()
+    )
+
+    # Integral sum(s) keep raw API string form such as "3" instead of "3.0"
+    merged_values = merged_actions["value"].to_numpy()
+    is_integral = np.isfinite(merged_values) & (np.mod(merged_values, 1) == 0)
+    merged_strings = np.where(
+        is_integral,
+        np.where(is_integral, merged_values, 0).astype("int64").astype(str),
+        merged_values.astype(str),
+    )
+
+    campaign_actions: list[list[dict]] = [[] for _ in range(len(campaign_insights))]
+    for group, action_type, value in zip(
+        merged_actions["group"].to_numpy(),
+        merged_actions["action_type"].to_numpy(),
+        merged_strings,
+    ):
+        campaign_actions[group].append({"action_type": action_type, "value": value})
+
+    msg = (
+        "✅ [TRANSFORM] Successfully aggregated "
+        f"{len(df)} row(s) of Facebook Ads ad insights to "
+        f"{len(campaign_insights)} row(s) of campaign insights."
+    )
+    print(msg)
+    logging.info(msg)
+
+    if is_arrow:
+        return pa.Table.from_pandas(campaign_insights, preserve_index=False).append_column(
+            "actions",
+            pa.array(campaign_actions, type=_ACTIONS_TYPE),
+        )
+
+    campaign_insights["actions"] = campaign_actions
+
+    return campaign_insights
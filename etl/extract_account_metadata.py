@@ -0,0 +1,489 @@
+import sys
+from pathlib import Path
+ROOT_FOLDER_LOCATION = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT_FOLDER_LOCATION))
+
+import time
+import logging
+import pandas as pd
+
+from facebook_business.api import FacebookAdsApi
+from facebook_business.session import FacebookSession
+from facebook_business.adobjects.ad import Ad
+from facebook_business.adobjects.adset import AdSet
+from facebook_business.adobjects.campaign import Campaign
+from facebook_business.adobjects.adaccount import AdAccount
+from facebook_business.exceptions import FacebookRequestError
+
+from plugins.facebook_ads import internalFacebookAdsClient
+
+def extract_account_metadata(
+    access_token: str,
+    account_id: str,
+    ad_ids: list[str] | None = None,
+    adset_ids: list[str] | None = None,
+    campaign_ids: list[str] | None = None,
+    chunk_size: int = 100,
+    client: internalFacebookAdsClient | None = None,
+) -> dict[str, pd.DataFrame]:
+    """
+    Extract Facebook Ads ad, adset and campaign metadata with account-level listing
+    ---------
+    Workflow:
+        1. Validate input ad_ids, adset_ids and campaign_ids
+        2. Make API call for AdAccount endpoint
+        3. Make API call for AdAccount.get_ads with id filtering and nested adset{...}/campaign{...} expansion
+        4. Make API call for AdAccount.get_adsets for adset_ids not expanded from ads
+        5. Make API call for AdAccount.get_campaigns for campaign_ids not expanded from ads
+        6. Enforce List[dict] to DataFrame for each entity
+    ---------
+    Returns:
+        1. dict[str, DataFrame]:
+            "ad" with the same columns as extract_ad_metadata
+            "adset" with the same columns as extract_adset_metadata
+            "campaign" with the same columns as extract_campaign_metadata
+    """
+
+    start_time = time.time()
+    ad_ids = list(dict.fromkeys(ad_ids or []))
+    adset_ids = list(dict.fromkeys(adset_ids or []))
+    campaign_ids = list(dict.fromkeys(campaign_ids or []))
+    chunk_size = max(1, chunk_size)
+
+    ad_rows: dict[str, dict] = {}
+    adset_rows: dict[str, dict] = {}
+    campaign_rows: dict[str, dict] = {}
+
+    # Validate input
+    if not ad_ids and not adset_ids and not campaign_ids:
+        msg = (
+            "⚠️ [EXTRACT] No input ad_ids, adset_ids or campaign_ids for Facebook Ads account_id "
+            f"{account_id} then empty DataFrame(s) returned."
+        )
+        print(msg)
+        logging.warning(msg)
+
+    # Initialize Facebook Ads SDK client
+    try:
+        msg = (
+            "🔍 [EXTRACT] Initializing Facebook Ads SDK client with account_id "
+            f"{account_id} for account metadata extraction..."
+        )
+        print(msg)
+        logging.info(msg)
+
+        if client:
+            account_metadata_api = client.api()
+
+        else:
+            account_metadata_session = FacebookSession(
+                access_token=access_token,
+                timeout=180,
+            )
+
+            account_metadata_api = FacebookAdsApi(account_metadata_session)
+
+        msg = (
+            "✅ [EXTRACT] Successfully initialized Facebook Ads SDK client for account_id "
+            f"{account_id} for account metadata extraction."
+        )
+        print(msg)
+        logging.info(msg)
+
+    except Exception as e:
+        raise RuntimeError(
+            "❌ [EXTRACT] Failed to initialize Facebook Ads SDK client for account_id "
+            f"{account_id} for account metadata extraction due to "
+            f"{e}."
+        ) from e
+
+    account_id_prefixed = (
+        account_id if account_id.startswith("act_")
+        else f"act_{account_id}"
+    )
+
+    account = AdAccount(
+        account_id_prefixed,
+        api=account_metadata_api,
+    )
+
+    # Make Facebook Ads API call for ad account information
+    account_name = None
+
+    if ad_ids or adset_ids or campaign_ids:
+        try:
+            msg = (
+                "🔍 [EXTRACT] Extracting Facebook Ads account_name for account_id "
+                f"{account_id}..."
+            )
+            print(msg)
+            logging.info(msg)
+
+            # Account name is looked up once per run and shared by every extractor of the same account_id
+            account_name = (
+                client.registry.run(
+                    ("account_name", account_id.removeprefix("act_")),
+                    lambda: account.api_get(fields=["name"]).get("name"),
+                )
+                if client
+                else account.api_get(fields=["name"]).get("name")
+            )
+
+            msg = (
+                "✅ [EXTRACT] Successfully extracted Facebook Ads account_name "
+                f"{account_name} for account_id "
+                f"{account_id}."
+            )
+            print(msg)
+            logging.info(msg)
+
+        except FacebookRequestError as e:
+            _raise_account_metadata_error(
+                e,
+                account_id=account_id,
+                entity="account_name",
+            )
+
+    # Make Facebook Ads API call for ad metadata with nested adset and campaign
+    failed_ad_ids, ad_retryable = _list_account_metadata(
+        account_id=account_id,
+        entity="ad",
+        ids=ad_ids,
+        chunk_size=chunk_size,
+        list_fn=account.get_ads,
+        fields=[
+            "id",
+            "name",
+            "adset_id",
+            "campaign_id",
+            "status",
+            "adset{id,name,campaign_id}",
+            "campaign{id,name,status}",
+        ],
+        statuses=_effective_statuses(Ad),
+        on_row=lambda ad: _append_ad_row(
+            ad,
+            account_id=account_id,
+            account_name=account_name,
+            ad_rows=ad_rows,
+            adset_rows=adset_rows,
+            campaign_rows=campaign_rows,
+        ),
+    )
+
+    # Make Facebook Ads API call for adset metadata not expanded from ads
+    failed_adset_ids, adset_retryable = _list_account_metadata(
+        account_id=account_id,
+        entity="adset",
+        ids=[adset_id for adset_id in adset_ids if adset_id not in adset_rows],
+        chunk_size=chunk_size,
+        list_fn=account.get_ad_sets,
+        fields=[
+            "id",
+            "name",
+            "campaign_id",
+        ],
+        statuses=_effective_statuses(AdSet),
+        on_row=lambda adset: adset_rows.__setitem__(
+            adset.get("id"),
+            {
+                "adset_id": adset.get("id"),
+                "adset_name": adset.get("name"),
+                "campaign_id": adset.get("campaign_id"),
+                "account_id": account_id,
+                "account_name": account_name,
+            },
+        ),
+    )
+
+    # Make Facebook Ads API call for campaign metadata not expanded from ads
+    failed_campaign_ids, campaign_retryable = _list_account_metadata(
+        account_id=account_id,
+        entity="campaign",
+        ids=[campaign_id for campaign_id in campaign_ids if campaign_id not in campaign_rows],
+        chunk_size=chunk_size,
+        list_fn=account.get_campaigns,
+        fields=[
+            "id",
+            "name",
+            "status",
+        ],
+        statuses=_effective_statuses(Campaign),
+        on_row=lambda campaign: campaign_rows.__setitem__(
+            campaign.get("id"),
+            {
+                "campaign_id": campaign.get("id"),
+                "campaign_name": campaign.get("name"),
+                "status": campaign.get("status"),
+                "account_id": account_id,
+                "account_name": account_name,
+            },
+        ),
+    )
+
+    time_elapsed = round(time.time() - start_time, 2)
+
+    df_ad = pd.DataFrame(
+        list(ad_rows.values()),
+        columns=[
+            "ad_id",
+            "ad_name",
+            "adset_id",
+            "campaign_id",
+            "status",
+            "account_id",
+            "account_name",
+        ],
+    )
+    df_ad.failed_ad_ids = failed_ad_ids
+    df_ad.retryable = ad_retryable
+    df_ad.time_elapsed = time_elapsed
+    df_ad.rows_input = len(ad_ids)
+    df_ad.rows_output = len(df_ad)
+
+    df_adset = pd.DataFrame(
+        list(adset_rows.values()),
+        columns=[
+            "adset_id",
+            "adset_name",
+            "campaign_id",
+            "account_id",
+            "account_name",
+        ],
+    )
+    df_adset.failed_adset_ids = failed_adset_ids
+    df_adset.retryable = adset_retryable
+    df_adset.time_elapsed = time_elapsed
+    df_adset.rows_input = len(adset_ids)
+    df_adset.rows_output = len(df_adset)
+
+    df_campaign = pd.DataFrame(
+        list(campaign_rows.values()),
+        columns=[
+            "campaign_id",
+            "campaign_name",
+            "status",
+            "account_id",
+            "account_name",
+        ],
+    )
+    df_campaign.failed_campaign_ids = failed_campaign_ids
+    df_campaign.retryable = campaign_retryable
+    df_campaign.time_elapsed = time_elapsed
+    df_campaign.rows_input = len(campaign_ids)
+    df_campaign.rows_output = len(df_campaign)
+
+    msg = (
+        "✅ [EXTRACT] Successfully extracted "
+        f"{len(df_ad)}/{len(ad_ids)} ad row(s), "
+        f"{len(df_adset)} adset row(s) and "
+        f"{len(df_campaign)} campaign row(s) of Facebook Ads account metadata in "
+        f"{time_elapsed}s."
+    )
+    print(msg)
+    logging.info(msg)
+
+    return {
+        "ad": df_ad,
+        "adset": df_adset,
+        "campaign": df_campaign,
+    }
+
+def _effective_statuses(adobject) -> list[str]:
+    """Every effective_status of the SDK object so archived and deleted entities are listed too."""
+    return [
+        value for key, value in vars(adobject.EffectiveStatus).items()
+        if not key.startswith("_")
+    ]
+
+def _append_ad_row(
+    ad,
+    *,
+    account_id: str,
+    account_name: str | None,
+    ad_rows: dict[str, dict],
+    adset_rows: dict[str, dict],
+    campaign_rows: dict[str, dict],
+) -> None:
+    adset = ad.get("adset") or {}
+    campaign = ad.get("campaign") or {}
+
+    ad_rows[ad.get("id")] = {
+        "ad_id": ad.get("id"),
+        "ad_name": ad.get("name"),
+        "adset_id": ad.get("adset_id"),
+        "campaign_id": ad.get("campaign_id"),
+        "status": ad.get("status"),
+        "account_id": account_id,
+        "account_name": account_name,
+    }
+
+    if adset.get("id"):
+        adset_rows[adset.get("id")] = {
+            "adset_id": adset.get("id"),
+            "adset_name": adset.get("name"),
+            "campaign_id": adset.get("campaign_id") or ad.get("campaign_id"),
+            "account_id": account_id,
+            "account_name": account_name,
+        }
+
+    if campaign.get("id"):
+        campaign_rows[campaign.get("id")] = {
+            "campaign_id": campaign.get("id"),
+            "campaign_name": campaign.get("name"),
+            "status": campaign.get("status"),
+            "account_id": account_id,
+            "account_name": account_name,
+        }
+
+def _list_account_metadata(
+    *,
+    account_id: str,
+    entity: str,
+    ids: list[str],
+    chunk_size: int,
+    list_fn,
+    fields: list[str],
+    statuses: list[str],
+    on_row,
+) -> tuple[list[str], bool]:
+    """
+    Page through an AdAccount edge filtered to ids in chunks
+    ---------
+    Returns:
+        1. list[str]:
+            Requested ids not returned by the listing or lost to retryable API error
+        2. bool:
+            Whether failed ids are eligible to retry
+    """
+
+    if not ids:
+        return [], False
+
+    msg = (
+        f"🔍 [EXTRACT] Listing Facebook Ads {entity} metadata for account_id "
+        f"{account_id} with "
+        f"{len(ids)} {entity}_id(s) in chunk(s) of "
+        f"{chunk_size}..."
+    )
+    print(msg)
+    logging.info(msg)
+
+    returned_ids: set[str] = set()
+    failed_ids: list[str] = []
+    retryable = False
+
+    for chunk_start in range(0, len(ids), chunk_size):
+        chunk_ids = ids[chunk_start:chunk_start + chunk_size]
+
+        try:
+            cursor = list_fn(
+                fields=fields,
+                params={
+                    "filtering": [
+                        {
+                            "field": "id",
+                            "operator": "IN",
+                            "value": chunk_ids,
+                        },
+                        {
+                            "field": "effective_status",
+                            "operator": "IN",
+                            "value": statuses,
+                        },
+                    ],
+                    "limit": chunk_size,
+                },
+            )
+
+            for row in cursor:
+                returned_ids.add(row.get("id"))
+                on_row(row)
+
+        except FacebookRequestError as e:
+            _raise_account_metadata_error(
+                e,
+                account_id=account_id,
+                entity=f"{entity} metadata",
+                retryable_ok=True,
+            )
+
+            msg = (
+                f"⚠️ [EXTRACT] Failed to list Facebook Ads {entity} metadata for "
+                f"{len(chunk_ids)} {entity}_id(s) due to API error "
+                f"{e} then this request is eligible to retry."
+            )
+            print(msg)
+            logging.warning(msg)
+
+            retryable = True
+
+    # Requested ids missing from the listing fall back to per-ID extraction
+    for entity_id in ids:
+        if entity_id not in returned_ids:
+            failed_ids.append(entity_id)
+
+    if failed_ids:
+        retryable = True
+
+    msg = (
+        "✅ [EXTRACT] Successfully listed "
+        f"{len(ids) - len(failed_ids)}/{len(ids)} row(s) of Facebook Ads "
+        f"{entity} metadata."
+    )
+    print(msg)
+    logging.info(msg)
+
+    return failed_ids, retryable
+
+def _raise_account_metadata_error(
+    e: FacebookRequestError,
+    *,
+    account_id: str,
+    entity: str,
+    retryable_ok: bool = False,
+) -> None:
+    api_error_code = None
+    http_status = None
+
+    try:
+        api_error_code = e.api_error_code()
+        http_status = e.http_status()
+    except Exception:
+        pass
+
+    # Expired token error
+    if api_error_code == 190:
+        raise RuntimeError(
+            f"❌ [EXTRACT] Failed to extract Facebook Ads {entity} for account_id "
+            f"{account_id} due to expired or invalid access token then manual token refresh is required."
+        ) from e
+
+    # Unexpected retryable API error
+    if (
+        (http_status and http_status >= 500)
+        or api_error_code in {
+            1,
+            2,
+            4,
+            17,
+            80000
+        }
+    ):
+        if retryable_ok:
+            return
+
+        error = RuntimeError(
+            f"⚠️ [EXTRACT] Failed to extract Facebook Ads {entity} for account_id "
+            f"{account_id} due to API error "
+            f"{e} then this request is eligible to retry."
+        )
+        error.retryable = True
+        raise error from e
+
+    # Unexpected non-retryable API error
+    raise RuntimeError(
+        f"❌ [EXTRACT] Failed to extract Facebook Ads {entity} for account_id "
+        f"{account_id} due to API error "
+        f"{e} then this request is not eligible to retry."
+    ) from e
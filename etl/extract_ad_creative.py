@@ -13,10 +13,16 @@ from facebook_business.adobjects.ad import Ad
 from facebook_business.adobjects.adcreative import AdCreative
 from facebook_business.exceptions import FacebookRequestError
 
+from plugins.facebook_ads import internalFacebookAdsClient
+from plugins.facebook_ads_async import internalFacebookAdsAsyncClient
+
 def extract_ad_creative(
     access_token: str,
     account_id: str,
     ad_ids: list[str],
+    batch_size: int | None = None,
+    client: internalFacebookAdsClient | None = None,
+    concurrency: int | None = None,
 ) -> pd.DataFrame:
     """
     Extract Facebook Ads ad creative
@@ -24,7 +30,7 @@ def extract_ad_creative(
     Workflow:
         1. Validate input ad_ids
         2. Loop each ad_id
-        3. Make API call for Ad(ad_id) endpoint
+        3. Make API call for Ad(ad_id) endpoint or multi-get up to 50 ad_id(s) with creative{id,thumbnail_url} or asyncio requests bounded by concurrency
         4. Append extracted JSON data to list[dict]
         5. Enforce List[dict] to DataFrame
     ---------
@@ -70,12 +76,16 @@ def extract_ad_creative(
         print(msg)
         logging.info(msg)
 
-        ad_creative_session = FacebookSession(
-            access_token=access_token,
-            timeout=180,
-        )
+        if client:
+            ad_creative_api = client.api()
+
+        else:
+            ad_creative_session = FacebookSession(
+                access_token=access_token,
+                timeout=180,
+            )
 
-        ad_creative_api = FacebookAdsApi(ad_creative_session)
+            ad_creative_api = FacebookAdsApi(ad_creative_session)
 
         msg = (
             "✅ [EXTRACT] Successfully initialized Facebook Ads SDK client for account_id "
@@ -91,6 +101,174 @@ def extract_ad_creative(
             f"{e}."
         ) from e
 
+    # Make Facebook Ads multi-get API call for ad creative
+    batch_results: dict[str, dict | FacebookRequestError] = {}
+    creative_results: dict[str, dict | FacebookRequestError] = {}
+
+    if concurrency:
+        msg = (
+            "🔍 [EXTRACT] Requesting Facebook Ads ad creative for account_id "
+            f"{account_id} on asyncio backend with up to "
+            f"{concurrency} in-flight request(s)..."
+        )
+        print(msg)
+        logging.info(msg)
+
+        ad_creative_async = internalFacebookAdsAsyncClient(
+            access_token=access_token,
+            concurrency=concurrency,
+            governor=client.governor if client else None,
+        )
+
+        batch_results = ad_creative_async.get_many(
+            node_ids=ad_ids,
+            fields=["creative{id,thumbnail_url}"],
+        )
+
+        for ad in batch_results.values():
+            creative = (ad.get("creative") or {}) if isinstance(ad, dict) else {}
+            if creative.get("id") and "thumbnail_url" in creative:
+                creative_results[creative["id"]] = creative
+
+        # De-duplicate creative_id(s) shared across ads and request the ones without thumbnail_url
+        remaining_creative_ids = list(
+            dict.fromkeys(
+                (ad.get("creative") or {}).get("id")
+                for ad in batch_results.values()
+                if isinstance(ad, dict)
+                and (ad.get("creative") or {}).get("id")
+                and (ad.get("creative") or {}).get("id") not in creative_results
+            )
+        )
+
+        creative_results.update(
+            ad_creative_async.get_many(
+                node_ids=remaining_creative_ids,
+                fields=["thumbnail_url"],
+            )
+        )
+
+        msg = (
+            "✅ [EXTRACT] Successfully resolved "
+            f"{len(creative_results)} unique creative_id(s) for "
+            f"{len(ad_ids)} ad_id(s) of Facebook Ads ad creative."
+        )
+        print(msg)
+        logging.info(msg)
+
+    elif batch_size:
+        batch_size = max(1, min(batch_size, 50))
+
+        msg = (
+            "🔍 [EXTRACT] Multi-getting Facebook Ads ad creative for account_id "
+            f"{account_id} with up to "
+            f"{batch_size} ad_id(s) per request..."
+        )
+        print(msg)
+        logging.info(msg)
+
+        # Rejected multi-get is split until the invalid id(s) are isolated while transient error(s) stay on the whole request
+        def _multi_get(
+            node_ids: list[str],
+            fields: str,
+        ) -> dict[str, dict | FacebookRequestError]:
+
+            try:
+                response = ad_creative_api.call(
+                    "GET",
+                    ("",),
+                    params={
+                        "ids": ",".join(node_ids),
+                        "fields": fields,
+                    },
+                ).json()
+
+            except FacebookRequestError as e:
+                api_error_code = None
+                http_status = None
+
+                try:
+                    api_error_code = e.api_error_code()
+                    http_status = e.http_status()
+                except Exception:
+                    pass
+
+                if (
+                    len(node_ids) == 1
+                    or api_error_code == 190
+                    or (http_status and http_status >= 500)
+                    or api_error_code in {
+                        1, 
+                        2, 
+                        4, 
+                        17, 
+                        80000
+                    }
+                ):
+                    return {node_id: e for node_id in node_ids}
+
+                middle = len(node_ids) // 2
+                return {
+                    **_multi_get(node_ids[:middle], fields),
+                    **_multi_get(node_ids[middle:], fields),
+                }
+
+            # Node without response is transient then eligible to retry
+            return {
+                node_id: (
+                    response[node_id]
+                    if isinstance(response.get(node_id), dict)
+                    else FacebookRequestError(
+                        "Multi-get request returned no response",
+                        {"method": "GET", "path": node_id},
+                        503,
+                        {},
+                        None,
+                    )
+                )
+                for node_id in node_ids
+            }
+
+        for batch_start in range(0, len(ad_ids), batch_size):
+            batch_results.update(
+                _multi_get(
+                    ad_ids[batch_start:batch_start + batch_size],
+                    "creative{id,thumbnail_url}",
+                )
+            )
+
+        for ad in batch_results.values():
+            creative = (ad.get("creative") or {}) if isinstance(ad, dict) else {}
+            if creative.get("id") and "thumbnail_url" in creative:
+                creative_results[creative["id"]] = creative
+
+        # De-duplicate creative_id(s) shared across ads and multi-get the ones without thumbnail_url
+        remaining_creative_ids = list(
+            dict.fromkeys(
+                (ad.get("creative") or {}).get("id")
+                for ad in batch_results.values()
+                if isinstance(ad, dict)
+                and (ad.get("creative") or {}).get("id")
+                and (ad.get("creative") or {}).get("id") not in creative_results
+            )
+        )
+
+        for batch_start in range(0, len(remaining_creative_ids), batch_size):
+            creative_results.update(
+                _multi_get(
+                    remaining_creative_ids[batch_start:batch_start + batch_size],
+                    "thumbnail_url",
+                )
+            )
+
+        msg = (
+            "✅ [EXTRACT] Successfully resolved "
+            f"{len(creative_results)} unique creative_id(s) for "
+            f"{len(ad_ids)} ad_id(s) of Facebook Ads ad creative."
+        )
+        print(msg)
+        logging.info(msg)
+
     # Make Facebook Ads API call for ad creative
     msg = (
         "🔍 [EXTRACT] Extracting Facebook Ads ad creative for account_id "
@@ -102,7 +280,13 @@ def extract_ad_creative(
         
     for ad_id in ad_ids:
         try:
-            ad = Ad(ad_id, api=ad_creative_api).api_get(fields=["creative"])
+            if batch_size or concurrency:
+                ad = batch_results[ad_id]
+                if isinstance(ad, FacebookRequestError):
+                    raise ad
+            else:
+                ad = Ad(ad_id, api=ad_creative_api).api_get(fields=["creative"])
+
             creative_id = ad.get("creative", {}).get("id")
 
             if not creative_id:
@@ -116,10 +300,15 @@ def extract_ad_creative(
                 )
                 continue
 
-            creative = AdCreative(
-                creative_id,
-                api=ad_creative_api,
-            ).api_get(fields=["thumbnail_url"])
+            if batch_size or concurrency:
+                creative = creative_results[creative_id]
+                if isinstance(creative, FacebookRequestError):
+                    raise creative
+            else:
+                creative = AdCreative(
+                    creative_id,
+                    api=ad_creative_api,
+                ).api_get(fields=["thumbnail_url"])
 
             rows.append(
                 {
@@ -13,10 +13,16 @@ from facebook_business.adobjects.ad import Ad
 from facebook_business.adobjects.adaccount import AdAccount
 from facebook_business.exceptions import FacebookRequestError
 
+from plugins.facebook_ads import internalFacebookAdsClient
+from plugins.facebook_ads_async import internalFacebookAdsAsyncClient
+
 def extract_ad_metadata(
     access_token: str,
     account_id: str,
     ad_ids: list[str],
+    batch_size: int | None = None,
+    client: internalFacebookAdsClient | None = None,
+    concurrency: int | None = None,
 ) -> pd.DataFrame:
     """
     Extract Facebook Ads ad metadata
@@ -24,7 +30,7 @@ def extract_ad_metadata(
     Workflow:
         1. Validate input ad_ids
         2. Make API call for AdAccount endpoint
-        3. Make API call for Ad(ad_id) endpoint
+        3. Make API call for Ad(ad_id) endpoint, Graph API batch of up to 50 ad_id(s) or asyncio requests bounded by concurrency
         4. Append extracted JSON data to list[dict]
         5. Enforce List[dict] to DataFrame
     ---------
@@ -73,12 +79,16 @@ def extract_ad_metadata(
         print(msg)
         logging.info(msg)
 
-        ad_metadata_session = FacebookSession(
-            access_token=access_token,
-            timeout=180,
-        )
+        if client:
+            ad_metadata_api = client.api()
+
+        else:
+            ad_metadata_session = FacebookSession(
+                access_token=access_token,
+                timeout=180,
+            )
 
-        ad_metadata_api = FacebookAdsApi(ad_metadata_session)
+            ad_metadata_api = FacebookAdsApi(ad_metadata_session)
 
         msg = (
             "✅ [EXTRACT] Successfully initialized Facebook Ads SDK client for account_id "
@@ -103,12 +113,18 @@ def extract_ad_metadata(
         print(msg)
         logging.info(msg)
 
-        account_info = AdAccount(
-            f"act_{account_id}",
-            api=ad_metadata_api,
-        ).api_get(fields=["name"])
-        
-        account_name = account_info.get("name")
+        # Account name is looked up once per run and shared by every extractor of the same account_id
+        def _get_account_name() -> str | None:
+            return AdAccount(
+                f"act_{account_id}",
+                api=ad_metadata_api,
+            ).api_get(fields=["name"]).get("name")
+
+        account_name = (
+            client.registry.run(("account_name", account_id), _get_account_name)
+            if client
+            else _get_account_name()
+        )
 
         msg = (
             "✅ [EXTRACT] Successfully extracted Facebook Ads account_name "
@@ -146,11 +162,13 @@ def extract_ad_metadata(
                 80000
             }
         ):
-            raise RuntimeError(
+            error = RuntimeError(
                 "⚠️ [EXTRACT] Failed to extract Facebook Ads account_name for account_id "
                 f"{account_id} due to API error "
                 f"{e} then this request is eligible to retry."
-            ) from e
+            )
+            error.retryable = True
+            raise error from e
 
         # Unexpected non-retryable API error
         raise RuntimeError(
@@ -159,6 +177,82 @@ def extract_ad_metadata(
             f"{e} then this request is not eligible to retry."
         ) from e
 
+    ad_metadata_fields = [
+        "id",
+        "name",
+        "adset_id",
+        "campaign_id",
+        "status",
+        "account_id",
+    ]
+
+    # Make Facebook Ads batch API call for ad metadata
+    batch_results: dict[str, dict | FacebookRequestError] = {}
+
+    if concurrency:
+        msg = (
+            "🔍 [EXTRACT] Requesting Facebook Ads ad metadata for account_id "
+            f"{account_id} on asyncio backend with up to "
+            f"{concurrency} in-flight request(s)..."
+        )
+        print(msg)
+        logging.info(msg)
+
+        batch_results = internalFacebookAdsAsyncClient(
+            access_token=access_token,
+            concurrency=concurrency,
+            governor=client.governor if client else None,
+        ).get_many(
+            node_ids=ad_ids,
+            fields=ad_metadata_fields,
+        )
+
+    elif batch_size:
+        batch_size = max(1, min(batch_size, 50))
+
+        msg = (
+            "🔍 [EXTRACT] Batching Facebook Ads ad metadata requests for account_id "
+            f"{account_id} with up to "
+            f"{batch_size} ad_id(s) per batch..."
+        )
+        print(msg)
+        logging.info(msg)
+
+        for batch_start in range(0, len(ad_ids), batch_size):
+            batch_ad_ids = ad_ids[batch_start:batch_start + batch_size]
+            ad_metadata_batch = ad_metadata_api.new_batch()
+
+            for ad_id in batch_ad_ids:
+                Ad(
+                    ad_id,
+                    api=ad_metadata_api,
+                ).api_get(
+                    fields=ad_metadata_fields,
+                    batch=ad_metadata_batch,
+                    success=lambda response, ad_id=ad_id: batch_results.update({ad_id: response.json()}),
+                    failure=lambda response, ad_id=ad_id: batch_results.update({ad_id: response.error()}),
+                )
+
+            try:
+                ad_metadata_batch.execute()
+
+            # Whole batch rejected then only its own ad_id(s) inherit the error and next batch still runs
+            except FacebookRequestError as e:
+                for ad_id in batch_ad_ids:
+                    batch_results[ad_id] = e
+                continue
+
+            # Sub-request without response is transient then eligible to retry
+            for ad_id in batch_ad_ids:
+                if ad_id not in batch_results:
+                    batch_results[ad_id] = FacebookRequestError(
+                        "Batch request returned no response",
+                        {"method": "GET", "path": ad_id},
+                        503,
+                        {},
+                        None,
+                    )
+
     # Make Facebook Ads API call for ad metadata
     msg = (
         "🔍 [EXTRACT] Extracting Facebook Ads ad metadata for account_id "
@@ -170,19 +264,15 @@ def extract_ad_metadata(
         
     for ad_id in ad_ids:
         try:
-            ad = Ad(
-                ad_id,
-                api=ad_metadata_api,
-            ).api_get(
-                fields=[
-                    "id",
-                    "name",
-                    "adset_id",
-                    "campaign_id",
-                    "status",
-                    "account_id",
-                ]
-            )
+            if batch_size or concurrency:
+                ad = batch_results[ad_id]
+                if isinstance(ad, FacebookRequestError):
+                    raise ad
+            else:
+                ad = Ad(
+                    ad_id,
+                    api=ad_metadata_api,
+                ).api_get(fields=ad_metadata_fields)
 
             rows.append(
                 {
@@ -13,10 +13,16 @@ from facebook_business.adobjects.adset import AdSet
 from facebook_business.adobjects.adaccount import AdAccount
 from facebook_business.exceptions import FacebookRequestError
 
+from plugins.facebook_ads import internalFacebookAdsClient
+from plugins.facebook_ads_async import internalFacebookAdsAsyncClient
+
 def extract_adset_metadata(
     access_token: str,
     account_id: str,
     adset_ids: list[str],
+    batch_size: int | None = None,
+    client: internalFacebookAdsClient | None = None,
+    concurrency: int | None = None,
 ) -> pd.DataFrame:
     """
     Extract Facebook Ads adset metadata
@@ -24,7 +30,7 @@ def extract_adset_metadata(
     Workflow:
         1. Validate input adset_ids
         2. Make API call for AdAccount endpoint
-        3. Make API call for AdSet(adset_id) endpoint
+        3. Make API call for AdSet(adset_id) endpoint, Graph API batch of up to 50 adset_id(s) or asyncio requests bounded by concurrency
         4. Append extracted JSON data to list[dict]
         5. Enforce List[dict] to DataFrame
     ---------
@@ -72,12 +78,16 @@ def extract_adset_metadata(
         print(msg)
         logging.info(msg)
 
-        adset_metadata_session = FacebookSession(
-            access_token=access_token,
-            timeout=180,
-        )
+        if client:
+            adset_metadata_api = client.api()
+
+        else:
+            adset_metadata_session = FacebookSession(
+                access_token=access_token,
+                timeout=180,
+            )
 
-        adset_metadata_api = FacebookAdsApi(adset_metadata_session)
+            adset_metadata_api = FacebookAdsApi(adset_metadata_session)
 
         msg = (
             "✅ [EXTRACT] Successfully initialized Facebook Ads SDK client for account_id "
@@ -102,12 +112,18 @@ def extract_adset_metadata(
         print(msg)
         logging.info(msg)
 
-        account_info = AdAccount(
-            f"act_{account_id}",
-            api=adset_metadata_api,
-        ).api_get(fields=["name"])
+        # Account name is looked up once per run and shared by every extractor of the same account_id
+        def _get_account_name() -> str | None:
+            return AdAccount(
+                f"act_{account_id}",
+                api=adset_metadata_api,
+            ).api_get(fields=["name"]).get("name")
 
-        account_name = account_info.get("name")
+        account_name = (
+            client.registry.run(("account_name", account_id), _get_account_name)
+            if client
+            else _get_account_name()
+        )
 
         msg = (
             "✅ [EXTRACT] Successfully extracted Facebook Ads account_name "
@@ -145,11 +161,13 @@ def extract_adset_metadata(
                 80000
             }
         ):
-            raise RuntimeError(
+            error = RuntimeError(
                 "⚠️ [EXTRACT] Failed to extract Facebook Ads account_name for account_id "
                 f"{account_id} due to API error "
                 f"{e} then this request is eligible to retry."
-            ) from e
+            )
+            error.retryable = True
+            raise error from e
 
         # Unexpected non-retryable API error
         raise RuntimeError(
@@ -158,6 +176,80 @@ def extract_adset_metadata(
             f"{e} then this request is not eligible to retry."
         ) from e
 
+    adset_metadata_fields = [
+        "id",
+        "name",
+        "campaign_id",
+        "account_id",
+    ]
+
+    # Make Facebook Ads batch API call for adset metadata
+    batch_results: dict[str, dict | FacebookRequestError] = {}
+
+    if concurrency:
+        msg = (
+            "🔍 [EXTRACT] Requesting Facebook Ads adset metadata for account_id "
+            f"{account_id} on asyncio backend with up to "
+            f"{concurrency} in-flight request(s)..."
+        )
+        print(msg)
+        logging.info(msg)
+
+        batch_results = internalFacebookAdsAsyncClient(
+            access_token=access_token,
+            concurrency=concurrency,
+            governor=client.governor if client else None,
+        ).get_many(
+            node_ids=adset_ids,
+            fields=adset_metadata_fields,
+        )
+
+    elif batch_size:
+        batch_size = max(1, min(batch_size, 50))
+
+        msg = (
+            "🔍 [EXTRACT] Batching Facebook Ads adset metadata requests for account_id "
+            f"{account_id} with up to "
+            f"{batch_size} adset_id(s) per batch..."
+        )
+        print(msg)
+        logging.info(msg)
+
+        for batch_start in range(0, len(adset_ids), batch_size):
+            batch_adset_ids = adset_ids[batch_start:batch_start + batch_size]
+            adset_metadata_batch = adset_metadata_api.new_batch()
+
+            for adset_id in batch_adset_ids:
+                AdSet(
+                    adset_id,
+                    api=adset_metadata_api,
+                ).api_get(
+                    fields=adset_metadata_fields,
+                    batch=adset_metadata_batch,
+                    success=lambda response, adset_id=adset_id: batch_results.update({adset_id: response.json()}),
+                    failure=lambda response, adset_id=adset_id: batch_results.update({adset_id: response.error()}),
+                )
+
+            try:
+                adset_metadata_batch.execute()
+
+            # Whole batch rejected then only its own adset_id(s) inherit the error and next batch still runs
+            except FacebookRequestError as e:
+                for adset_id in batch_adset_ids:
+                    batch_results[adset_id] = e
+                continue
+
+            # Sub-request without response is transient then eligible to retry
+            for adset_id in batch_adset_ids:
+                if adset_id not in batch_results:
+                    batch_results[adset_id] = FacebookRequestError(
+                        "Batch request returned no response",
+                        {"method": "GET", "path": adset_id},
+                        503,
+                        {},
+                        None,
+                    )
+
     # Make Facebook Ads API call for adset metadata
     msg = (
         "🔍 [EXTRACT] Extracting Facebook Ads adset metadata for account_id "
@@ -169,17 +261,15 @@ def extract_adset_metadata(
 
     for adset_id in adset_ids:
         try:
-            adset = AdSet(
-                adset_id,
-                api=adset_metadata_api,
-            ).api_get(
-                fields=[
-                    "id",
-                    "name",
-                    "campaign_id",
-                    "account_id",
-                ]
-            )
+            if batch_size or concurrency:
+                adset = batch_results[adset_id]
+                if isinstance(adset, FacebookRequestError):
+                    raise adset
+            else:
+                adset = AdSet(
+                    adset_id,
+                    api=adset_metadata_api,
+                ).api_get(fields=adset_metadata_fields)
 
             rows.append(
                 {
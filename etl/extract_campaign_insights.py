@@ -3,34 +3,52 @@ from pathlib import Path
 ROOT_FOLDER_LOCATION = Path(__file__).resolve().parents[2]
 sys.path.append(str(ROOT_FOLDER_LOCATION))
 
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
 import time
 import logging
 import pandas as pd
+import pyarrow as pa
 
 from facebook_business.api import FacebookAdsApi
 from facebook_business.session import FacebookSession
 from facebook_business.adobjects.adaccount import AdAccount
+from facebook_business.adobjects.adreportrun import AdReportRun
 from facebook_business.exceptions import FacebookRequestError
 
+from plugins.facebook_ads import internalFacebookAdsClient
+
 def extract_campaign_insights(
     access_token: str,
     account_id: str,
     start_date: str,
     end_date: str,
-) -> pd.DataFrame:
+    async_chunk_days: int | None = None,
+    time_increment: int | None = None,
+    client: internalFacebookAdsClient | None = None,
+    chunk_size: int | None = None,
+    engine: str = "pandas",
+    names: bool = False,
+) -> pd.DataFrame | pa.Table | Iterator[pd.DataFrame | pa.Table]:
     """
     Extract Facebook Ads campaign insights
     ---------
     Workflow:
         1. Validate input account_id
         2. Validate input start_date and end_date
-        3. Make API call for AdAccount(account_id).get_insights endpoint
-        4. Append extracted JSON data to list[dict]
-        5. Enforce List[dict] to DataFrame
+        3. Request account / entity name field(s) if names
+        4. Make API call for AdAccount(account_id).get_insights endpoint with optional daily time_increment
+        5. Submit AdReportRun job(s) per async_chunk_days window and poll with backoff if async
+        6. Append extracted JSON data to list[dict]
+        7. Enforce List[dict] to DataFrame or yield DataFrame chunk(s) of chunk_size row(s) if streaming
     ---------
     Returns:
         1. DataFrame:
             Flattened campaign insights records
+        2. Iterator[DataFrame]:
+            Flattened campaign insights records per cursor page if chunk_size
+        3. pa.Table:
+            Flattened campaign insights records built straight from cursor rows if engine is arrow
     """
 
     start_time = time.time()
@@ -47,11 +65,24 @@ def extract_campaign_insights(
         "date_stop"
     ]
 
+    # Name field(s) let metadata be built from insights row(s) instead of per-object call(s)
+    if names:
+        fields += [
+            "account_name",
+            "campaign_name",
+        ]
+
     params = {
         "time_range": {"since": start_date, "until": end_date},
         "level": "campaign",
     }
 
+    if time_increment:
+        params["time_increment"] = time_increment
+
+    if chunk_size:
+        params["limit"] = chunk_size
+
     # Initialize Facebook Ads SDK client
     try:
         msg = (
@@ -61,12 +92,16 @@ def extract_campaign_insights(
         print(msg)
         logging.info(msg)
 
-        campaign_insights_session = FacebookSession(
-            access_token=access_token,
-            timeout=180,
-        )
+        if client:
+            campaign_insights_api = client.api()
+
+        else:
+            campaign_insights_session = FacebookSession(
+                access_token=access_token,
+                timeout=180,
+            )
 
-        campaign_insights_api = FacebookAdsApi(campaign_insights_session)
+            campaign_insights_api = FacebookAdsApi(campaign_insights_session)
 
         msg = (
             "✅ [EXTRACT] Successfully initialized Facebook Ads SDK client for account_id "
@@ -98,16 +133,45 @@ def extract_campaign_insights(
             else f"act_{account_id}"
         )
 
-        insights = AdAccount(
-            account_id_prefixed,
-            api=campaign_insights_api,
-        ).get_insights(
-            fields=fields,
-            params=params,
-        )
+        if async_chunk_days:
+            insights = _extract_async_insights(
+                account=AdAccount(
+                    account_id_prefixed,
+                    api=campaign_insights_api,
+                ),
+                fields=fields,
+                params=params,
+                start_date=start_date,
+                end_date=end_date,
+                chunk_days=async_chunk_days,
+                page_size=chunk_size or 500,
+            )
 
-        rows = [dict(row) for row in insights]
-        df = pd.DataFrame(rows)
+        else:
+            insights = AdAccount(
+                account_id_prefixed,
+                api=campaign_insights_api,
+            ).get_insights(
+                fields=fields,
+                params=params,
+            )
+
+        # Streaming mode yields one bounded DataFrame per cursor page instead of holding the whole cursor
+        if chunk_size:
+            return _stream_insights(
+                insights=insights,
+                chunk_size=chunk_size,
+                account_id=account_id,
+                start_date=start_date,
+                end_date=end_date,
+                engine=engine,
+            )
+
+        # Arrow engine builds pa.Table straight from cursor rows without pandas
+        if engine == "arrow":
+            return pa.Table.from_pylist([dict(row) for row in insights])
+
+        df = pd.DataFrame([dict(row) for row in insights])
 
         msg = (
             "✅ [EXTRACT] Successfully extracted "
@@ -156,17 +220,17 @@ def extract_campaign_insights(
                 80000
             }
         ):
-            retryable = True
-            raise RuntimeError(
+            error = RuntimeError(
                 "⚠️ [EXTRACT] Failed to extract Facebook Ads campaign insights for account_id "
                 f"{account_id} from "
                 f"{start_date} to "
                 f"{end_date} due to API error "
                 f"{e} then this request is eligible to retry."
-            ) from e
+            )
+            error.retryable = True
+            raise error from e
 
         # Unexpected non-retryable API error
-        retryable = False
         raise RuntimeError(
             "❌ [EXTRACT] Failed to extract Facebook Ads campaign insights for account_id "
             f"{account_id} from "
@@ -177,11 +241,253 @@ def extract_campaign_insights(
        
         # Unknown non-retryable error      
     except Exception as e:
-        retryable = False
+        # Failed or timed out report job(s) of async insights keep their retry classification
+        if getattr(e, "retryable", False):
+            raise
+
         raise RuntimeError(
             "❌ [EXTRACT] Failed to extract Facebook Ads campaign insights for account_id "
             f"{account_id} from "
             f"{start_date} to "
             f"{end_date} due to "
             f"{e}."
-        ) from e
\ No newline at end of file
+        ) from e
+
+def _extract_async_insights(
+    *,
+    account: AdAccount,
+    fields: list[str],
+    params: dict,
+    start_date: str,
+    end_date: str,
+    chunk_days: int,
+    poll_timeout: int = 1800,
+    page_size: int = 500,
+) -> Iterator[dict]:
+    """
+    Extract Facebook Ads campaign insights with asynchronous AdReportRun job(s)
+    ---------
+    Workflow:
+        1. Split start_date to end_date into chunk_days window(s)
+        2. Submit one AdReportRun job per window so they run server-side together
+        3. Poll every pending job with exponential backoff until completed
+        4. Stream result pages of every completed job as dict
+    ---------
+    Returns:
+        1. Iterator[dict]:
+            Raw campaign insights records of all window(s)
+    """
+
+    window_start = datetime.strptime(start_date, "%Y-%m-%d").date()
+    window_end = datetime.strptime(end_date, "%Y-%m-%d").date()
+
+    report_runs: list[tuple[str, str, AdReportRun]] = []
+
+    # Submit asynchronous report job(s)
+    while window_start <= window_end:
+        window_stop = min(window_start + timedelta(days=max(1, chunk_days) - 1), window_end)
+        since = window_start.strftime("%Y-%m-%d")
+        until = window_stop.strftime("%Y-%m-%d")
+
+        report_run = account.get_insights(
+            fields=fields,
+            params={
+                **params,
+                "time_range": {"since": since, "until": until},
+            },
+            is_async=True,
+        )
+        report_runs.append((since, until, report_run))
+
+        msg = (
+            "🔍 [EXTRACT] Submitted Facebook Ads campaign insights report_run_id "
+            f"{report_run.get_id()} from "
+            f"{since} to "
+            f"{until}..."
+        )
+        print(msg)
+        logging.info(msg)
+
+        window_start = window_stop + timedelta(days=1)
+
+    # Poll asynchronous report job(s) with backoff
+    pending = list(report_runs)
+    poll_wait = 2
+    poll_deadline = time.time() + poll_timeout
+
+    while pending:
+        time.sleep(poll_wait)
+
+        for since, until, report_run in list(pending):
+            report_run.api_get(
+                fields=[
+                    AdReportRun.Field.async_status,
+                    AdReportRun.Field.async_percent_completion,
+                ]
+            )
+            async_status = report_run.get(AdReportRun.Field.async_status)
+
+            if async_status == "Job Completed":
+                pending.remove((since, until, report_run))
+                continue
+
+            # Failed or skipped report job is transient server-side then eligible to retry
+            if async_status in {"Job Failed", "Job Skipped"}:
+                error = RuntimeError(
+                    "⚠️ [EXTRACT] Failed to extract Facebook Ads campaign insights from "
+                    f"{since} to "
+                    f"{until} due to report_run_id "
+                    f"{report_run.get_id()} returned "
+                    f"{async_status} status then this request is eligible to retry."
+                )
+                error.retryable = True
+                raise error
+
+        if pending and time.time() > poll_deadline:
+            error = RuntimeError(
+                "⚠️ [EXTRACT] Failed to extract Facebook Ads campaign insights due to "
+                f"{len(pending)} report job(s) not completed within "
+                f"{poll_timeout} second(s) then this request is eligible to retry."
+            )
+            error.retryable = True
+            raise error
+
+        poll_wait = min(poll_wait * 2, 30)
+
+    # Stream result pages of completed report job(s)
+    for since, until, report_run in report_runs:
+        for row in report_run.get_insights(params={"limit": page_size}):
+            yield dict(row)
+
+def _stream_insights(
+    *,
+    insights: Iterable,
+    chunk_size: int,
+    account_id: str,
+    start_date: str,
+    end_date: str,
+    engine: str = "pandas",
+) -> Iterator[pd.DataFrame | pa.Table]:
+    """
+    Stream Facebook Ads campaign insights
+    ---------
+    Workflow:
+        1. Iterate insights cursor page by page
+        2. Yield DataFrame or pa.Table chunk once chunk_size row(s) are buffered
+        3. Yield the last partial chunk
+        4. Classify API error raised while paging for retry
+    ---------
+    Returns:
+        1. Iterator[DataFrame | pa.Table]:
+            Flattened campaign insights records of up to chunk_size row(s)
+    """
+
+    start_time = time.time()
+    rows: list[dict] = []
+    rows_output = 0
+
+    try:
+        for row in insights:
+            rows.append(dict(row))
+
+            if len(rows) < chunk_size:
+                continue
+
+            if engine == "arrow":
+                df = pa.Table.from_pylist(rows)
+                rows = []
+                rows_output += len(df)
+
+                yield df
+                continue
+
+            df = pd.DataFrame(rows)
+            rows = []
+            rows_output += len(df)
+
+            df.retryable = False
+            df.time_elapsed = round(time.time() - start_time, 2)
+            df.rows_input = None
+            df.rows_output = len(df)
+
+            yield df
+
+        if rows and engine == "arrow":
+            df = pa.Table.from_pylist(rows)
+            rows = []
+            rows_output += len(df)
+
+            yield df
+
+        elif rows:
+            df = pd.DataFrame(rows)
+            rows = []
+            rows_output += len(df)
+
+            df.retryable = False
+            df.time_elapsed = round(time.time() - start_time, 2)
+            df.rows_input = None
+            df.rows_output = len(df)
+
+            yield df
+
+        msg = (
+            "✅ [EXTRACT] Successfully streamed "
+            f"{rows_output} row(s) of Facebook Ads campaign insights for account_id "
+            f"{account_id} from "
+            f"{start_date} to "
+            f"{end_date}."
+        )
+        print(msg)
+        logging.info(msg)
+
+    except FacebookRequestError as e:
+        api_error_code = None
+        http_status = None
+
+        try:
+            api_error_code = e.api_error_code()
+            http_status = e.http_status()
+        except Exception:
+            pass
+
+        # Expired token error
+        if api_error_code == 190:
+            raise RuntimeError(
+                "❌ [EXTRACT] Failed to stream Facebook Ads campaign insights for account_id "
+                f"{account_id} from "
+                f"{start_date} to "
+                f"{end_date} due to expired or invalid access token then manual token refresh is required."
+            ) from e
+
+        # Unexpected retryable API error
+        if (
+            (http_status and http_status >= 500)
+            or api_error_code in {
+                1, 
+                2, 
+                4, 
+                17, 
+                80000
+            }
+        ):
+            error = RuntimeError(
+                "⚠️ [EXTRACT] Failed to stream Facebook Ads campaign insights for account_id "
+                f"{account_id} from "
+                f"{start_date} to "
+                f"{end_date} after "
+                f"{rows_output} row(s) due to API error "
+                f"{e} then this request is eligible to retry."
+            )
+            error.retryable = True
+            raise error from e
+
+        # Unexpected non-retryable API error
+        raise RuntimeError(
+            "❌ [EXTRACT] Failed to stream Facebook Ads campaign insights for account_id "
+            f"{account_id} from "
+            f"{start_date} to "
+            f"{end_date} after "
+            f"{rows_output} row(s) due to API error "
+            f"{e} then this request is not eligible to retry."
+        ) from e
@@ -13,18 +13,24 @@ from facebook_business.adobjects.campaign import Campaign
 from facebook_business.adobjects.adaccount import AdAccount
 from facebook_business.exceptions import FacebookRequestError
 
+from plugins.facebook_ads import internalFacebookAdsClient
+from plugins.facebook_ads_async import internalFacebookAdsAsyncClient
+
 def extract_campaign_metadata(
     access_token: str,
     account_id: str,
     campaign_ids: list[str],
+    batch_size: int | None = None,
+    client: internalFacebookAdsClient | None = None,
+    concurrency: int | None = None,
 ) -> pd.DataFrame:
     """
     Extract Facebook Ads campaign metadata
     ---------
     Workflow:
-        1. Validate input campaign_ids
+        1. Validate input campaign_ids and claim them per account_id in client.registry
         2. Make API call for AdAccount endpoint
-        3. Make API call for Campaign(campaign_id) endpoint
+        3. Make API call for Campaign(campaign_id) endpoint, Graph API batch of up to 50 campaign_id(s) or asyncio requests bounded by concurrency
         4. Append extracted JSON data to list[dict]
         5. Enforce List[dict] to DataFrame
     ---------
@@ -33,6 +39,74 @@ def extract_campaign_metadata(
             Flattened campaign metadata records
     """
 
+    # Campaign_id(s) of the same account_id are claimed once per run, so prefetch and metadata stage(s) of every DAG share one request
+    if client and campaign_ids:
+        requested_campaign_ids = set(campaign_ids)
+
+        dfs_campaign_metadata = client.registry.run_many(
+            ("extract_campaign_metadata", account_id),
+            campaign_ids,
+            lambda new_campaign_ids: _extract_campaign_metadata(
+                access_token=access_token,
+                account_id=account_id,
+                campaign_ids=new_campaign_ids,
+                batch_size=batch_size,
+                client=client,
+                concurrency=concurrency,
+            ),
+            failed=lambda df: df.failed_campaign_ids,
+        )
+
+        # Row of a unit that succeeded wins over placeholder row of an earlier unit that failed the same campaign_id
+        df = pd.concat(
+            [
+                df_unit[df_unit["campaign_id"].isin(requested_campaign_ids - set(df_unit.failed_campaign_ids))]
+                for df_unit in dfs_campaign_metadata
+            ]
+            + [
+                df_unit[df_unit["campaign_id"].isin(requested_campaign_ids & set(df_unit.failed_campaign_ids))]
+                for df_unit in dfs_campaign_metadata
+            ],
+            ignore_index=True,
+        ).drop_duplicates(subset=["campaign_id"], keep="first").reset_index(drop=True)
+
+        succeeded_campaign_ids = set().union(
+            *(set(df_unit["campaign_id"]) - set(df_unit.failed_campaign_ids) for df_unit in dfs_campaign_metadata)
+        )
+        failed_campaign_ids = [
+            campaign_id
+            for campaign_id in dict.fromkeys(
+                campaign_id for df_unit in dfs_campaign_metadata for campaign_id in df_unit.failed_campaign_ids
+            )
+            if campaign_id in requested_campaign_ids and campaign_id not in succeeded_campaign_ids
+        ]
+
+        df.failed_campaign_ids = failed_campaign_ids
+        # Only retryable error(s) leave failed campaign_id(s) while non-retryable error(s) raise
+        df.retryable = bool(failed_campaign_ids)
+        df.time_elapsed = round(sum(df_unit.time_elapsed for df_unit in dfs_campaign_metadata), 2)
+        df.rows_input = len(campaign_ids)
+        df.rows_output = len(df)
+        return df
+
+    return _extract_campaign_metadata(
+        access_token=access_token,
+        account_id=account_id,
+        campaign_ids=campaign_ids,
+        batch_size=batch_size,
+        client=client,
+        concurrency=concurrency,
+    )
+
+def _extract_campaign_metadata(
+    access_token: str,
+    account_id: str,
+    campaign_ids: list[str],
+    batch_size: int | None = None,
+    client: internalFacebookAdsClient | None = None,
+    concurrency: int | None = None,
+) -> pd.DataFrame:
+
     start_time = time.time()
     rows: list[dict] = []
     failed_campaign_ids: list[str] = []
@@ -72,12 +146,16 @@ def extract_campaign_metadata(
         print(msg)
         logging.info(msg)
 
-        campaign_metadata_session = FacebookSession(
-            access_token=access_token,
-            timeout=180,
-        )
+        if client:
+            campaign_metadata_api = client.api()
+
+        else:
+            campaign_metadata_session = FacebookSession(
+                access_token=access_token,
+                timeout=180,
+            )
 
-        campaign_metadata_api = FacebookAdsApi(campaign_metadata_session)
+            campaign_metadata_api = FacebookAdsApi(campaign_metadata_session)
 
         msg = (
             "✅ [EXTRACT] Successfully initialized Facebook Ads SDK client for account_id "
@@ -102,12 +180,18 @@ def extract_campaign_metadata(
         print(msg)
         logging.info(msg)
 
-        account_info = AdAccount(
-            f"act_{account_id}",
-            api=campaign_metadata_api,
-        ).api_get(fields=["name"])
-        
-        account_name = account_info.get("name")
+        # Account name is looked up once per run and shared by every extractor of the same account_id
+        def _get_account_name() -> str | None:
+            return AdAccount(
+                f"act_{account_id}",
+                api=campaign_metadata_api,
+            ).api_get(fields=["name"]).get("name")
+
+        account_name = (
+            client.registry.run(("account_name", account_id), _get_account_name)
+            if client
+            else _get_account_name()
+        )
 
         msg = (
             "✅ [EXTRACT] Successfully extracted Facebook Ads account_name "
@@ -145,11 +229,13 @@ def extract_campaign_metadata(
                 80000
             }
         ):
-            raise RuntimeError(
+            error = RuntimeError(
                 "⚠️ [EXTRACT] Failed to extract Facebook Ads account_name for account_id "
                 f"{account_id} due to API error "
                 f"{e} then this request is eligible to retry."
-            ) from e
+            )
+            error.retryable = True
+            raise error from e
 
         # Unexpected non-retryable API error
         raise RuntimeError(
@@ -158,6 +244,80 @@ def extract_campaign_metadata(
             f"{e} then this request is not eligible to retry."
         ) from e
 
+    campaign_metadata_fields = [
+        "id",
+        "name",
+        "status",
+        "account_id",
+    ]
+
+    # Make Facebook Ads batch API call for campaign metadata
+    batch_results: dict[str, dict | FacebookRequestError] = {}
+
+    if concurrency:
+        msg = (
+            "🔍 [EXTRACT] Requesting Facebook Ads campaign metadata for account_id "
+            f"{account_id} on asyncio backend with up to "
+            f"{concurrency} in-flight request(s)..."
+        )
+        print(msg)
+        logging.info(msg)
+
+        batch_results = internalFacebookAdsAsyncClient(
+            access_token=access_token,
+            concurrency=concurrency,
+            governor=client.governor if client else None,
+        ).get_many(
+            node_ids=campaign_ids,
+            fields=campaign_metadata_fields,
+        )
+
+    elif batch_size:
+        batch_size = max(1, min(batch_size, 50))
+
+        msg = (
+            "🔍 [EXTRACT] Batching Facebook Ads campaign metadata requests for account_id "
+            f"{account_id} with up to "
+            f"{batch_size} campaign_id(s) per batch..."
+        )
+        print(msg)
+        logging.info(msg)
+
+        for batch_start in range(0, len(campaign_ids), batch_size):
+            batch_campaign_ids = campaign_ids[batch_start:batch_start + batch_size]
+            campaign_metadata_batch = campaign_metadata_api.new_batch()
+
+            for campaign_id in batch_campaign_ids:
+                Campaign(
+                    campaign_id,
+                    api=campaign_metadata_api,
+                ).api_get(
+                    fields=campaign_metadata_fields,
+                    batch=campaign_metadata_batch,
+                    success=lambda response, campaign_id=campaign_id: batch_results.update({campaign_id: response.json()}),
+                    failure=lambda response, campaign_id=campaign_id: batch_results.update({campaign_id: response.error()}),
+                )
+
+            try:
+                campaign_metadata_batch.execute()
+
+            # Whole batch rejected then only its own campaign_id(s) inherit the error and next batch still runs
+            except FacebookRequestError as e:
+                for campaign_id in batch_campaign_ids:
+                    batch_results[campaign_id] = e
+                continue
+
+            # Sub-request without response is transient then eligible to retry
+            for campaign_id in batch_campaign_ids:
+                if campaign_id not in batch_results:
+                    batch_results[campaign_id] = FacebookRequestError(
+                        "Batch request returned no response",
+                        {"method": "GET", "path": campaign_id},
+                        503,
+                        {},
+                        None,
+                    )
+
     # Make Facebook Ads API call for campaign metadata
     msg = (
         "🔍 [EXTRACT] Extracting Facebook Ads campaign metadata for account_id "
@@ -169,17 +329,15 @@ def extract_campaign_metadata(
         
     for campaign_id in campaign_ids:
         try:
-            campaign = Campaign(
-                campaign_id,
-                api=campaign_metadata_api
-            ).api_get(
-                fields=[
-                    "id",
-                    "name",
-                    "status",
-                    "account_id",
-                ]
-            )
+            if batch_size or concurrency:
+                campaign = batch_results[campaign_id]
+                if isinstance(campaign, FacebookRequestError):
+                    raise campaign
+            else:
+                campaign = Campaign(
+                    campaign_id,
+                    api=campaign_metadata_api,
+                ).api_get(fields=campaign_metadata_fields)
 
             rows.append(
                 {
@@ -0,0 +1,104 @@
+import sys
+from pathlib import Path
+ROOT_FOLDER_LOCATION = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT_FOLDER_LOCATION))
+
+import logging
+import pandas as pd
+import pyarrow as pa
+
+_NAME_COLUMNS = [
+    "account_name",
+    "campaign_name",
+    "adset_name",
+    "ad_name",
+]
+
+_METADATA_LAYOUT = {
+    "ad": [
+        "ad_id",
+        "ad_name",
+        "adset_id",
+        "campaign_id",
+        "status",
+        "account_id",
+        "account_name",
+    ],
+    "adset": [
+        "adset_id",
+        "adset_name",
+        "campaign_id",
+        "account_id",
+        "account_name",
+    ],
+    "campaign": [
+        "campaign_id",
+        "campaign_name",
+        "status",
+        "account_id",
+        "account_name",
+    ],
+}
+
+def extract_insights_metadata(
+    df: pd.DataFrame | pa.Table,
+) -> tuple[pd.DataFrame | pa.Table, dict[str, pd.DataFrame]]:
+    """
+    Extract Facebook Ads ad, adset and campaign metadata from insights rows
+    ---------
+    Workflow:
+        1. Validate name column(s) requested with extract_*_insights(names=True)
+        2. Build ad, adset and campaign metadata with the same columns as extract_*_metadata
+        3. Keep last name per entity id so the latest date wins
+        4. Leave status as None because insights endpoint cannot return it
+        5. Drop name column(s) so insights table schema stays unchanged
+    ---------
+    Returns:
+        1. DataFrame | pa.Table:
+            Insights records without name columns
+        2. dict[str, DataFrame]:
+            "ad", "adset" and "campaign" metadata for every entity whose name column is present
+    """
+
+    is_arrow = isinstance(df, pa.Table)
+    columns = df.column_names if is_arrow else list(df.columns)
+    name_cols = [col for col in _NAME_COLUMNS if col in columns]
+
+    if not name_cols:
+        return df, {}
+
+    entity_cols = [
+        col for col in dict.fromkeys(col for layout in _METADATA_LAYOUT.values() for col in layout)
+        if col in columns
+    ]
+    rows = df.select(entity_cols).to_pandas() if is_arrow else df[entity_cols]
+
+    metadata: dict[str, pd.DataFrame] = {}
+
+    for entity, layout in _METADATA_LAYOUT.items():
+        if f"{entity}_id" not in rows.columns or f"{entity}_name" not in rows.columns:
+            continue
+
+        entity_metadata = (
+            rows.reindex(columns=layout)
+            .dropna(subset=[f"{entity}_id"])
+            .drop_duplicates(subset=[f"{entity}_id"], keep="last")
+            .reset_index(drop=True)
+        )
+
+        if "status" in layout:
+            entity_metadata["status"] = None
+
+        metadata[entity] = entity_metadata.astype(object).where(entity_metadata.notna(), None)
+
+    msg = (
+        "✅ [EXTRACT] Successfully extracted Facebook Ads "
+        f"{', '.join(f'{len(frame)} {entity}' for entity, frame in metadata.items())} metadata row(s) from "
+        f"{len(rows)} insights row(s)."
+    )
+    print(msg)
+    logging.info(msg)
+
+    df = df.drop_columns(name_cols) if is_arrow else df.drop(columns=name_cols)
+
+    return df, metadata
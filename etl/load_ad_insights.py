@@ -5,13 +5,17 @@ sys.path.append(str(ROOT_FOLDER_LOCATION))
 
 import logging
 import pandas as pd
+import pyarrow as pa
 
 from plugins.google_bigquery import internalGoogleBigqueryLoader
 
 def load_ad_insights(
     *,
-    df: pd.DataFrame,
+    df: pd.DataFrame | pa.Table,
     direction: str,
+    mode: str = "upsert_merge",
+    backend: str = "load_job",
+    staging: dict[str, dict] | None = None,
 ) -> None:
     """
     Load Facebook Ads ad insights
@@ -20,14 +24,14 @@ def load_ad_insights(
         1. Validate input DataFrame
         2. Validate output direction for Google BigQuery
         3. Set primary key(s) to date
-        4. Use UPSERT mode with parameterized query for deduplication
-        5. Make internalGoogleBigQueryLoader API call
+        4. Use STAGE mode to append streamed chunk(s) to the pending stream of the monthly staging table held in the caller's staging dict, UPSERT_MERGE mode on date key to commit and merge them with one MERGE or REPLACE_PARTITION mode with WRITE_TRUNCATE per daily partition
+        5. Make internalGoogleBigQueryLoader API call with batch load job or Storage Write API backend
     ---------
     Returns:
         None
     """    
 
-    if df.empty:
+    if len(df) == 0:
         msg = ("⚠️ [LOADER] Empty Facebook Ads ad insights Dataframe then loading will be suspended.")
         print(msg)
         logging.warning(msg)
@@ -44,7 +48,7 @@ def load_ad_insights(
     loader.load(
         df=df,
         direction=direction,
-        mode="upsert",
+        mode=mode,
         keys=["date"],
         partition={
             "field": "date"
@@ -52,4 +56,6 @@ def load_ad_insights(
         cluster=[
             "ad_id"
         ],
+        backend=backend,
+        staging=staging,
     )
\ No newline at end of file
@@ -12,6 +12,7 @@ def load_ad_metadata(
     *,
     df: pd.DataFrame,
     direction: str,
+    backend: str = "load_job",
 ) -> None:
     """
     Load Facebook Ads ad metadata
@@ -20,8 +21,8 @@ def load_ad_metadata(
         1. Validate input DataFrame
         2. Validate output direction for Google BigQuery
         3. Set primary key(s) to account_id and ad_id
-        4. Use UPSERT mode with temporary table for deduplication
-        5. Make internalGoogleBigQueryLoader API call
+        4. Use UPSERT_MERGE mode with staging table and one atomic MERGE for deduplication
+        5. Make internalGoogleBigQueryLoader API call with batch load job or Storage Write API backend
     ---------
     Returns:
         None
@@ -44,7 +45,7 @@ def load_ad_metadata(
     loader.load(
         df=df,
         direction=direction,
-        mode="upsert",
+        mode="upsert_merge",
         keys=[
             "account_id", 
             "ad_id"
@@ -53,4 +54,5 @@ def load_ad_metadata(
         cluster=[
             "ad_id"
         ],
+        backend=backend,
     )
\ No newline at end of file
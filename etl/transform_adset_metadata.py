@@ -6,8 +6,33 @@ sys.path.append(str(ROOT_FOLDER_LOCATION))
 import logging
 import pandas as pd
 
+from plugins.compact_schema import internalCompactSchema
+from plugins.facebook_ads_naming import (
+    ADSET_NAME_LAYOUT,
+    internalFacebookAdsNamingParser,
+)
+
+_NAME_PARSER = internalFacebookAdsNamingParser(layout=ADSET_NAME_LAYOUT)
+_COMPACT_SCHEMA = internalCompactSchema(
+    schema={
+        "account_id": "category",
+        "account_name": "category",
+        "campaign_id": "category",
+        "location": "category",
+        "gender": "category",
+        "age": "category",
+        "audience": "category",
+        "format": "category",
+        "strategy": "category",
+        "type": "category",
+        "pillar": "category",
+        "content": "category",
+    }
+)
+
 def transform_adset_metadata(
-    df: pd.DataFrame
+    df: pd.DataFrame,
+    engine: str = "pandas",
 ) -> pd.DataFrame:
     """
     Transform Facebook Ads adset metadata
@@ -15,7 +40,8 @@ def transform_adset_metadata(
     Workflow:
         1. Validate input
         2. Validate missing columns
-        3. Assign enriched columns
+        3. Assign enriched columns from naming convention parser with pandas or Polars lazy engine
+        4. Apply compact schema
     ---------
     Returns:
         1. DataFrame:
@@ -49,17 +75,12 @@ def transform_adset_metadata(
         )
 
     df = df.copy()
-    df = df.assign(
-        location=lambda df: df["adset_name"].fillna("").str.split("|").str[0].fillna("unknown"),
-        gender=lambda df: df["adset_name"].fillna("").str.split("|").str[1].fillna("unknown"),
-        age=lambda df: df["adset_name"].fillna("").str.split("|").str[2].fillna("unknown"),
-        audience=lambda df: df["adset_name"].fillna("").str.split("|").str[3].fillna("unknown"),
-        format=lambda df: df["adset_name"].fillna("").str.split("|").str[4].fillna("unknown"),
-        strategy=lambda df: df["adset_name"].fillna("").str.split("|").str[5].fillna("unknown"),
-        type=lambda df: df["adset_name"].fillna("").str.split("|").str[6].fillna("unknown"),
-        pillar=lambda df: df["adset_name"].fillna("").str.split("|").str[7].fillna("unknown"),
-        content=lambda df: df["adset_name"].fillna("").str.split("|").str[8].fillna("unknown")
-    )  
+
+    # Split each distinct adset_name once with shared naming convention layout
+    df = df.assign(**_NAME_PARSER.parse(df["adset_name"], engine=engine))
+
+    # Apply compact schema
+    df = _COMPACT_SCHEMA.apply(df)
 
     msg = (
         "✅ [TRANSFORM] Successfully transformed "
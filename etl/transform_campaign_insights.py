@@ -4,29 +4,78 @@ ROOT_FOLDER_LOCATION = Path(__file__).resolve().parents[2]
 sys.path.append(str(ROOT_FOLDER_LOCATION))
 
 import logging
-import json
-import re
 import numpy as np
 import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from plugins.compact_schema import internalCompactSchema
+from plugins.facebook_ads_actions import internalFacebookAdsActionsParser
+
+_ACTIONS_PARSER = internalFacebookAdsActionsParser()
+_MAPPING_GOAL_ACTION = {
+    "REACH": "reach",
+    "IMPRESSIONS": "impressions",
+    "AD_RECALL_LIFT": "estimated_ad_recall_lift",
+    "LANDING_PAGE_VIEWS": "landing_page_view",
+    "LINK_CLICKS": "link_click",
+    "PAGE_LIKES": "like",
+    "VIDEO_VIEWS": "video_view",
+    "POST_ENGAGEMENT": "post_engagement",
+    "ENGAGED_USERS": "post_engagement",
+    "MESSAGES": "onsite_conversion.messaging_conversation_started_7d",
+    "REPLIES": "onsite_conversion.messaging_conversation_started_7d",
+    "MESSAGING_CONVERSATIONS_REPLIES": "onsite_conversion.messaging_conversation_started_7d",
+    "LEAD_GENERATION": "lead",
+    "THRUPLAY": "video_view",
+    "APP_INSTALLS": "mobile_app_install",
+    "OFFSITE_CONVERSIONS": "purchase",
+    "CONVERSIONS": "purchase",
+    "VALUE": "value",
+    "QUALITY_LEAD": "lead",
+}
+_COMPACT_SCHEMA = internalCompactSchema(
+    schema={
+        "account_id": "category",
+        "campaign_id": "category",
+        "result_type": "category",
+        "month": "category",
+        "impressions": "integer",
+        "clicks": "integer",
+        "result": "integer",
+        "messaging_conversations_started": "integer",
+        "purchase": "integer",
+        "year": "integer",
+    }
+)
 
 def transform_campaign_insights(
-    df: pd.DataFrame
-) -> pd.DataFrame:
+    df: pd.DataFrame | pa.Table,
+    engine: str = "pandas",
+) -> pd.DataFrame | pa.Table:
     """
     Transform Facebook Ads campaign insights
     ---------
     Workflow:
         1. Validate input
         2. Parse actions
-        3. Resolve results
+        3. Resolve results with pandas or Polars lazy engine
         4. Normalize date dimension
         5. Enforce numeric schema
+        6. Apply compact schema
     ---------
     Returns:
         1. DataFrame:
             Enforced campaign insights records
+        2. pa.Table:
+            Enforced campaign insights records if input is pa.Table
     """
 
+    # Arrow engine keeps pa.Table end-to-end without pandas round trip
+    if isinstance(df, pa.Table):
+        return _transform_campaign_insights_arrow(df)
+
     msg = (
         "🔄 [TRANSFORM] Transforming "
         f"{len(df)} row(s) of Facebook Ads campaign insights..."
@@ -52,141 +101,116 @@ def transform_campaign_insights(
             f"{missing} then transformation will be suspended."
         )
 
-    _MAPPING_GOAL_ACTION = {
-        "REACH": "reach",
-        "IMPRESSIONS": "impressions",
-        "AD_RECALL_LIFT": "estimated_ad_recall_lift",
-        "LANDING_PAGE_VIEWS": "landing_page_view",
-        "LINK_CLICKS": "link_click",
-        "PAGE_LIKES": "like",
-        "VIDEO_VIEWS": "video_view",
-        "POST_ENGAGEMENT": "post_engagement",
-        "ENGAGED_USERS": "post_engagement",
-        "MESSAGES": "onsite_conversion.messaging_conversation_started_7d",
-        "REPLIES": "onsite_conversion.messaging_conversation_started_7d",
-        "MESSAGING_CONVERSATIONS_REPLIES": "onsite_conversion.messaging_conversation_started_7d",
-        "LEAD_GENERATION": "lead",
-        "THRUPLAY": "video_view",
-        "APP_INSTALLS": "mobile_app_install",
-        "OFFSITE_CONVERSIONS": "purchase",
-        "CONVERSIONS": "purchase",
-        "VALUE": "value",
-        "QUALITY_LEAD": "lead",
-    }
 
-    # Parse actions column (GIỐNG LEGACY)
-    parsed_actions = []
-
-    for x in df.get("actions", []):
-        if isinstance(x, list):
-            parsed_actions.append(x)
-        elif x is None or (isinstance(x, float) and np.isnan(x)):
-            parsed_actions.append([])
-        elif isinstance(x, str):
-            cleaned = x.strip().lower()
-            if cleaned in ["", "none", "null"]:
-                parsed_actions.append([])
-            else:
-                try:
-                    normalized = re.sub(
-                        r"(?<!\")'([^']*?)':",
-                        r'"\1":',
-                        str(x).replace("'", '"').strip()
-                    )
-                    parsed = json.loads(normalized)
-                    parsed_actions.append(parsed if isinstance(parsed, list) else [])
-                except Exception:
-                    parsed_actions.append([])
-        else:
-            parsed_actions.append([])
+    # Parse actions column
+    parsed_actions, failed_actions = _ACTIONS_PARSER.parse(df["actions"] if "actions" in df.columns else [])
+
+    if failed_actions:
+        msg = (
+            "⚠️ [TRANSFORM] Failed to parse "
+            f"{failed_actions}/{len(df)} string-encoded actions payload(s) of Facebook Ads campaign insights then empty actions will be used."
+        )
+        print(msg)
+        logging.warning(msg)
 
     df["actions"] = parsed_actions
 
-    # Resolve result
-    results_value = []
-    results_type = []
-
-    for _, row in df.iterrows():
-        optimization_goal = row.get("optimization_goal")
-        actions = row.get("actions", [])
-
-        if not isinstance(actions, list):
-            actions = []
-
-        value = None
-        rtype = None
-
-        if optimization_goal in _MAPPING_GOAL_ACTION:
-            mapped_action = _MAPPING_GOAL_ACTION[optimization_goal]
-
-            if mapped_action in {"reach", "impressions"}:
-                value = pd.to_numeric(row.get("impressions", 0), errors="coerce")
-                rtype = "impressions"
-            else:
-                for act in actions:
-                    if not isinstance(act, dict):
-                        continue
-                    if act.get("action_type") == mapped_action:
-                        value = pd.to_numeric(act.get("value", 0), errors="coerce")
-                        rtype = (
-                            "follows_or_likes"
-                            if mapped_action == "like"
-                            else mapped_action
-                        )
-                        break
-
-        if value is None:
-            for act in actions:
-                if not isinstance(act, dict):
-                    continue
-                if act.get("action_type") == "onsite_conversion.lead_grouped":
-                    value = pd.to_numeric(act.get("value", 0), errors="coerce")
-                    rtype = "onsite_conversion.lead_grouped"
-                    break
-
-        if value is None:
-            for act in actions:
-                if not isinstance(act, dict):
-                    continue
-                if act.get("action_type") == "lead":
-                    value = pd.to_numeric(act.get("value", 0), errors="coerce")
-                    rtype = "lead"
-                    break
-
-        results_value.append(value)
-        results_type.append(rtype)
+    row_count = len(df)
+
+    mapped_actions = (
+        df["optimization_goal"].reset_index(drop=True).map(_MAPPING_GOAL_ACTION)
+        if "optimization_goal" in df.columns
+        else pd.Series(None, index=range(row_count), dtype="object")
+    )
+    impressions = (
+        df["impressions"].reset_index(drop=True)
+        if "impressions" in df.columns
+        else pd.Series(0, index=range(row_count))
+    )
+
+    # Resolve results
+    results_value = np.full(row_count, None, dtype=object)
+    results_type = np.full(row_count, None, dtype=object)
+    resolved = np.zeros(row_count, dtype=bool)
+
+    is_delivery = mapped_actions.isin(["reach", "impressions"]).to_numpy()
+    results_value[is_delivery] = impressions.to_numpy(dtype=object)[is_delivery]
+    results_type[is_delivery] = "impressions"
+    resolved |= is_delivery
+
+    # Mapped goal action first then lead_grouped and lead fallbacks with Polars lazy engine
+    if engine == "polars":
+        matched_value, matched_type, metric_values = _match_actions_polars(
+            df["actions"],
+            mapped_actions,
+        )
+        matched = ~resolved & pd.notna(matched_type)
+
+        results_value[matched] = matched_value[matched]
+        results_type[matched] = matched_type[matched]
+        resolved |= matched
+
+    else:
+        # Explode actions once into long frame of (row, action_type, value)
+        row_actions = df["actions"].reset_index(drop=True).explode()
+        row_actions = row_actions[row_actions.map(type).eq(dict)]
+
+        df_actions = pd.DataFrame(
+            {
+                "row": row_actions.index,
+                "action_type": row_actions.map(lambda act: act.get("action_type")).to_numpy(dtype=object),
+                "value": row_actions.map(lambda act: act.get("value", 0)).to_numpy(dtype=object),
+            }
+        )
+
+        # Mapped goal action first then lead_grouped and lead fallbacks on unresolved row(s)
+        for matches in [
+            df_actions["action_type"].eq(mapped_actions.to_numpy(dtype=object)[df_actions["row"].to_numpy()]),
+            df_actions["action_type"].eq("onsite_conversion.lead_grouped"),
+            df_actions["action_type"].eq("lead"),
+        ]:
+            matched = df_actions[matches].drop_duplicates("row", keep="first")
+            matched = matched[~resolved[matched["row"].to_numpy()]]
+            matched_rows = matched["row"].to_numpy()
+
+            results_value[matched_rows] = matched["value"].to_numpy(dtype=object)
+            results_type[matched_rows] = matched["action_type"].to_numpy(dtype=object)
+            resolved[matched_rows] = True
+
+        # Extract performance metrics from last matching action
+        metric_values: dict[str, np.ndarray] = {}
+
+        for col, action_type in [
+            ("messaging_conversations_started", "onsite_conversion.messaging_conversation_started_7d"),
+            ("purchase", "purchase"),
+        ]:
+            matched = df_actions[df_actions["action_type"].eq(action_type)].drop_duplicates("row", keep="last")
+
+            values = np.zeros(row_count, dtype="int64")
+            values[matched["row"].to_numpy()] = (
+                pd.to_numeric(matched["value"], errors="coerce")
+                .fillna(0)
+                .to_numpy()
+            )
+
+            metric_values[col] = values
+
+    results_type[results_type == "like"] = "follows_or_likes"
+    results_value[~resolved] = None
 
     df["result"] = (
-        pd.to_numeric(pd.Series(results_value), errors="coerce")
+        pd.to_numeric(pd.Series(results_value, index=df.index), errors="coerce")
         .fillna(0)
     )
 
     df["result_type"] = (
-        pd.Series(results_type, dtype="string")
+        pd.Series(results_type, index=df.index, dtype="string")
         .fillna("unknown")
     )
 
-    # Parse performance metrics
-    messaging_values = []
-    purchase_values = []
-
-    for actions in df["actions"]:
-        msg_val = 0
-        pur_val = 0
-
-        for act in actions:
-            if not isinstance(act, dict):
-                continue
-            if act.get("action_type") == "onsite_conversion.messaging_conversation_started_7d":
-                msg_val = pd.to_numeric(act.get("value", 0), errors="coerce")
-            elif act.get("action_type") == "purchase":
-                pur_val = pd.to_numeric(act.get("value", 0), errors="coerce")
-
-        messaging_values.append(int(msg_val) if not pd.isna(msg_val) else 0)
-        purchase_values.append(int(pur_val) if not pd.isna(pur_val) else 0)
-
-    df["messaging_conversations_started"] = messaging_values
-    df["purchase"] = purchase_values
+    # Assign performance metrics
+    for col, values in metric_values.items():
+        df[col] = values
 
     # Normalize numeric metrics
     for col in [
@@ -215,6 +239,9 @@ def transform_campaign_insights(
         errors="ignore"
     )
 
+    # Apply compact schema
+    df = _COMPACT_SCHEMA.apply(df)
+
     msg = (
         "✅ [TRANSFORM] Successfully transformed "
         f"{len(df)} row(s) of Facebook Ads campaign insights."
@@ -222,4 +249,401 @@ def transform_campaign_insights(
     print(msg)
     logging.info(msg)
 
-    return df
\ No newline at end of file
+    return df
+
+def _transform_campaign_insights_arrow(
+    table: pa.Table
+) -> pa.Table:
+    """
+    Transform Facebook Ads campaign insights with pyarrow.compute
+    ---------
+    Workflow:
+        1. Validate input
+        2. Explode actions once with list_flatten and list_parent_indices
+        3. Resolve results with mapped goal action then lead_grouped and lead fallbacks
+        4. Extract messaging and purchase from last matching action
+        5. Normalize date dimension
+        6. Enforce numeric schema
+        7. Apply compact schema
+    ---------
+    Returns:
+        1. pa.Table:
+            Enforced campaign insights records
+    """
+
+    msg = (
+        "🔄 [TRANSFORM] Transforming "
+        f"{table.num_rows} row(s) of Facebook Ads campaign insights with Arrow engine..."
+    )
+    print(msg)
+    logging.info(msg)
+
+    if table.num_rows == 0:
+        msg = "⚠️ [TRANSFORM] Empty Facebook Ads campaign insights then transformation will be suspended."
+        print(msg)
+        logging.warning(msg)
+        return table
+
+    missing = {"date_start", "date_stop"} - set(table.column_names)
+    if missing:
+        raise ValueError(
+            "❌ [TRANSFORM] Failed to transform Facebook Ads campaign insights due to missing columns "
+            f"{missing} then transformation will be suspended."
+        )
+
+
+    row_count = table.num_rows
+    row_index = pa.array(np.arange(row_count, dtype=np.int64))
+    null_strings = pa.nulls(row_count, pa.string())
+
+    # Parse actions column
+    actions = (
+        table["actions"].combine_chunks()
+        if "actions" in table.column_names
+        else pa.nulls(row_count)
+    )
+
+    if pa.types.is_string(actions.type) or pa.types.is_large_string(actions.type):
+        parsed_actions, failed_actions = _ACTIONS_PARSER.parse(actions.to_pylist())
+        actions = pa.array(parsed_actions)
+
+        if failed_actions:
+            msg = (
+                "⚠️ [TRANSFORM] Failed to parse "
+                f"{failed_actions}/{row_count} string-encoded actions payload(s) of Facebook Ads campaign insights then empty actions will be used."
+            )
+            print(msg)
+            logging.warning(msg)
+
+    # Explode actions once into long table of (row, action_type, value)
+    if pa.types.is_list(actions.type) and pa.types.is_struct(actions.type.value_type):
+        flat_actions = pc.list_flatten(actions)
+        action_fields = {field.name for field in actions.type.value_type}
+
+        tbl_actions = pa.table(
+            {
+                "row": pc.cast(pc.list_parent_indices(actions), pa.int64()),
+                "action_type": (
+                    pc.cast(flat_actions.field("action_type"), pa.string())
+                    if "action_type" in action_fields
+                    else pa.nulls(len(flat_actions), pa.string())
+                ),
+                "value": pc.fill_null(
+                    pc.cast(flat_actions.field("value"), pa.string())
+                    if "value" in action_fields
+                    else pa.nulls(len(flat_actions), pa.string()),
+                    "0",
+                ),
+            }
+        )
+    else:
+        tbl_actions = pa.table(
+            {
+                "row": pa.array([], pa.int64()),
+                "action_type": pa.array([], pa.string()),
+                "value": pa.array([], pa.string()),
+            }
+        )
+
+    optimization_goal = (
+        pc.cast(table["optimization_goal"].combine_chunks(), pa.string())
+        if "optimization_goal" in table.column_names
+        else null_strings
+    )
+    mapped_actions = pc.take(
+        pa.array(list(_MAPPING_GOAL_ACTION.values())),
+        pc.index_in(optimization_goal, value_set=pa.array(list(_MAPPING_GOAL_ACTION))),
+    )
+    impressions = (
+        pc.cast(table["impressions"].combine_chunks(), pa.string())
+        if "impressions" in table.column_names
+        else pa.array(["0"] * row_count)
+    )
+
+    # Resolve results
+    is_delivery = pc.fill_null(
+        pc.is_in(mapped_actions, value_set=pa.array(["reach", "impressions"])),
+        False,
+    )
+    results_value = pc.if_else(is_delivery, impressions, null_strings)
+    results_type = pc.if_else(is_delivery, "impressions", null_strings)
+    resolved = is_delivery
+
+    # Mapped goal action first then lead_grouped and lead fallbacks on unresolved row(s)
+    for matches, action_type in [
+        (pc.equal(tbl_actions["action_type"], pc.take(mapped_actions, tbl_actions["row"])), mapped_actions),
+        (pc.equal(tbl_actions["action_type"], "onsite_conversion.lead_grouped"), "onsite_conversion.lead_grouped"),
+        (pc.equal(tbl_actions["action_type"], "lead"), "lead"),
+    ]:
+        matched, matched_values = _arrow_match_rows(tbl_actions, matches, row_index, "first")
+        take_step = pc.and_(matched, pc.invert(resolved))
+
+        results_value = pc.if_else(take_step, matched_values, results_value)
+        results_type = pc.if_else(take_step, action_type, results_type)
+        resolved = pc.or_(resolved, matched)
+
+    results_type = pc.if_else(
+        pc.fill_null(pc.equal(results_type, "like"), False),
+        "follows_or_likes",
+        results_type,
+    )
+
+    transformed = {
+        "result": (
+            _arrow_to_numeric(results_value)
+            if pc.all(resolved).as_py()
+            else pc.cast(_arrow_to_numeric(results_value), pa.float64())
+        ),
+        "result_type": pc.fill_null(results_type, "unknown"),
+    }
+
+    # Extract performance metrics from last matching action
+    for col, action_type in [
+        ("messaging_conversations_started", "onsite_conversion.messaging_conversation_started_7d"),
+        ("purchase", "purchase"),
+    ]:
+        matched, matched_values = _arrow_match_rows(
+            tbl_actions,
+            pc.equal(tbl_actions["action_type"], action_type),
+            row_index,
+            "last",
+        )
+        transformed[col] = pc.cast(
+            pc.trunc(pc.cast(_arrow_to_numeric(pc.fill_null(matched_values, "0")), pa.float64())),
+            pa.int64(),
+        )
+
+    # Normalize numeric metrics
+    for col in ["impressions", "clicks", "spend"]:
+        if col in table.column_names:
+            table = table.set_column(
+                table.column_names.index(col),
+                col,
+                _arrow_to_numeric(table[col].combine_chunks()),
+            )
+
+    # Normalize date dimension
+    dt = pc.cast(
+        pc.strptime(
+            pc.cast(table["date_start"].combine_chunks(), pa.string()),
+            format="%Y-%m-%d",
+            unit="ns",
+            error_is_null=True,
+        ),
+        pa.timestamp("ns", tz="UTC"),
+    )
+    transformed["date"] = dt
+    transformed["year"] = pc.year(dt)
+    transformed["month"] = pc.strftime(dt, format="%Y-%m")
+
+    # Drop raw columns
+    table = table.drop_columns(
+        [
+            col for col in ["actions", "optimization_goal", "date_start", "date_stop"]
+            if col in table.column_names
+        ]
+    )
+
+    for col, values in transformed.items():
+        table = table.append_column(col, values)
+
+    # Apply compact schema
+    table = _COMPACT_SCHEMA.apply(table)
+
+    msg = (
+        "✅ [TRANSFORM] Successfully transformed "
+        f"{table.num_rows} row(s) of Facebook Ads campaign insights with Arrow engine."
+    )
+    print(msg)
+    logging.info(msg)
+
+    return table
+
+def _arrow_match_rows(
+    tbl_actions: pa.Table,
+    matches: pa.Array,
+    row_index: pa.Array,
+    keep: str,
+) -> tuple[pa.Array, pa.Array]:
+    """
+    Match Facebook Ads actions per insights row
+    ---------
+    Workflow:
+        1. Filter exploded actions by matches mask
+        2. Keep first or last matching value per row in original order
+        3. Scatter matched value(s) back to insights row position(s)
+    ---------
+    Returns:
+        1. pa.Array:
+            Boolean mask of row(s) with matching action
+        2. pa.Array:
+            Matching action value per row or null
+    """
+
+    grouped = (
+        tbl_actions
+        .filter(matches)
+        .group_by("row", use_threads=False)
+        .aggregate([("value", keep, pc.ScalarAggregateOptions(skip_nulls=False))])
+    )
+    positions = pc.index_in(row_index, value_set=grouped["row"])
+
+    return (
+        pc.is_valid(positions),
+        pc.take(grouped[f"value_{keep}"], positions),
+    )
+
+def _arrow_to_numeric(
+    values: pa.Array,
+) -> pa.Array:
+    """
+    Coerce Arrow array to numeric
+    ---------
+    Workflow:
+        1. Null out non-numeric string(s) as pd.to_numeric(errors="coerce")
+        2. Fill null with 0
+        3. Narrow to int64 if every value is integral
+    ---------
+    Returns:
+        1. pa.Array:
+            int64 or float64 values
+    """
+
+    if pa.types.is_integer(values.type) or pa.types.is_floating(values.type):
+        numbers = pc.cast(values, pa.float64())
+    else:
+        strings = pc.utf8_trim_whitespace(pc.cast(values, pa.string()))
+        numbers = pc.cast(
+            pc.if_else(
+                pc.match_substring_regex(strings, r"^[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?$"),
+                strings,
+                pa.scalar(None, pa.string()),
+            ),
+            pa.float64(),
+        )
+
+    numbers = pc.fill_null(numbers, 0.0)
+
+    if pc.all(pc.equal(pc.trunc(numbers), numbers)).as_py() is not False:
+        return pc.cast(numbers, pa.int64())
+
+    return numbers
+
+def _match_actions_polars(
+    actions: pd.Series,
+    mapped_actions: pd.Series,
+) -> tuple[np.ndarray, np.ndarray, dict[str, np.ndarray]]:
+    """
+    Match Facebook Ads campaign insights actions with Polars lazy engine
+    ---------
+    Workflow:
+        1. Explode actions list column into (row, action_type, value) on all cores
+        2. Keep first mapped goal, lead_grouped and lead action per row
+        3. Keep last messaging and purchase action per row
+        4. Join matched action(s) back to row position(s)
+    ---------
+    Returns:
+        1. np.ndarray:
+            Matched raw action value per row or None
+        2. np.ndarray:
+            Matched action_type per row or None
+        3. dict[str, np.ndarray]:
+            messaging_conversations_started and purchase per row
+    """
+
+    row_count = len(actions)
+
+    # Arrow conversion of list[dict] is vectorized then fall back to Polars casting for non-string value(s)
+    try:
+        pl_actions = pl.from_arrow(
+            pa.array(
+                actions.tolist(),
+                type=pa.list_(pa.struct([("action_type", pa.string()), ("value", pa.string())])),
+            )
+        )
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pl_actions = pl.Series(
+            actions.tolist(),
+            dtype=pl.List(pl.Struct({"action_type": pl.String, "value": pl.String})),
+            strict=False,
+        )
+
+    lf_rows = pl.LazyFrame(
+        {
+            "row": pl.Series(np.arange(row_count, dtype=np.int64)),
+            "mapped_action": pl.Series(
+                mapped_actions.astype(object).where(mapped_actions.notna(), None).tolist(),
+                dtype=pl.String,
+            ),
+            "actions": pl_actions,
+        }
+    )
+
+    lf_actions = (
+        lf_rows
+        .explode("actions")
+        .filter(pl.col("actions").is_not_null())
+        .select(
+            "row",
+            "mapped_action",
+            pl.col("actions").struct.field("action_type").alias("action_type"),
+            pl.col("actions").struct.field("value").fill_null("0").alias("value"),
+        )
+    )
+
+    lf_matched = lf_rows.select("row")
+
+    for alias, matches, keep in [
+        ("mapped_value", pl.col("action_type") == pl.col("mapped_action"), "first"),
+        ("lead_grouped_value", pl.col("action_type") == "onsite_conversion.lead_grouped", "first"),
+        ("lead_value", pl.col("action_type") == "lead", "first"),
+        ("messaging_conversations_started", pl.col("action_type") == "onsite_conversion.messaging_conversation_started_7d", "last"),
+        ("purchase", pl.col("action_type") == "purchase", "last"),
+    ]:
+        lf_matched = lf_matched.join(
+            lf_actions
+            .filter(matches)
+            .group_by("row")
+            .agg(
+                pl.col("value").first().alias(alias)
+                if keep == "first"
+                else pl.col("value").last().alias(alias)
+            ),
+            on="row",
+            how="left",
+        )
+
+    df_matched = (
+        lf_matched
+        .join(lf_rows.select("row", "mapped_action"), on="row", how="left")
+        # Left join(s) do not keep row order by default then output is re-sorted before positional read-back
+        .sort("row")
+        .select(
+            pl.coalesce("mapped_value", "lead_grouped_value", "lead_value").alias("value"),
+            pl.when(pl.col("mapped_value").is_not_null())
+            .then(pl.col("mapped_action"))
+            .when(pl.col("lead_grouped_value").is_not_null())
+            .then(pl.lit("onsite_conversion.lead_grouped"))
+            .when(pl.col("lead_value").is_not_null())
+            .then(pl.lit("lead"))
+            .alias("action_type"),
+            *[
+                pl.col(col)
+                .cast(pl.Float64, strict=False)
+                .fill_nan(0)
+                .fill_null(0)
+                .cast(pl.Int64)
+                for col in ["messaging_conversations_started", "purchase"]
+            ],
+        )
+        .collect()
+    )
+
+    return (
+        df_matched["value"].to_numpy().astype(object),
+        df_matched["action_type"].to_numpy().astype(object),
+        {
+            col: df_matched[col].to_numpy()
+            for col in ["messaging_conversations_started", "purchase"]
+        },
+    )
@@ -6,8 +6,34 @@ sys.path.append(str(ROOT_FOLDER_LOCATION))
 import logging
 import pandas as pd
 
+from plugins.compact_schema import internalCompactSchema
+from plugins.facebook_ads_naming import (
+    CAMPAIGN_NAME_LAYOUT,
+    internalFacebookAdsNamingParser,
+)
+
+_NAME_PARSER = internalFacebookAdsNamingParser(layout=CAMPAIGN_NAME_LAYOUT)
+_COMPACT_SCHEMA = internalCompactSchema(
+    schema={
+        "account_id": "category",
+        "account_name": "category",
+        "status": "category",
+        "platform": "category",
+        "objective": "category",
+        "region": "category",
+        "budget_group_1": "category",
+        "budget_group_2": "category",
+        "category_level_1": "category",
+        "personnel": "category",
+        "track_group": "category",
+        "pillar_group": "category",
+        "content_group": "category",
+    }
+)
+
 def transform_campaign_metadata(
-    df: pd.DataFrame
+    df: pd.DataFrame,
+    engine: str = "pandas",
 ) -> pd.DataFrame:
     """
     Transform Facebook Ads campaign metadata
@@ -15,7 +41,8 @@ def transform_campaign_metadata(
     Workflow:
         1. Validate input
         2. Validate missing columns
-        3. Assign enriched columns
+        3. Assign enriched columns from naming convention parser with pandas or Polars lazy engine
+        4. Apply compact schema
     ---------
     Returns:
         1. DataFrame:
@@ -50,17 +77,12 @@ def transform_campaign_metadata(
 
     df = df.copy()
     df["platform"] = "Facebook"
-    df = df.assign(
-        objective=df["campaign_name"].fillna("").str.split("_").str[0].fillna("unknown"),
-        region=df["campaign_name"].fillna("").str.split("_").str[1].fillna("unknown"),
-        budget_group_1=df["campaign_name"].fillna("").str.split("_").str[2].fillna("unknown"),
-        budget_group_2=df["campaign_name"].fillna("").str.split("_").str[3].fillna("unknown"),      
-        category_level_1=df["campaign_name"].fillna("").str.split("_").str[4].fillna("unknown"),
-        personnel=df["campaign_name"].fillna("").str.split("_").str[5].fillna("unknown"),
-        track_group=df["campaign_name"].fillna("").str.split("_").str[7].fillna("unknown"),
-        pillar_group=df["campaign_name"].fillna("").str.split("_").str[8].fillna("unknown"),
-        content_group=df["campaign_name"].fillna("").str.split("_").str[9].fillna("unknown"),
-    )
+
+    # Split each distinct campaign_name once with shared naming convention layout
+    df = df.assign(**_NAME_PARSER.parse(df["campaign_name"], engine=engine))
+
+    # Apply compact schema
+    df = _COMPACT_SCHEMA.apply(df)
 
     msg = (
         "✅ [TRANSFORM] Successfully transformed "
@@ -0,0 +1,98 @@
+import sys
+from pathlib import Path
+ROOT_FOLDER_LOCATION = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT_FOLDER_LOCATION))
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+class internalCompactSchema:
+    """
+    Internal Compact Schema
+    ---------
+    Workflow:
+        1. Declare compact dtype per column as category or integer
+        2. Convert category column(s) of DataFrame to pandas categorical
+        3. Dictionary-encode category column(s) of pa.Table
+        4. Downcast integer column(s) of DataFrame to the smallest signed type holding min and max
+        5. Keep integer column(s) of pa.Table as int64 so chunk(s) of the same table concatenate
+        6. Skip undeclared or missing column(s) so BigQuery schema stays STRING / INT64 / FLOAT64 / TIMESTAMP
+    ---------
+    Returns:
+        None
+    """
+
+# 1.1. Initialize
+    def __init__(
+        self,
+        *,
+        schema: dict[str, str],
+    ) -> None:
+
+        unsupported = {col: dtype for col, dtype in schema.items() if dtype not in {"category", "integer"}}
+        if unsupported:
+            raise ValueError(
+                "❌ [PLUGIN] Failed to declare compact schema due to unsupported dtype(s) "
+                f"{unsupported}."
+            )
+
+        self.schema = schema
+
+# 1.2. Loader
+    def apply(
+        self,
+        df: pd.DataFrame | pa.Table,
+    ) -> pd.DataFrame | pa.Table:
+
+        if isinstance(df, pa.Table):
+            return self._apply_arrow(df)
+
+        compacted = {}
+
+        for col, dtype in self.schema.items():
+            if col not in df.columns:
+                continue
+
+            series = df[col]
+
+            if dtype == "category":
+                if not isinstance(series.dtype, pd.CategoricalDtype):
+                    compacted[col] = series.astype("category")
+
+            elif pd.api.types.is_integer_dtype(series.dtype) and not pd.api.types.is_extension_array_dtype(series.dtype):
+                compacted[col] = pd.to_numeric(series, downcast="integer")
+
+        return df.assign(**compacted) if compacted else df
+
+# 1.3. Workflow
+
+    # 1.3.1. Apply compact schema to pa.Table
+    def _apply_arrow(
+            self,
+            table: pa.Table,
+            ) -> pa.Table:
+
+        for col, dtype in self.schema.items():
+            if col not in table.column_names:
+                continue
+
+            values = table[col]
+
+            if dtype == "category":
+                if pa.types.is_dictionary(values.type):
+                    continue
+                values = pc.dictionary_encode(values.combine_chunks())
+
+            # Width chosen from one chunk would differ between chunk(s) and break pa.concat_tables
+            elif pa.types.is_integer(values.type):
+                if values.type == pa.int64():
+                    continue
+                values = pc.cast(values, pa.int64())
+
+            else:
+                continue
+
+            table = table.set_column(table.column_names.index(col), col, values)
+
+        return table
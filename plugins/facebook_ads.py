@@ -0,0 +1,318 @@
+import sys
+from pathlib import Path
+ROOT_FOLDER_LOCATION = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT_FOLDER_LOCATION))
+
+import json
+import logging
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from facebook_business.api import FacebookAdsApi
+from facebook_business.session import FacebookSession
+
+from plugins.work_registry import internalWorkRegistry
+
+class internalFacebookAdsClient:
+    """
+    Internal Facebook Ads Client
+    ---------
+    Workflow:
+        1. Initialize one keep-alive HTTP connection pool per run
+        2. Bind every FacebookSession to the shared connection pool
+        3. Provide thread-local FacebookAdsApi per timeout override
+        4. Feed every response usage header to the shared rate-limit governor
+        5. Share run-level work registry between every DAG of the run
+        6. Close the shared connection pool at the end of the run
+    ---------
+    Returns:
+        None
+    """
+
+# 1.1. Initialize
+    def __init__(
+        self,
+        *,
+        access_token: str,
+        timeout: int = 180,
+        pool_maxsize: int = 2,
+    ) -> None:
+        self.access_token = access_token
+        self.timeout = timeout
+        self.pool_maxsize = max(1, pool_maxsize)
+        self.requests: requests.Session | None = None
+        self.governor = internalFacebookAdsGovernor()
+        self.registry = internalWorkRegistry()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+# 1.2. Provider
+    def api(
+        self,
+        *,
+        timeout: int | None = None,
+    ) -> FacebookAdsApi:
+
+        timeout = timeout or self.timeout
+
+        if not hasattr(self._local, "apis"):
+            self._local.apis = {}
+
+        if timeout not in self._local.apis:
+            self._local.apis[timeout] = self._init_api(timeout)
+
+        return self._local.apis[timeout]
+
+    def close(self) -> None:
+        with self._lock:
+            if self.requests:
+                self.requests.close()
+                self.requests = None
+
+            msg = "✅ [PLUGIN] Successfully closed Facebook Ads shared connection pool."
+            print(msg)
+            logging.info(msg)
+
+# 1.3. Workflow
+
+    # 1.3.1. Initialize thread-local API
+    def _init_api(
+            self,
+            timeout: int,
+            ) -> FacebookAdsApi:
+
+        try:
+            session = FacebookSession(
+                access_token=self.access_token,
+                timeout=timeout,
+            )
+            session.requests = self._init_pool(session)
+
+            return FacebookAdsApi(session)
+
+        except Exception as e:
+            raise RuntimeError(
+                "❌ [PLUGIN] Failed to initialize Facebook Ads SDK client with timeout "
+                f"{timeout} due to "
+                f"{str(e)}."
+            ) from e
+
+    # 1.3.2. Initialize shared connection pool
+    def _init_pool(
+            self,
+            session: FacebookSession,
+            ) -> requests.Session:
+
+        with self._lock:
+            if self.requests:
+                session.requests.close()
+                return self.requests
+
+            msg = (
+                "🔍 [PLUGIN] Initializing Facebook Ads shared connection pool with "
+                f"{self.pool_maxsize} keep-alive connection(s)..."
+            )
+            print(msg)
+            logging.info(msg)
+
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=self.pool_maxsize,
+                pool_block=True,
+            )
+            session.requests.mount("https://", adapter)
+            session.requests.hooks["response"].append(
+                lambda response, *args, **kwargs: self.governor.observe(response.headers)
+            )
+            self.requests = session.requests
+
+            msg = "✅ [PLUGIN] Successfully initialized Facebook Ads shared connection pool."
+            print(msg)
+            logging.info(msg)
+
+            return self.requests
+
+class internalFacebookAdsGovernor:
+    """
+    Internal Facebook Ads Rate-limit Governor
+    ---------
+    Workflow:
+        1. Parse X-App-Usage, X-Ad-Account-Usage and X-Business-Use-Case-Usage headers of every response
+        2. Keep the highest usage percentage per header and estimated_time_to_regain_access
+        3. Expire usage reading(s) not observed again within usage_window
+        4. Return zero wait while usage stays below soft_limit
+        5. Scale wait up to max_pause between soft_limit and 100%
+        6. Wait until access is regained once throttled
+    ---------
+    Returns:
+        None
+    """
+
+# 2.1. Initialize
+    def __init__(
+        self,
+        *,
+        soft_limit: float = 75.0,
+        max_pause: float = 60.0,
+        min_backoff: float = 5.0,
+        usage_window: float = 120.0,
+    ) -> None:
+        self.soft_limit = soft_limit
+        self.max_pause = max_pause
+        self.min_backoff = min_backoff
+        self.usage_window = usage_window
+        self.usage: dict[str, float] = {}
+        self.regain_at: float = 0.0
+        self.observed_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+# 2.2. Observer
+    def observe(
+        self,
+        headers,
+    ) -> None:
+
+        usage: dict[str, float] = {}
+        regain_seconds = 0.0
+
+        for header in (
+            "X-App-Usage",
+            "X-Ad-Account-Usage",
+            "X-Business-Use-Case-Usage",
+            "X-FB-Ads-Insights-Throttle",
+        ):
+            raw = headers.get(header) if headers else None
+            if not raw:
+                continue
+
+            try:
+                payload = json.loads(raw)
+            except (TypeError, ValueError):
+                continue
+
+            # Business use case usage is keyed by business_id with list of usage per type
+            if header == "X-Business-Use-Case-Usage" and isinstance(payload, dict):
+                entries = [
+                    entry for value in payload.values()
+                    if isinstance(value, list)
+                    for entry in value
+                    if isinstance(entry, dict)
+                ]
+            else:
+                entries = [payload] if isinstance(payload, dict) else []
+
+            for entry in entries:
+                for key in (
+                    "call_count",
+                    "total_cputime",
+                    "total_time",
+                    "acc_id_util_pct",
+                    "app_id_util_pct",
+                ):
+                    value = entry.get(key)
+                    if isinstance(value, (int, float)):
+                        usage[header] = max(usage.get(header, 0.0), float(value))
+
+                # estimated_time_to_regain_access is reported in minutes
+                regain_minutes = entry.get("estimated_time_to_regain_access")
+                if isinstance(regain_minutes, (int, float)) and regain_minutes > 0:
+                    regain_seconds = max(regain_seconds, float(regain_minutes) * 60)
+
+        if not usage and not regain_seconds:
+            return
+
+        with self._lock:
+            now = time.time()
+            self.observed_at.update(dict.fromkeys(usage, now))
+            self.usage.update(usage)
+            if regain_seconds:
+                self.regain_at = max(self.regain_at, now + regain_seconds)
+
+# 2.3. Pacing
+    @property
+    def usage_pct(self) -> float:
+        with self._lock:
+            return self._usage_pct(time.time())
+
+    def wait_time(self) -> float:
+        return self._pacing()[0]
+
+    def throttle(
+        self,
+        reason: str,
+    ) -> float:
+
+        wait, usage_pct = self._pacing()
+
+        if wait > 0:
+            msg = (
+                "🔄 [PLUGIN] Waiting "
+                f"{wait} second(s) before "
+                f"{reason} due to Facebook Ads API usage at "
+                f"{usage_pct}%..."
+            )
+            print(msg)
+            logging.info(msg)
+
+            time.sleep(wait)
+
+        return wait
+
+    def backoff(
+        self,
+        attempt: int,
+        reason: str,
+    ) -> float:
+
+        wait, usage_pct = self._pacing()
+        wait = max(
+            wait,
+            self.min_backoff * 2 ** (max(attempt, 1) - 1),
+        )
+
+        msg = (
+            "🔄 [PLUGIN] Waiting "
+            f"{wait} second(s) before "
+            f"{reason} with Facebook Ads API usage at "
+            f"{usage_pct}%..."
+        )
+        print(msg)
+        logging.warning(msg)
+
+        time.sleep(wait)
+
+        return wait
+
+# 2.4. Workflow
+
+    # 2.4.1. Resolve wait and usage percentage from one locked reading
+    def _pacing(self) -> tuple[float, float]:
+
+        with self._lock:
+            now = time.time()
+            usage_pct = self._usage_pct(now)
+
+            if self.regain_at > now:
+                return round(self.regain_at - now, 2), usage_pct
+
+            if usage_pct < self.soft_limit:
+                return 0.0, usage_pct
+
+            ratio = (usage_pct - self.soft_limit) / max(100.0 - self.soft_limit, 1.0)
+            return round(min(ratio, 1.0) * self.max_pause, 2), usage_pct
+
+    # 2.4.2. Drop expired usage reading(s) then return highest usage percentage while _lock is held
+    def _usage_pct(
+            self,
+            now: float,
+            ) -> float:
+
+        # One high header keeps pacing only until it ages out without being observed again
+        for header in [h for h, observed_at in self.observed_at.items() if now - observed_at > self.usage_window]:
+            self.observed_at.pop(header)
+            self.usage.pop(header, None)
+
+        return max(self.usage.values(), default=0.0)
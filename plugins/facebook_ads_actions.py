@@ -0,0 +1,92 @@
+import sys
+from pathlib import Path
+ROOT_FOLDER_LOCATION = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT_FOLDER_LOCATION))
+
+import ast
+import threading
+from functools import lru_cache
+from collections.abc import Iterable
+
+import orjson
+
+class internalFacebookAdsActionsParser:
+    """
+    Internal Facebook Ads Actions Parser
+    ---------
+    Workflow:
+        1. Keep list actions as-is and map missing actions to empty list
+        2. Decode string-encoded actions with orjson
+        3. Fall back to ast.literal_eval for Python repr payloads
+        4. Memoize decoded payload per identical string
+        5. Count undecodable payloads instead of swallowing them
+    ---------
+    Returns:
+        None
+    """
+
+# 1.1. Initialize
+    def __init__(
+        self,
+        *,
+        cache_size: int = 65536,
+    ) -> None:
+        self.cache_size = cache_size
+        self.failures = 0
+        self._lock = threading.Lock()
+        self._decode = lru_cache(maxsize=cache_size)(self._decode_payload)
+
+# 1.2. Parser
+    def parse(
+        self,
+        values: Iterable,
+    ) -> tuple[list[list[dict]], int]:
+
+        parsed_actions: list[list[dict]] = []
+        failures = 0
+
+        for value in values:
+            if isinstance(value, list):
+                parsed_actions.append(value)
+
+            elif isinstance(value, str):
+                actions = self._decode(value)
+
+                # Decoded payload is shared across identical strings then must be read-only
+                if actions is None:
+                    failures += 1
+                    parsed_actions.append([])
+                else:
+                    parsed_actions.append(actions)
+
+            else:
+                parsed_actions.append([])
+
+        if failures:
+            with self._lock:
+                self.failures += failures
+
+        return parsed_actions, failures
+
+# 1.3. Workflow
+
+    # 1.3.1. Decode single payload
+    @staticmethod
+    def _decode_payload(payload: str) -> list[dict] | None:
+
+        cleaned = payload.strip()
+
+        if cleaned.lower() in {"", "none", "null", "nan", "[]"}:
+            return []
+
+        try:
+            parsed = orjson.loads(cleaned)
+
+        # Python repr payload such as str(list[dict]) after CSV round-trip
+        except orjson.JSONDecodeError:
+            try:
+                parsed = ast.literal_eval(cleaned)
+            except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+                return None
+
+        return parsed if isinstance(parsed, list) else None
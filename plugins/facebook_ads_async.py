@@ -0,0 +1,195 @@
+import sys
+from pathlib import Path
+ROOT_FOLDER_LOCATION = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT_FOLDER_LOCATION))
+
+import asyncio
+import json
+import logging
+
+import aiohttp
+
+from facebook_business.api import FacebookAdsApi
+from facebook_business.session import FacebookSession
+from facebook_business.exceptions import FacebookRequestError
+
+from plugins.facebook_ads import internalFacebookAdsGovernor
+
+class internalFacebookAdsAsyncClient:
+    """
+    Internal Facebook Ads Async Client
+    ---------
+    Workflow:
+        1. Open one aiohttp session on a single event loop
+        2. Bound in-flight Graph API requests with asyncio.Semaphore
+        3. Pause new requests while the shared governor reports throttling
+        4. Return JSON body or FacebookRequestError per node_id
+    ---------
+    Returns:
+        None
+    """
+
+# 1.1. Initialize
+    def __init__(
+        self,
+        *,
+        access_token: str,
+        concurrency: int = 200,
+        timeout: int = 180,
+        governor: internalFacebookAdsGovernor | None = None,
+    ) -> None:
+        self.access_token = access_token
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.governor = governor
+        self.base_url = f"{FacebookSession.GRAPH}/{FacebookAdsApi.API_VERSION}"
+
+# 1.2. Loader
+    def get_many(
+        self,
+        *,
+        node_ids: list[str],
+        fields: list[str],
+    ) -> dict[str, dict | FacebookRequestError]:
+
+        node_ids = list(dict.fromkeys(node_ids))
+
+        if not node_ids:
+            return {}
+
+        msg = (
+            "🔍 [PLUGIN] Requesting "
+            f"{len(node_ids)} Facebook Ads node_id(s) with up to "
+            f"{self.concurrency} in-flight request(s)..."
+        )
+        print(msg)
+        logging.info(msg)
+
+        results = asyncio.run(self._get_many(node_ids, fields))
+
+        failed = sum(isinstance(result, FacebookRequestError) for result in results.values())
+
+        msg = (
+            "✅ [PLUGIN] Successfully requested "
+            f"{len(results) - failed}/{len(node_ids)} Facebook Ads node_id(s)."
+        )
+        print(msg)
+        logging.info(msg)
+
+        return results
+
+# 1.3. Workflow
+
+    # 1.3.1. Fan out requests on one event loop
+    async def _get_many(
+            self,
+            node_ids: list[str],
+            fields: list[str],
+            ) -> dict[str, dict | FacebookRequestError]:
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=aiohttp.TCPConnector(limit=self.concurrency),
+            headers=FacebookAdsApi.HTTP_DEFAULT_HEADERS,
+        ) as session:
+            responses = await asyncio.gather(
+                *[
+                    self._get_one(session, semaphore, node_id, fields)
+                    for node_id in node_ids
+                ]
+            )
+
+        return dict(zip(node_ids, responses))
+
+    # 1.3.2. Request a single node
+    async def _get_one(
+            self,
+            session: aiohttp.ClientSession,
+            semaphore: asyncio.Semaphore,
+            node_id: str,
+            fields: list[str],
+            ) -> dict | FacebookRequestError:
+
+        url = f"{self.base_url}/{node_id}"
+        params = {
+            "access_token": self.access_token,
+            "fields": ",".join(fields),
+        }
+        call = {
+            "method": "GET",
+            "path": url,
+            "params": {"fields": params["fields"]},
+        }
+
+        async with semaphore:
+            if self.governor:
+                wait = self.governor.wait_time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+            try:
+                async with session.get(url, params=params) as response:
+                    body = await response.text()
+
+                    if self.governor:
+                        self.governor.observe(response.headers)
+
+                    try:
+                        payload = json.loads(body)
+                    except ValueError:
+                        payload = None
+
+                    if response.status >= 400 or not isinstance(payload, dict) or "error" in payload:
+                        return self._request_error(
+                            call,
+                            response.status,
+                            dict(response.headers),
+                            payload,
+                            body,
+                        )
+
+                    return payload
+
+            # Transport error or timeout is transient then eligible to retry
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                return FacebookRequestError(
+                    f"Async request failed due to {e!r}",
+                    call,
+                    503,
+                    {},
+                    None,
+                )
+
+    # 1.3.3. Build request error without letting an unparseable body escape gather
+    @staticmethod
+    def _request_error(
+            call: dict,
+            status: int,
+            headers: dict,
+            payload: object,
+            body: str,
+            ) -> FacebookRequestError:
+
+        try:
+            if not isinstance(payload, dict):
+                raise ValueError("non-JSON response body")
+
+            return FacebookRequestError(
+                "Call was not successful",
+                call,
+                status,
+                headers,
+                payload,
+            )
+
+        # Gateway HTML or malformed error payload is transient then eligible to retry
+        except Exception:
+            return FacebookRequestError(
+                "Call returned unparseable response body",
+                call,
+                status if status >= 500 else 502,
+                headers,
+                {"error": {"message": body[:500]}},
+            )
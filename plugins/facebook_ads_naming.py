@@ -0,0 +1,255 @@
+import sys
+from pathlib import Path
+ROOT_FOLDER_LOCATION = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT_FOLDER_LOCATION))
+
+import atexit
+import logging
+import os
+import tempfile
+import threading
+from itertools import islice
+
+import numpy as np
+import orjson
+import pandas as pd
+import polars as pl
+
+ADSET_NAME_LAYOUT = {
+    "column": "adset_name",
+    "delimiter": "|",
+    "segments": {
+        "location": 0,
+        "gender": 1,
+        "age": 2,
+        "audience": 3,
+        "format": 4,
+        "strategy": 5,
+        "type": 6,
+        "pillar": 7,
+        "content": 8,
+    },
+}
+
+CAMPAIGN_NAME_LAYOUT = {
+    "column": "campaign_name",
+    "delimiter": "_",
+    "segments": {
+        "objective": 0,
+        "region": 1,
+        "budget_group_1": 2,
+        "budget_group_2": 3,
+        "category_level_1": 4,
+        "personnel": 5,
+        "track_group": 7,
+        "pillar_group": 8,
+        "content_group": 9,
+    },
+}
+
+class internalFacebookAdsNamingParser:
+    """
+    Internal Facebook Ads Naming Parser
+    ---------
+    Workflow:
+        1. Declare naming convention layout as delimiter and segment position(s)
+        2. Factorize name column into distinct name(s)
+        3. Split each uncached distinct name once with pandas expand=True or Polars
+        4. Map parsed segment(s) back to row(s) by factorized code(s)
+        5. Keep at most max_names recently used name(s) in naming cache
+        6. Persist naming cache every flush_names new name(s) and at exit through per-process temp file and os.replace
+    ---------
+    Returns:
+        None
+    """
+
+# 1.1. Initialize
+    def __init__(
+        self,
+        *,
+        layout: dict,
+        cache_folder: str | None = None,
+        max_names: int = 50000,
+        flush_names: int = 5000,
+    ) -> None:
+        self.column = layout["column"]
+        self.delimiter = layout["delimiter"]
+        self.segments = dict(layout["segments"])
+        self.max_names = max(1, max_names)
+        self.flush_names = max(1, flush_names)
+        self.cache_path = Path(cache_folder or tempfile.gettempdir()) / f"facebook_ads_naming_{self.column}.json"
+        self._lock = threading.Lock()
+        self._cache: dict[str, list[str]] = self._read_cache()
+        self._pending = 0
+        atexit.register(self.flush)
+
+# 1.2. Parser
+    def parse(
+        self,
+        values: pd.Series,
+        engine: str = "pandas",
+    ) -> pd.DataFrame:
+
+        names = values.map(lambda name: name if isinstance(name, str) else "")
+        codes, uniques = pd.factorize(names)
+
+        with self._lock:
+            uncached = [name for name in uniques if name not in self._cache]
+
+            if uncached:
+                parsed = (
+                    self._split_polars(uncached)
+                    if engine == "polars"
+                    else self._split_pandas(uncached)
+                )
+                self._cache.update(zip(uncached, parsed))
+                self._pending += len(uncached)
+
+            table = np.empty((len(uniques), len(self.segments)), dtype=object)
+            if len(uniques):
+                table[:] = [self._cache[name] for name in uniques]
+
+            # Name(s) of this call are moved to the end so the least recently used name(s) are evicted first
+            self._cache.update((name, self._cache.pop(name)) for name in uniques)
+            self._evict_cache(self._cache)
+
+            # Whole cache file is rewritten once per flush_names new name(s) instead of on every new name
+            if self._pending >= self.flush_names:
+                self._write_cache()
+
+        msg = (
+            "🔍 [PLUGIN] Parsed "
+            f"{len(uniques)} distinct {self.column}(s) for "
+            f"{len(values)} row(s) with "
+            f"{len(uniques) - len(uncached)} served from naming cache."
+        )
+        print(msg)
+        logging.info(msg)
+
+        return pd.DataFrame(
+            table[codes],
+            index=values.index,
+            columns=list(self.segments),
+        )
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._pending:
+                self._write_cache()
+
+# 1.3. Workflow
+
+    # 1.3.1. Split uncached name(s) once with pandas
+    def _split_pandas(
+            self,
+            names: list[str],
+            ) -> list[list[str]]:
+
+        split = pd.Series(names, dtype=object).str.split(self.delimiter, expand=True, regex=False)
+
+        return (
+            split.reindex(columns=list(self.segments.values()))
+            .astype(object)
+            .where(lambda df: df.notna(), "unknown")
+            .to_numpy()
+            .tolist()
+        )
+
+    # 1.3.2. Split uncached name(s) once with Polars lazy engine
+    def _split_polars(
+            self,
+            names: list[str],
+            ) -> list[list[str]]:
+
+        split = (
+            pl.LazyFrame({"name": pl.Series(names, dtype=pl.String, strict=False)})
+            .select(pl.col("name").str.split(self.delimiter).alias("segments"))
+            .select(
+                [
+                    pl.col("segments").list.get(index, null_on_oob=True).fill_null("unknown").alias(col)
+                    for col, index in self.segments.items()
+                ]
+            )
+            .collect()
+        )
+
+        return [list(row) for row in split.iter_rows()]
+
+    # 1.3.3. Read persisted naming cache
+    def _read_cache(self) -> dict[str, list[str]]:
+
+        try:
+            payload = orjson.loads(self.cache_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+
+        # Cache written with another delimiter or segment layout is discarded
+        if (
+            not isinstance(payload, dict)
+            or payload.get("delimiter") != self.delimiter
+            or payload.get("segments") != self.segments
+            or not isinstance(payload.get("names"), dict)
+        ):
+            return {}
+
+        return payload["names"]
+
+    # 1.3.4. Evict least recently used name(s) above max_names
+    def _evict_cache(
+            self,
+            names: dict[str, list[str]],
+            ) -> None:
+
+        for name in list(islice(names, max(len(names) - self.max_names, 0))):
+            names.pop(name)
+
+    # 1.3.5. Persist naming cache
+    def _write_cache(self) -> None:
+
+        # Name(s) persisted by concurrent run(s) since this one read the file are kept as least recently used
+        names = {
+            name: segments
+            for name, segments in self._read_cache().items()
+            if name not in self._cache
+        }
+        names.update(self._cache)
+        self._evict_cache(names)
+
+        temp_path = None
+
+        try:
+            # Each writer owns a unique temp file then os.replace swaps the complete file in atomically
+            with tempfile.NamedTemporaryFile(
+                dir=self.cache_path.parent,
+                prefix=f"{self.cache_path.stem}.",
+                suffix=".tmp",
+                delete=False,
+            ) as temp_file:
+                temp_path = temp_file.name
+                temp_file.write(
+                    orjson.dumps(
+                        {
+                            "delimiter": self.delimiter,
+                            "segments": self.segments,
+                            "names": names,
+                        }
+                    )
+                )
+            os.replace(temp_path, self.cache_path)
+            self._pending = 0
+
+        # Naming cache is an optimization then unwritable cache folder only costs re-splitting
+        except OSError as e:
+            if temp_path:
+                Path(temp_path).unlink(missing_ok=True)
+
+            msg = (
+                "⚠️ [PLUGIN] Failed to persist naming cache to "
+                f"{self.cache_path} due to "
+                f"{e} then parsed name(s) will be kept in memory only."
+            )
+            print(msg)
+            logging.warning(msg)
+
+            # Failed write is not retried on every following parse
+            self._pending = 0
@@ -3,55 +3,89 @@ from pathlib import Path
 ROOT_FOLDER_LOCATION = Path(__file__).resolve().parents[2]
 sys.path.append(str(ROOT_FOLDER_LOCATION))
 
+import io
 import logging
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import threading
 import uuid
+from datetime import datetime, timedelta, timezone
 
 from google.api_core.exceptions import NotFound
 from google.cloud import bigquery
+from google.cloud import bigquery_storage_v1
+from google.cloud.bigquery_storage_v1 import types, writer
 
 class internalGoogleBigqueryLoader:
     """
     Internal Google BigQuery Loader
     ---------
     Workflow:
-        1. Initialize BigQuery client
-        2. Check dataset existence
+        1. Initialize BigQuery client from shared per-project client pool
+        2. Check dataset existence unless already seen in this run
         3. Create dataset if not exist
-        4. Check table existence
+        4. Check table existence unless already seen or created in this run
         5. Create table if not exist
         6. Apply INSERT/UPSERT DML
-        7. Writer data into table
+        7. Writer data into table from DataFrame or pa.Table as Parquet with cached table schema
+        8. Apply UPSERT_MERGE with one staging load and one atomic MERGE
+        9. Apply STAGE by appending chunk(s) to a Storage Write API pending stream of a staging table owned by the caller's staging dict, committed once and merged by the next UPSERT_MERGE of the same table
+        10. Apply REPLACE_PARTITION with one WRITE_TRUNCATE load per table$YYYYMMDD partition
+        11. Write appended data with batch load job or Storage Write API pending stream per load
     ---------
     Returns:
         None
     """
 
+    # Shared across loader instance(s) of the run then guarded by _lock
+    _clients: dict[str, bigquery.Client] = {}
+    _datasets: set[str] = set()
+    _tables: dict[str, list[bigquery.SchemaField]] = {}
+    _write_client: bigquery_storage_v1.BigQueryWriteClient | None = None
+    _lock = threading.Lock()
+
 # 1.1. Initialize
     def __init__(self) -> None:
         self.client: bigquery.Client | None = None
         self.project: str | None = None
+        self.backend = "load_job"
 
 # 1.2. Loader
     def load(
         self,
         *,
-        df: pd.DataFrame,
+        df: pd.DataFrame | pa.Table,
         direction: str,
         mode: str,
         keys: list[str] | None = None,
         partition: dict | None = None,
         cluster: list[str] | None = None,
+        backend: str = "load_job",
+        staging: dict[str, dict] | None = None,
     ) -> None:
 
+        if backend not in {"load_job", "storage_write"}:
+            raise ValueError(
+                "❌ [PLUGIN] Failed to load data into Google BigQuery table "
+                f"{direction} due to unsupported write backend "
+                f"{backend}."
+            )
+
+        self.backend = backend
         self._init_client(direction)
 
         project, dataset, _ = direction.split(".")
 
-        if not self._check_dataset_exist(project, dataset):
-            self._create_new_dataset(project, dataset)
+        if f"{project}.{dataset}" not in self._datasets:
+            if not self._check_dataset_exist(project, dataset):
+                self._create_new_dataset(project, dataset)
+
+            with self._lock:
+                self._datasets.add(f"{project}.{dataset}")
 
-        table_exists = self._check_table_exist(direction)
+        table_exists = direction in self._tables or self._check_table_exist(direction)
 
         if not table_exists:
             self._create_new_table(
@@ -61,6 +95,48 @@ class internalGoogleBigqueryLoader:
                 cluster=cluster,
             )
 
+        # Every partition day is overwritten by its own load job without DML
+        if mode == "replace_partition":
+            self._replace_table_partitions(
+                df=df,
+                direction=direction,
+                partition=partition,
+            )
+            return
+
+        # Chunk(s) are appended to the pending stream of direction until UPSERT_MERGE commits and merges them at once
+        if mode == "stage":
+            self._stage_table_data(
+                df=df,
+                direction=direction,
+                staging=staging,
+            )
+            return
+
+        # New table has nothing to replace then UPSERT_MERGE writes directly into direction unless chunk(s) were staged
+        if mode == "upsert_merge" and (table_exists or (staging is not None and direction in staging)):
+            self._merge_table_data(
+                df=df,
+                direction=direction,
+                keys=keys,
+                staging=staging,
+            )
+            return
+
+        if mode == "upsert_merge":
+            msg = (
+                "⚠️ [PLUGIN] Applied UPSERT_MERGE upload mode for new Google BigQuery table "
+                f"{direction} then MERGE will be skipped."
+            )
+            print(msg)
+            logging.warning(msg)
+
+            self._write_table_data(
+                df=df,
+                direction=direction,
+            )
+            return
+
         self._handle_table_conflict(
             direction=direction,
             df=df,
@@ -102,7 +178,12 @@ class internalGoogleBigqueryLoader:
 
             project, _, _ = parts
             self.project = project
-            self.client = bigquery.Client(project=project)
+
+            # One bigquery.Client per project is reused by every loader of the run
+            with self._lock:
+                if project not in self._clients:
+                    self._clients[project] = bigquery.Client(project=project)
+                self.client = self._clients[project]
             
             msg = (
                 "✅ [PLUGIN] Successfull initialized Google BigQuery client for project "
@@ -179,8 +260,24 @@ class internalGoogleBigqueryLoader:
 
     # 1.3.4. Infer DataFrame schema
     @staticmethod
-    def _infer_table_schema(df: pd.DataFrame) -> list[bigquery.SchemaField]:
+    def _infer_table_schema(df: pd.DataFrame | pa.Table) -> list[bigquery.SchemaField]:
         schema = []
+
+        if isinstance(df, pa.Table):
+            for field in df.schema:
+                if pa.types.is_integer(field.type):
+                    bq_type = "INT64"
+                elif pa.types.is_floating(field.type):
+                    bq_type = "FLOAT64"
+                elif pa.types.is_boolean(field.type):
+                    bq_type = "BOOL"
+                elif pa.types.is_timestamp(field.type):
+                    bq_type = "TIMESTAMP"
+                else:
+                    bq_type = "STRING"
+                schema.append(bigquery.SchemaField(field.name, bq_type))
+            return schema
+
         for col, dtype in df.dtypes.items():
             if pd.api.types.is_integer_dtype(dtype):
                 bq_type = "INT64"
@@ -207,7 +304,10 @@ class internalGoogleBigqueryLoader:
             logging.info(msg)            
             
             self._init_client(direction)
-            self.client.get_table(direction)
+            table = self.client.get_table(direction)
+
+            with self._lock:
+                self._tables[direction] = table.schema
             
             msg = f"✅ [PLUGIN] Successfully validated Google BigQuery table {direction} existence."
             print(msg)
@@ -227,7 +327,7 @@ class internalGoogleBigqueryLoader:
         self,
         *,
         direction: str,
-        df: pd.DataFrame,
+        df: pd.DataFrame | pa.Table,
         partition: dict | None = None,
         cluster: list[str] | None = None,
     ) -> None:
@@ -256,7 +356,11 @@ class internalGoogleBigqueryLoader:
             if cluster:
                 table.clustering_fields = cluster
 
-            self.client.create_table(table)
+            table = self.client.create_table(table)
+
+            with self._lock:
+                self._tables[direction] = table.schema
+
             msg = (
                 "✅ [PLUGIN] Successfully created Google BigQuery table "
                 f"{direction}.")
@@ -275,7 +379,7 @@ class internalGoogleBigqueryLoader:
         self,
         *,
         direction: str,
-        df: pd.DataFrame,
+        df: pd.DataFrame | pa.Table,
         mode: str,
         keys: list[str] | None,
         table_exists: bool | None = True,
@@ -314,6 +418,10 @@ class internalGoogleBigqueryLoader:
             print(msg)
             logging.info(msg)
 
+            # Only deduplication key column(s) of pa.Table are converted to DataFrame
+            if isinstance(df, pa.Table):
+                df = df.select([k for k in keys if k in df.column_names]).to_pandas()
+
             missing = [k for k in keys if k not in df.columns]
             if missing:
                 raise ValueError(f"❌ [PLUGIN] Failed to validate deduplication keys in DataFrame due to {missing} missing key(s).")
@@ -433,6 +541,11 @@ class internalGoogleBigqueryLoader:
                         f"{df[k].dtype} in direction."
                     )
 
+            # Categorical key(s) of compact schema are loaded as plain STRING into temporary table
+            df_to_delete = df_to_delete.astype(
+                {k: object for k in keys if isinstance(df_to_delete[k].dtype, pd.CategoricalDtype)}
+            )
+
             self.client.load_table_from_dataframe(
                 df_to_delete,
                 temp_table,
@@ -534,32 +647,73 @@ class internalGoogleBigqueryLoader:
     def _write_table_data(
         self,
         *,
-        df: pd.DataFrame,
+        df: pd.DataFrame | pa.Table,
         direction: str,
+        write_disposition: str = "WRITE_APPEND",
     ) -> None:
         
         try:
             msg = (
                 "🔍 [PLUGIN] Writing data into Google BigQuery table "
-                f"{direction} using default WRITE_APPEND mode..."
+                f"{direction} using {write_disposition} mode..."
             )
             print(msg)
             logging.info(msg)
 
-            job = self.client.load_table_from_dataframe(
-                df,
-                direction,
-                job_config=bigquery.LoadJobConfig(
-                    write_disposition="WRITE_APPEND"
-                ),
-            )
+            # WRITE_TRUNCATE of REPLACE_PARTITION is only available on batch load job
+            if self.backend == "storage_write" and write_disposition == "WRITE_APPEND":
+                self._write_table_stream(
+                    df=df,
+                    direction=direction,
+                )
+                return
+
+            # pa.Table is serialized to Parquet directly without pandas round trip
+            if isinstance(df, pa.Table):
+                buffer = io.BytesIO()
+                pq.write_table(
+                    df,
+                    buffer,
+                    coerce_timestamps="us",
+                    allow_truncated_timestamps=True,
+                )
+                buffer.seek(0)
+
+                job = self.client.load_table_from_file(
+                    buffer,
+                    direction,
+                    job_config=bigquery.LoadJobConfig(
+                        source_format=bigquery.SourceFormat.PARQUET,
+                        write_disposition=write_disposition,
+                    ),
+                )
+
+            # Cached table schema replaces get_table round trip inside load_table_from_dataframe then partition decorator is stripped for lookup
+            else:
+                job = self.client.load_table_from_dataframe(
+                    df,
+                    direction,
+                    job_config=bigquery.LoadJobConfig(
+                        write_disposition=write_disposition,
+                        schema=[
+                            bigquery.SchemaField(
+                                field.name,
+                                field.field_type,
+                                mode=field.mode,
+                                fields=field.fields,
+                            )
+                            for field in self._tables.get(direction.split("$")[0], [])
+                            if field.name in df.columns
+                        ] or None,
+                    ),
+                )
             job.result()
             written_rows = job.output_rows or 0
 
             msg = (
                 "✅ [PLUGIN] Successfully written "
                 f"{written_rows}/{len(df)} row(s) to Google BigQuery table "
-                f"{direction} direction with WRITE_APPEND mode."
+                f"{direction} direction with {write_disposition} mode."
             )
             print(msg)
             logging.info(msg)
@@ -569,4 +723,461 @@ class internalGoogleBigqueryLoader:
                 "❌ [PLUGIN] Failed to write data into Google BigQuery table "
                 f"{direction} due to "
                 f"{str(e)}."
-            )
\ No newline at end of file
+            )
+
+    # 1.3.9. Merge table data through staging table
+    def _merge_table_data(
+        self,
+        *,
+        df: pd.DataFrame | pa.Table,
+        direction: str,
+        keys: list[str] | None,
+        staging: dict[str, dict] | None = None,
+    ) -> None:
+
+        columns = df.column_names if isinstance(df, pa.Table) else list(df.columns)
+
+        if not keys:
+            raise ValueError(
+                "❌ [PLUGIN] Failed to apply UPSERT_MERGE conflict handling due to deduplication keys is required for Google BigQuery table "
+                f"{direction}."
+            )
+
+        missing = [k for k in keys if k not in columns]
+        if missing:
+            raise ValueError(f"❌ [PLUGIN] Failed to validate deduplication keys in DataFrame due to {missing} missing key(s).")
+
+        # Chunk(s) staged earlier by the same caller are committed together with df and merged by the same MERGE
+        staged = staging.pop(direction, None) if staging is not None else None
+        staging_table = staged["table"] if staged else None
+
+        msg = (
+            "🔄 [PLUGIN] Applying UPSERT_MERGE for Google BigQuery table "
+            f"{direction} with "
+            f"{keys} key(s) through "
+            f"{'staged' if staged else 'new'} staging table..."
+        )
+        print(msg)
+        logging.info(msg)
+
+        try:
+            if staged is None:
+                staging_table = self._create_staging_table(
+                    df=df,
+                    direction=direction,
+                )
+
+                self._write_table_data(
+                    df=df,
+                    direction=staging_table,
+                )
+
+            # Pending stream row(s) of every staged chunk become visible in the staging table with one commit
+            else:
+                self._append_table_stream(
+                    write_stream=staged["stream"],
+                    records=self._conform_arrow_table(df, staged["schema"]),
+                    offset=staged["offset"],
+                )
+                self._commit_table_stream(
+                    direction=staging_table,
+                    write_stream=staged["stream"],
+                )
+
+            # Staged column(s) are fixed by the staging schema created from the first chunk
+            columns = [field.name for field in self._tables.get(staging_table, [])] or columns
+
+            # Matching key(s) are deleted and staging row(s) inserted by one atomic DML job
+            if len(keys) == 1:
+                key_condition = f"main.{keys[0]} IN (SELECT {keys[0]} FROM `{staging_table}`)"
+            else:
+                key_condition = (
+                    f"({', '.join(f'main.{k}' for k in keys)}) IN "
+                    f"(SELECT ({', '.join(keys)}) FROM `{staging_table}`)"
+                )
+
+            insert_columns = ", ".join(f"`{col}`" for col in columns)
+            insert_values = ", ".join(f"temp.`{col}`" for col in columns)
+
+            job_merge = self.client.query(
+                f"""
+                MERGE `{direction}` AS main
+                USING `{staging_table}` AS temp
+                ON FALSE
+                WHEN NOT MATCHED BY SOURCE AND {key_condition} THEN
+                    DELETE
+                WHEN NOT MATCHED THEN
+                    INSERT ({insert_columns})
+                    VALUES ({insert_values})
+                """
+            )
+            job_merge.result()
+            merged_rows = job_merge.num_dml_affected_rows or 0
+
+            msg = (
+                "✅ [PLUGIN] Successfully merged staging table "
+                f"{staging_table} into Google BigQuery table "
+                f"{direction} with "
+                f"{merged_rows} row(s) affected by UPSERT_MERGE."
+            )
+            print(msg)
+            logging.info(msg)
+
+        except Exception as e:
+            raise RuntimeError(
+                "❌ [PLUGIN] Failed to apply UPSERT_MERGE for Google BigQuery table "
+                f"{direction} due to "
+                f"{str(e)}."
+            )
+
+        finally:
+            if staging_table is not None:
+                self.client.delete_table(staging_table, not_found_ok=True)
+
+                with self._lock:
+                    self._tables.pop(staging_table, None)
+
+    # 1.3.10. Create staging table
+    def _create_staging_table(
+        self,
+        *,
+        df: pd.DataFrame | pa.Table,
+        direction: str,
+        expires: timedelta = timedelta(hours=1),
+    ) -> str:
+
+        columns = df.column_names if isinstance(df, pa.Table) else list(df.columns)
+
+        project, dataset, table = direction.split(".")
+        staging_table = (
+            f"{project}.{dataset}._tmp_merge_{table}_"
+            f"{uuid.uuid4().hex[:8]}"
+        )
+
+        # Staging table is created with direction schema and expires on its own if cleanup is interrupted
+        staging_schema = [
+            field for field in self._tables.get(direction, [])
+            if field.name in columns
+        ] or self._infer_table_schema(df)
+
+        staging_config = bigquery.Table(staging_table, schema=staging_schema)
+        staging_config.expires = datetime.now(timezone.utc) + expires
+        self.client.create_table(staging_config)
+
+        with self._lock:
+            self._tables[staging_table] = staging_schema
+
+        return staging_table
+
+    # 1.3.11. Append chunk to pending stream of caller-owned staging table
+    def _stage_table_data(
+        self,
+        *,
+        df: pd.DataFrame | pa.Table,
+        direction: str,
+        staging: dict[str, dict] | None,
+    ) -> None:
+
+        if staging is None:
+            raise ValueError(
+                "❌ [PLUGIN] Failed to apply STAGE conflict handling due to staging dict is required for Google BigQuery table "
+                f"{direction}."
+            )
+
+        try:
+            staged = staging.get(direction)
+
+            # Staging table outlives a long backfill month then still expires if the closing MERGE never runs
+            if staged is None:
+                records = self._normalize_arrow_table(
+                    df if isinstance(df, pa.Table) else pa.Table.from_pandas(df, preserve_index=False)
+                )
+                staging_table = self._create_staging_table(
+                    df=df,
+                    direction=direction,
+                    expires=timedelta(days=1),
+                )
+                staged = staging[direction] = {
+                    "table": staging_table,
+                    "stream": self._open_table_stream(staging_table),
+                    "schema": pa.schema(
+                        pa.field(field.name, pa.string()) if pa.types.is_null(field.type) else field
+                        for field in records.schema
+                    ),
+                    "offset": 0,
+                }
+
+            msg = (
+                "🔄 [PLUGIN] Applying STAGE for Google BigQuery table "
+                f"{direction} with "
+                f"{len(df)} row(s) through pending stream of staging table "
+                f"{staged['table']}..."
+            )
+            print(msg)
+            logging.info(msg)
+
+            # Uncommitted row(s) stay invisible so no load job is spent until UPSERT_MERGE commits the stream
+            staged["offset"] += self._append_table_stream(
+                write_stream=staged["stream"],
+                records=self._conform_arrow_table(df, staged["schema"]),
+                offset=staged["offset"],
+            )
+
+        # Failed stage never leaves a staging table behind for a later UPSERT_MERGE of direction
+        except Exception as e:
+            staged = staging.pop(direction, None)
+            if staged is not None:
+                self.client.delete_table(staged["table"], not_found_ok=True)
+
+                with self._lock:
+                    self._tables.pop(staged["table"], None)
+
+            raise RuntimeError(
+                "❌ [PLUGIN] Failed to apply STAGE for Google BigQuery table "
+                f"{direction} due to "
+                f"{str(e)}."
+            )
+
+    # 1.3.12. Replace table partition(s)
+    def _replace_table_partitions(
+        self,
+        *,
+        df: pd.DataFrame | pa.Table,
+        direction: str,
+        partition: dict | None,
+    ) -> None:
+
+        if not partition:
+            raise ValueError(
+                "❌ [PLUGIN] Failed to apply REPLACE_PARTITION conflict handling due to partition field is required for Google BigQuery table "
+                f"{direction}."
+            )
+
+        field = partition["field"]
+
+        # NULL partition field is addressed by __NULL__ partition decorator
+        if isinstance(df, pa.Table):
+            partition_keys = pc.fill_null(
+                pc.strftime(df[field], format="%Y%m%d"),
+                "__NULL__",
+            )
+            partition_groups = [
+                (partition_key, df.filter(pc.equal(partition_keys, partition_key)))
+                for partition_key in sorted(pc.unique(partition_keys).to_pylist())
+            ]
+        else:
+            partition_keys = pd.to_datetime(df[field], utc=True).dt.strftime("%Y%m%d").fillna("__NULL__")
+            partition_groups = [
+                (partition_key, partition_df.reset_index(drop=True))
+                for partition_key, partition_df in df.groupby(partition_keys, sort=True)
+            ]
+
+        msg = (
+            "🔄 [PLUGIN] Applying REPLACE_PARTITION for Google BigQuery table "
+            f"{direction} with "
+            f"{len(partition_groups)} partition(s) on "
+            f"{field} field..."
+        )
+        print(msg)
+        logging.info(msg)
+
+        for partition_key, partition_df in partition_groups:
+            self._write_table_data(
+                df=partition_df,
+                direction=f"{direction}${partition_key}",
+                write_disposition="WRITE_TRUNCATE",
+            )
+
+        msg = (
+            "✅ [PLUGIN] Successfully replaced "
+            f"{len(partition_groups)} partition(s) of Google BigQuery table "
+            f"{direction} with "
+            f"{len(df)} row(s)."
+        )
+        print(msg)
+        logging.info(msg)
+
+    # 1.3.13. Write table data through Storage Write API
+    def _write_table_stream(
+        self,
+        *,
+        df: pd.DataFrame | pa.Table,
+        direction: str,
+    ) -> None:
+
+        records = self._normalize_arrow_table(
+            df if isinstance(df, pa.Table) else pa.Table.from_pandas(df, preserve_index=False)
+        )
+
+        msg = (
+            "🔍 [PLUGIN] Writing "
+            f"{records.num_rows} row(s) into Google BigQuery table "
+            f"{direction} through Storage Write API pending stream..."
+        )
+        print(msg)
+        logging.info(msg)
+
+        write_stream = self._open_table_stream(direction)
+
+        self._append_table_stream(
+            write_stream=write_stream,
+            records=records,
+            offset=0,
+        )
+        self._commit_table_stream(
+            direction=direction,
+            write_stream=write_stream,
+        )
+
+        msg = (
+            "✅ [PLUGIN] Successfully written "
+            f"{records.num_rows}/{len(df)} row(s) to Google BigQuery table "
+            f"{direction} direction with Storage Write API pending stream."
+        )
+        print(msg)
+        logging.info(msg)
+
+    # 1.3.14. Initialize shared Storage Write API client
+    def _get_write_client(self) -> bigquery_storage_v1.BigQueryWriteClient:
+
+        with self._lock:
+            if internalGoogleBigqueryLoader._write_client is None:
+                internalGoogleBigqueryLoader._write_client = bigquery_storage_v1.BigQueryWriteClient()
+            return internalGoogleBigqueryLoader._write_client
+
+    # 1.3.15. Open Storage Write API pending stream
+    def _open_table_stream(
+        self,
+        direction: str,
+    ) -> str:
+
+        project, dataset, table = direction.split(".")
+        write_client = self._get_write_client()
+
+        write_stream = types.WriteStream()
+        write_stream.type_ = types.WriteStream.Type.PENDING
+        write_stream = write_client.create_write_stream(
+            parent=write_client.table_path(project, dataset, table),
+            write_stream=write_stream,
+        )
+
+        return write_stream.name
+
+    # 1.3.16. Append record batch(es) to pending stream at offset
+    def _append_table_stream(
+        self,
+        *,
+        write_stream: str,
+        records: pa.Table,
+        offset: int,
+    ) -> int:
+
+        write_client = self._get_write_client()
+
+        # AppendRows request is capped at 10 MB then record batch(es) are sized to about 8 MB
+        max_rows = max(1, int(records.num_rows * 8 * 1024 * 1024 / max(records.nbytes, 1)))
+        batches = records.to_batches(max_chunksize=max_rows)
+
+        request_template = types.AppendRowsRequest()
+        request_template.write_stream = write_stream
+        arrow_template = types.AppendRowsRequest.ArrowData()
+        arrow_template.writer_schema.serialized_schema = records.schema.serialize().to_pybytes()
+        request_template.arrow_rows = arrow_template
+
+        # Connection is opened per append so a pending stream can stay open across a long backfill month
+        append_rows_stream = writer.AppendRowsStream(write_client, request_template)
+
+        try:
+            futures = []
+
+            for batch in batches:
+                request = types.AppendRowsRequest()
+                request.offset = offset
+                arrow_data = types.AppendRowsRequest.ArrowData()
+                arrow_data.rows.serialized_record_batch = batch.serialize().to_pybytes()
+                request.arrow_rows = arrow_data
+
+                futures.append(append_rows_stream.send(request))
+                offset += batch.num_rows
+
+            for future in futures:
+                future.result()
+
+        finally:
+            append_rows_stream.close()
+
+        return records.num_rows
+
+    # 1.3.17. Finalize and commit pending stream
+    def _commit_table_stream(
+        self,
+        *,
+        direction: str,
+        write_stream: str,
+    ) -> None:
+
+        project, dataset, table = direction.split(".")
+        write_client = self._get_write_client()
+
+        # Pending stream row(s) become visible only once the stream is committed
+        write_client.finalize_write_stream(name=write_stream)
+
+        commit_response = write_client.batch_commit_write_streams(
+            types.BatchCommitWriteStreamsRequest(
+                parent=write_client.table_path(project, dataset, table),
+                write_streams=[write_stream],
+            )
+        )
+
+        if commit_response.stream_errors:
+            raise RuntimeError(
+                "❌ [PLUGIN] Failed to commit Storage Write API pending stream into Google BigQuery table "
+                f"{direction} due to "
+                f"{[error.error_message for error in commit_response.stream_errors]}."
+            )
+
+    # 1.3.18. Normalize pa.Table to Storage Write API Arrow type(s)
+    @staticmethod
+    def _normalize_arrow_table(records: pa.Table) -> pa.Table:
+
+        fields = []
+
+        for field in records.schema:
+            field_type = field.type.value_type if pa.types.is_dictionary(field.type) else field.type
+
+            if pa.types.is_integer(field_type):
+                field_type = pa.int64()
+            elif pa.types.is_floating(field_type):
+                field_type = pa.float64()
+            elif pa.types.is_timestamp(field_type):
+                field_type = pa.timestamp("us", tz=field_type.tz or "UTC")
+            elif pa.types.is_large_string(field_type) or pa.types.is_string_view(field_type):
+                field_type = pa.string()
+
+            fields.append(pa.field(field.name, field_type))
+
+        # Nanosecond timestamp(s) are truncated to BigQuery microsecond precision
+        return records.cast(pa.schema(fields), safe=False)
+
+    # 1.3.19. Conform chunk to pending stream writer schema
+    @classmethod
+    def _conform_arrow_table(
+            cls,
+            df: pd.DataFrame | pa.Table,
+            schema: pa.Schema,
+            ) -> pa.Table:
+
+        records = cls._normalize_arrow_table(
+            df if isinstance(df, pa.Table) else pa.Table.from_pandas(df, preserve_index=False)
+        )
+
+        # Every append of one stream must carry the writer schema of its first chunk
+        return pa.Table.from_arrays(
+            [
+                records[field.name].cast(field.type)
+                if field.name in records.column_names
+                else pa.nulls(records.num_rows, field.type)
+                for field in schema
+            ],
+            schema=schema,
+        )
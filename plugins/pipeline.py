@@ -0,0 +1,162 @@
+import sys
+from pathlib import Path
+ROOT_FOLDER_LOCATION = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT_FOLDER_LOCATION))
+
+import logging
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator
+
+_END = object()
+
+class internalPipelineExecutor:
+    """
+    Internal Pipeline Executor
+    ---------
+    Workflow:
+        1. Run every stage as a producer / consumer worker thread
+        2. Connect consecutive stages with bounded queue.Queue
+        3. Feed source item(s) into the first stage from the calling thread
+        4. Stop every stage as soon as one stage raises
+        5. Re-raise the first stage error in the calling thread
+    ---------
+    Returns:
+        None
+    """
+
+# 1.1. Initialize
+    def __init__(
+        self,
+        *,
+        stages: list[tuple[str, Callable[[Iterator], Iterable | None]]],
+        queue_size: int = 2,
+    ) -> None:
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+
+# 1.2. Runner
+    def run(
+        self,
+        source: Iterable,
+    ) -> None:
+
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        stop = threading.Event()
+        errors: list[tuple[str, BaseException]] = []
+
+        msg = (
+            "🔄 [PLUGIN] Starting pipeline with "
+            f"{[name for name, _ in self.stages]} stage(s) and queue size "
+            f"{self.queue_size}..."
+        )
+        print(msg)
+        logging.info(msg)
+
+        workers = [
+            threading.Thread(
+                target=self._run_stage,
+                args=(index, queues, stop, errors),
+                name=f"pipeline-{name}",
+                daemon=True,
+            )
+            for index, (name, _) in enumerate(self.stages)
+        ]
+
+        for worker in workers:
+            worker.start()
+
+        try:
+            for item in source:
+                if not self._put(queues[0], item, stop):
+                    break
+        finally:
+            self._put(queues[0], _END, stop)
+
+            for worker in workers:
+                worker.join()
+
+        if errors:
+            name, error = errors[0]
+
+            msg = (
+                "❌ [PLUGIN] Failed to run pipeline due to "
+                f"{name} stage error "
+                f"{error}."
+            )
+            print(msg)
+            logging.error(msg)
+
+            raise error
+
+        msg = "✅ [PLUGIN] Successfully completed pipeline."
+        print(msg)
+        logging.info(msg)
+
+# 1.3. Workflow
+
+    # 1.3.1. Run single stage worker
+    def _run_stage(
+            self,
+            index: int,
+            queues: list[queue.Queue],
+            stop: threading.Event,
+            errors: list[tuple[str, BaseException]],
+            ) -> None:
+
+        name, stage = self.stages[index]
+        is_last = index == len(self.stages) - 1
+
+        try:
+            # Consumer-only stage returns None instead of output item(s)
+            for output in stage(self._consume(queues[index], stop)) or ():
+                if is_last:
+                    continue
+                if not self._put(queues[index + 1], output, stop):
+                    return
+
+        # First error stops every stage then is re-raised by run
+        except BaseException as e:
+            errors.append((name, e))
+            stop.set()
+
+        finally:
+            if not is_last:
+                self._put(queues[index + 1], _END, stop)
+
+    # 1.3.2. Consume stage input until end marker or stop
+    @staticmethod
+    def _consume(
+            source: queue.Queue,
+            stop: threading.Event,
+            ) -> Iterator:
+
+        while True:
+            try:
+                item = source.get(timeout=0.1)
+            except queue.Empty:
+                if stop.is_set():
+                    return
+                continue
+
+            if item is _END or stop.is_set():
+                return
+
+            yield item
+
+    # 1.3.3. Put item into bounded queue unless pipeline is stopped
+    @staticmethod
+    def _put(
+            target: queue.Queue,
+            item: object,
+            stop: threading.Event,
+            ) -> bool:
+
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+
+        return False
@@ -0,0 +1,258 @@
+import sys
+from pathlib import Path
+ROOT_FOLDER_LOCATION = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT_FOLDER_LOCATION))
+
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+class internalTaskGraph:
+    """
+    Internal Task Graph
+    ---------
+    Workflow:
+        1. Register task(s) with input task(s), attempt limit and resource class
+        2. Validate unknown input(s) and dependency cycle(s) before running
+        3. Submit every task whose input(s) are done to bounded worker(s)
+        4. Cap running task(s) per resource class
+        5. Retry retryable task error(s) up to the task attempt limit
+        6. Skip dependent task(s) of a task returning None
+        7. Stop submitting and re-raise the first task error
+    ---------
+    Returns:
+        dict[str, object]: task output(s) by task name
+    """
+
+# 1.1. Initialize
+    def __init__(
+        self,
+        *,
+        max_workers: int = 4,
+        resources: dict[str, int] | None = None,
+        backoff: Callable[[int, str], None] | None = None,
+    ) -> None:
+        self.max_workers = max(1, max_workers)
+        self.resources = resources or {}
+        self.backoff = backoff
+        self.tasks: dict[str, dict] = {}
+
+# 1.2. Register task
+    def task(
+        self,
+        name: str,
+        func: Callable[..., object],
+        *,
+        inputs: list[str] | tuple[str, ...] = (),
+        attempts: int = 1,
+        resource: str | None = None,
+    ) -> "internalTaskGraph":
+
+        if name in self.tasks:
+            raise ValueError(
+                "❌ [PLUGIN] Failed to register task "
+                f"{name} due to duplicated task name."
+            )
+
+        self.tasks[name] = {
+            "name": name,
+            "func": func,
+            "inputs": tuple(inputs),
+            "attempts": max(1, attempts),
+            "resource": resource,
+        }
+
+        return self
+
+# 1.3. Runner
+    def run(self) -> dict[str, object]:
+
+        self._validate_graph()
+
+        outputs: dict[str, object] = {}
+        skipped: set[str] = set()
+        pending = dict(self.tasks)
+        running: dict[Future, dict] = {}
+        resource_usage: dict[str, int] = {}
+        error: tuple[str, BaseException] | None = None
+
+        msg = (
+            "🔄 [PLUGIN] Starting task graph with "
+            f"{len(self.tasks)} task(s) on "
+            f"{self.max_workers} worker(s)..."
+        )
+        print(msg)
+        logging.info(msg)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+
+                # First error stops submitting while running task(s) are drained
+                if error is None:
+                    for task in list(pending.values()):
+                        if not all(i in outputs or i in skipped for i in task["inputs"]):
+                            continue
+
+                        if any(i in skipped for i in task["inputs"]):
+                            pending.pop(task["name"])
+                            skipped.add(task["name"])
+
+                            msg = (
+                                "⚠️ [PLUGIN] Skipped task "
+                                f"{task["name"]} because input task(s) "
+                                f"{sorted(i for i in task["inputs"] if i in skipped)} returned no output."
+                            )
+                            print(msg)
+                            logging.warning(msg)
+                            continue
+
+                        if len(running) >= self.max_workers or not self._acquire(task, resource_usage):
+                            continue
+
+                        pending.pop(task["name"])
+                        future = executor.submit(
+                            self._run_task,
+                            task,
+                            {i: outputs[i] for i in task["inputs"]},
+                        )
+                        running[future] = task
+
+                if not running:
+                    # Remaining task(s) only wait on skipped task(s) resolved in the next pass
+                    if error is None and pending:
+                        continue
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    task = running.pop(future)
+
+                    if task["resource"] is not None:
+                        resource_usage[task["resource"]] -= 1
+
+                    try:
+                        output = future.result()
+                    except Exception as e:
+                        if error is None:
+                            error = (task["name"], e)
+                        continue
+
+                    if output is None:
+                        skipped.add(task["name"])
+                    else:
+                        outputs[task["name"]] = output
+
+        if error is not None:
+            name, e = error
+            raise RuntimeError(
+                "❌ [PLUGIN] Failed to run task graph due to task "
+                f"{name} error "
+                f"{e}."
+            ) from e
+
+        msg = (
+            "✅ [PLUGIN] Successfully completed task graph with "
+            f"{len(outputs)} task output(s) and "
+            f"{len(skipped)} skipped task(s)."
+        )
+        print(msg)
+        logging.info(msg)
+
+        return outputs
+
+# 1.4. Workflow
+
+    # 1.4.1. Validate task input(s) and dependency cycle(s)
+    def _validate_graph(self) -> None:
+
+        for task in self.tasks.values():
+            unknown_inputs = [i for i in task["inputs"] if i not in self.tasks]
+            if unknown_inputs:
+                raise ValueError(
+                    "❌ [PLUGIN] Failed to validate task "
+                    f"{task["name"]} due to unknown input task(s) "
+                    f"{unknown_inputs}."
+                )
+
+        resolved: set[str] = set()
+        remaining = dict(self.tasks)
+
+        while remaining:
+            ready = [name for name, task in remaining.items() if set(task["inputs"]) <= resolved]
+            if not ready:
+                raise ValueError(
+                    "❌ [PLUGIN] Failed to validate task graph due to dependency cycle between task(s) "
+                    f"{sorted(remaining)}."
+                )
+            for name in ready:
+                resolved.add(name)
+                remaining.pop(name)
+
+    # 1.4.2. Reserve resource class slot for task
+    def _acquire(
+            self,
+            task: dict,
+            resource_usage: dict[str, int],
+            ) -> bool:
+
+        if task["resource"] is None:
+            return True
+
+        limit = self.resources.get(task["resource"], self.max_workers)
+        if resource_usage.get(task["resource"], 0) >= limit:
+            return False
+
+        resource_usage[task["resource"]] = resource_usage.get(task["resource"], 0) + 1
+        return True
+
+    # 1.4.3. Run single task with retry policy
+    def _run_task(
+            self,
+            task: dict,
+            inputs: dict[str, object],
+            ) -> object:
+
+        for attempt in range(1, task["attempts"] + 1):
+            start_time = time.time()
+
+            msg = (
+                "🔄 [PLUGIN] Running task "
+                f"{task["name"]} in "
+                f"{attempt}/{task["attempts"]} attempt(s)..."
+            )
+            print(msg)
+            logging.info(msg)
+
+            try:
+                output = task["func"](**inputs)
+
+            except Exception as e:
+                retryable = getattr(e, "retryable", False)
+
+                if not retryable or attempt == task["attempts"]:
+                    raise
+
+                msg = (
+                    "⚠️ [PLUGIN] Failed to run task "
+                    f"{task["name"]} in "
+                    f"{attempt}/{task["attempts"]} attempt(s) due to "
+                    f"{e} then task will be retried."
+                )
+                print(msg)
+                logging.warning(msg)
+
+                if self.backoff is not None:
+                    self.backoff(attempt, f"retrying task {task["name"]} {attempt}/{task["attempts"]} attempt(s)")
+                continue
+
+            msg = (
+                "✅ [PLUGIN] Successfully completed task "
+                f"{task["name"]} in "
+                f"{time.time() - start_time:.2f}s."
+            )
+            print(msg)
+            logging.info(msg)
+
+            return output
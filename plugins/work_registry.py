@@ -0,0 +1,162 @@
+import sys
+from pathlib import Path
+ROOT_FOLDER_LOCATION = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT_FOLDER_LOCATION))
+
+import logging
+import threading
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import Future
+
+class internalWorkRegistry:
+    """
+    Internal Work Registry
+    ---------
+    Workflow:
+        1. Identify unit of work by hashable key (entity, target table or selection)
+        2. Run the first caller of a key and register its result
+        3. Block concurrent caller(s) of the same key until the first caller finishes
+        4. Share the registered result with every later caller of the key
+        5. Claim id(s) per key so overlapping ID set(s) only run their unclaimed id(s)
+        6. Serialize work on the same target with one lock per key
+        7. Drop failed unit or failed id(s) so a later caller can run them again
+    ---------
+    Returns:
+        None
+    """
+
+# 1.1. Initialize
+    def __init__(self) -> None:
+        self._units: dict[Hashable, Future] = {}
+        self._claims: dict[Hashable, dict[Hashable, Future]] = {}
+        self._locks: dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+# 1.2. Runner
+    def run(
+        self,
+        key: Hashable,
+        func: Callable[[], object],
+    ) -> object:
+
+        with self._lock:
+            unit = self._units.get(key)
+            is_owner = unit is None
+
+            if is_owner:
+                unit = Future()
+                self._units[key] = unit
+
+        if not is_owner:
+            msg = (
+                "🔁 [PLUGIN] Reusing registered unit of work "
+                f"{self._describe(key)} from another caller of this run..."
+            )
+            print(msg)
+            logging.info(msg)
+
+            return unit.result()
+
+        try:
+            result = func()
+
+        # Waiting caller(s) receive the same error while the next caller runs the unit again
+        except BaseException as e:
+            with self._lock:
+                self._units.pop(key, None)
+            unit.set_exception(e)
+            raise
+
+        unit.set_result(result)
+
+        return result
+
+# 1.3. Claim runner
+    def run_many(
+        self,
+        key: Hashable,
+        ids: Iterable[Hashable],
+        func: Callable[[list], object],
+        failed: Callable[[object], Iterable[Hashable]] | None = None,
+    ) -> list[object]:
+
+        ids = list(dict.fromkeys(ids))
+
+        with self._lock:
+            claims = self._claims.setdefault(key, {})
+            new_ids = [i for i in ids if i not in claims]
+            units = list(dict.fromkeys(claims[i] for i in ids if i in claims))
+
+            if new_ids:
+                unit = Future()
+                for i in new_ids:
+                    claims[i] = unit
+
+        if units:
+            msg = (
+                "🔁 [PLUGIN] Reusing "
+                f"{len(ids) - len(new_ids)}/{len(ids)} id(s) of registered unit(s) of work "
+                f"{self._describe(key)} from another caller of this run..."
+            )
+            print(msg)
+            logging.info(msg)
+
+        results = []
+
+        if new_ids:
+            try:
+                result = func(new_ids)
+
+            # Waiting caller(s) receive the same error while the next caller claims the id(s) again
+            except BaseException as e:
+                self._release(key, new_ids, unit)
+                unit.set_exception(e)
+                raise
+
+            # Failed id(s) are released before waiting caller(s) wake up so their retry claims them again
+            if failed is not None:
+                self._release(key, failed(result), unit)
+
+            unit.set_result(result)
+            results.append(result)
+
+        results.extend(unit.result() for unit in units)
+
+        return results
+
+# 1.4. Lock per key
+    def lock(
+        self,
+        key: Hashable,
+    ) -> threading.Lock:
+
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+# 1.5. Workflow
+
+    # 1.5.1. Describe unit key without dumping full ID set(s)
+    @staticmethod
+    def _describe(key: Hashable) -> str:
+
+        if not isinstance(key, tuple):
+            return str(key)
+
+        return str(tuple(
+            f"{len(part)} id(s)" if isinstance(part, frozenset) else part
+            for part in key
+        ))
+
+    # 1.5.2. Release claimed id(s) still held by unit
+    def _release(
+            self,
+            key: Hashable,
+            ids: Iterable[Hashable],
+            unit: Future,
+            ) -> None:
+
+        with self._lock:
+            claims = self._claims.get(key, {})
+            for i in ids:
+                if claims.get(i) is unit:
+                    claims.pop(i)
@@ -0,0 +1,82 @@
+import sys
+from pathlib import Path
+ROOT_FOLDER_LOCATION = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT_FOLDER_LOCATION))
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import etl.transform_ad_insights as transform_ad
+import etl.transform_campaign_insights as transform_campaign
+
+_COMPARED_COLUMNS = [
+    "result",
+    "result_type",
+    "messaging_conversations_started",
+    "purchase",
+]
+
+def _sample_rows(
+    mapping: dict[str, str],
+    entity_ids: dict[str, str],
+) -> list[dict]:
+
+    rows = []
+
+    for goal in [*mapping, "UNMAPPED_GOAL", None]:
+        for actions in [
+            [
+                {"action_type": "lead", "value": "2"},
+                {"action_type": mapping.get(goal, "unmapped"), "value": "7"},
+                {"action_type": "onsite_conversion.messaging_conversation_started_7d", "value": "4"},
+                {"action_type": "purchase", "value": "3"},
+            ],
+            [
+                {"action_type": "lead", "value": "2"},
+                {"action_type": "onsite_conversion.lead_grouped", "value": "5"},
+            ],
+            [],
+        ]:
+            rows.append(
+                {
+                    "account_id": "1",
+                    **entity_ids,
+                    "optimization_goal": goal,
+                    "impressions": "11",
+                    "clicks": "1",
+                    "spend": "1.5",
+                    "actions": actions,
+                    "date_start": "2024-01-01",
+                    "date_stop": "2024-01-01",
+                }
+            )
+
+    return rows
+
+@pytest.mark.parametrize(
+    "module, transform, entity_ids",
+    [
+        (transform_ad, transform_ad.transform_ad_insights, {"campaign_id": "2", "adset_id": "3", "ad_id": "4"}),
+        (transform_campaign, transform_campaign.transform_campaign_insights, {"campaign_id": "2"}),
+    ],
+)
+@pytest.mark.parametrize("engine", ["polars", "arrow"])
+def test_engine_matches_pandas(module, transform, entity_ids, engine):
+    rows = _sample_rows(module._MAPPING_GOAL_ACTION, entity_ids)
+
+    expected = transform(pd.DataFrame(rows))
+    actual = (
+        transform(pa.Table.from_pylist(rows)).to_pandas()
+        if engine == "arrow"
+        else transform(pd.DataFrame(rows), engine=engine)
+    )
+
+    for col in _COMPARED_COLUMNS:
+        compare = str if col == "result_type" else float
+        mismatches = [
+            (rows[i]["optimization_goal"], e, a)
+            for i, (e, a) in enumerate(zip(expected[col].tolist(), actual[col].tolist()))
+            if compare(e) != compare(a)
+        ]
+        assert not mismatches, f"{engine} engine {col} mismatch(es) {mismatches}"